@@ -489,10 +489,14 @@ def build_bnpl_router(service: BnplFeatureService) -> APIRouter:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc))
 
     @router.get("/merchant/{merchant_id}/dashboard", summary="Merchant dashboard")
-    def merchant_dashboard(merchant_id: str) -> Dict[str, Any]:
+    def merchant_dashboard(
+        merchant_id: str,
+        include_details: bool = Query(default=False),
+        limit: int = Query(default=100, ge=1, le=500),
+    ) -> Dict[str, Any]:
         """Return merchant orders and loan status."""
         try:
-            return service.merchant_dashboard(merchant_id=merchant_id)
+            return service.merchant_dashboard(merchant_id=merchant_id, include_details=include_details, limit=limit)
         except Exception as exc:
             logger.exception("Merchant dashboard endpoint failed.")
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc))
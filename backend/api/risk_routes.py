@@ -19,6 +19,7 @@ from pydantic import BaseModel, Field
 logger = logging.getLogger(__name__)
 
 _predictor: Any = None
+_batch_predictor: Any = None
 
 
 def _classify_risk_tier(liquidation_probability: float) -> str:
@@ -57,6 +58,31 @@ def _get_predictor() -> Any:
         return None
 
 
+def _get_batch_predictor() -> Any:
+    """Return the singleton micro-batching wrapper around ``LiquidationPredictor``."""
+    global _batch_predictor
+    if _batch_predictor is not None:
+        return _batch_predictor
+
+    predictor = _get_predictor()
+    if predictor is None:
+        return None
+
+    from ml.predictor import LiquidationBatchPredictor
+
+    _batch_predictor = LiquidationBatchPredictor(predictor)
+    return _batch_predictor
+
+
+async def close_batch_predictor() -> None:
+    """Stop the micro-batching worker, if one was started, on application shutdown."""
+    global _batch_predictor
+    batch_predictor = _batch_predictor
+    _batch_predictor = None
+    if batch_predictor is not None:
+        await batch_predictor.close()
+
+
 # ---------------------------------------------------------------------------
 # Request / Response schemas
 # ---------------------------------------------------------------------------
@@ -184,7 +210,7 @@ def build_risk_router() -> APIRouter:
         summary="Predict liquidation probability (v2 stochastic estimator)",
         response_model=RiskPredictResponse,
     )
-    def predict_risk(payload: RiskPredictRequest) -> RiskPredictResponse:
+    async def predict_risk(payload: RiskPredictRequest) -> RiskPredictResponse:
         collateral_bnb = payload.collateral_bnb
         debt_fiat = payload.debt_fiat
         current_price = payload.current_price
@@ -203,10 +229,10 @@ def build_risk_router() -> APIRouter:
         metrics = _compute_position_metrics(collateral_bnb, debt_fiat, current_price, volatility)
 
         # Model prediction — uses only raw observables
-        predictor = _get_predictor()
-        if predictor is not None:
+        batch_predictor = _get_batch_predictor()
+        if batch_predictor is not None:
             try:
-                result = predictor.predict(
+                result = await batch_predictor.submit(
                     collateral_bnb=collateral_bnb,
                     debt_fiat=debt_fiat,
                     current_price=current_price,
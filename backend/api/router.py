@@ -631,10 +631,10 @@ def build_router(settings: AppSettings) -> APIRouter:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc))
 
     @router.post("/ml/runtime/reload", summary="Reload ML model artifacts")
-    def ml_runtime_reload(payload: MlReloadModelsRequest) -> dict:
+    async def ml_runtime_reload(payload: MlReloadModelsRequest) -> dict:
         """Reload one or more ML artifacts in runtime inference services."""
         try:
-            return ml_management_service.reload_models(payload)
+            return await ml_management_service.reload_models_async(payload)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
         except Exception as exc:
@@ -914,6 +914,7 @@ def build_router(settings: AppSettings) -> APIRouter:
         except HTTPException:
             raise
         except ValidationError as exc:
+            logger.warning("Create user validation failed user_id=%s error=%s", payload.user_id, exc)
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
         except Exception as exc:
             logger.exception("Create user endpoint failed user_id=%s", payload.user_id)
@@ -997,12 +998,13 @@ def build_router(settings: AppSettings) -> APIRouter:
     def get_user(user_id: str) -> UserModel:
         """Fetch one user document by id from Firestore."""
         try:
-            return _require_user_repository(user_repository).get_by_id(user_id)
+            return _require_user_repository(user_repository).get_by_id_readonly(user_id)
         except HTTPException:
             raise
         except ModelNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
         except ValidationError as exc:
+            logger.warning("Stored user payload failed validation user_id=%s error=%s", user_id, exc)
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
         except Exception as exc:
             logger.exception("Get user endpoint failed user_id=%s", user_id)
@@ -1016,7 +1018,7 @@ def build_router(settings: AppSettings) -> APIRouter:
     def get_user_wallets(user_id: str) -> UserWalletDetailsResponse:
         """Fetch only wallet details for a user by id."""
         try:
-            user = _require_user_repository(user_repository).get_by_id(user_id)
+            user = _require_user_repository(user_repository).get_by_id_readonly(user_id)
             wallets = list(user.wallet_address or [])
             return UserWalletDetailsResponse(
                 user_id=user.user_id,
@@ -1028,6 +1030,7 @@ def build_router(settings: AppSettings) -> APIRouter:
         except ModelNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
         except ValidationError as exc:
+            logger.warning("Stored user payload failed validation user_id=%s error=%s", user_id, exc)
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
         except Exception as exc:
             logger.exception("Get user wallets endpoint failed user_id=%s", user_id)
@@ -1046,6 +1049,7 @@ def build_router(settings: AppSettings) -> APIRouter:
         except VersionConflictError as exc:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
         except ValidationError as exc:
+            logger.warning("Update user validation failed user_id=%s error=%s", user_id, exc)
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
         except Exception as exc:
             logger.exception("Update user endpoint failed user_id=%s", user_id)
@@ -65,14 +65,12 @@ class EmiPlanModel(BaseModel):
     @validator("currency_scope", pre=True, always=True)
     def _normalize_currency_scope(cls, value: Any) -> List[str]:
         """Normalize currency scope to uppercase unique codes."""
-        try:
-            currencies = [str(item).strip().upper() for item in (value or []) if str(item).strip()]
-            if not currencies:
-                return ["INR"]
-            return sorted(set(currencies))
-        except Exception:
-            logger.exception("Failed normalizing currency scope value=%s", value)
+        if value is not None and not isinstance(value, (list, tuple, set, frozenset)):
+            logger.warning("Unsupported currency scope value=%s; defaulting to INR", value)
             return ["INR"]
+        currencies = {str(item).strip().upper() for item in (value or ())}
+        currencies.discard("")
+        return sorted(currencies) if currencies else ["INR"]
 
     @validator("target_ltv_by_risk_tier", pre=True, always=True)
     def _normalize_target_ltv_by_risk_tier(cls, value: Any) -> Dict[str, float]:
@@ -89,26 +87,22 @@ class EmiPlanModel(BaseModel):
             if not normalized:
                 normalized = {"LOW": 0.70, "MEDIUM": 0.50, "HIGH": 0.35}
             return normalized
-        except Exception:
+        except (TypeError, ValueError):
             logger.exception("Failed normalizing target LTV mapping value=%s", value)
             return {"LOW": 0.70, "MEDIUM": 0.50, "HIGH": 0.35}
 
     @root_validator(skip_on_failure=True)
     def _validate_plan_thresholds(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """Validate threshold and principal range relationships."""
-        try:
-            danger_limit_bps = int(values.get("danger_limit_bps", 0))
-            liquidation_threshold_bps = int(values.get("liquidation_threshold_bps", 0))
-            principal_min_minor = int(values.get("principal_min_minor", 0))
-            principal_max_minor = int(values.get("principal_max_minor", 0))
-            if danger_limit_bps >= liquidation_threshold_bps:
-                raise ValueError("danger_limit_bps must be lower than liquidation_threshold_bps")
-            if principal_max_minor > 0 and principal_max_minor < principal_min_minor:
-                raise ValueError("principal_max_minor cannot be less than principal_min_minor")
-            return values
-        except Exception:
-            logger.exception("EMI plan threshold validation failed values=%s", values)
-            raise
+        danger_limit_bps = int(values.get("danger_limit_bps", 0))
+        liquidation_threshold_bps = int(values.get("liquidation_threshold_bps", 0))
+        principal_min_minor = int(values.get("principal_min_minor", 0))
+        principal_max_minor = int(values.get("principal_max_minor", 0))
+        if danger_limit_bps >= liquidation_threshold_bps:
+            raise ValueError("danger_limit_bps must be lower than liquidation_threshold_bps")
+        if principal_max_minor > 0 and principal_max_minor < principal_min_minor:
+            raise ValueError("principal_max_minor cannot be less than principal_min_minor")
+        return values
 
 
 class EmiPlanCatalog:
@@ -28,6 +28,7 @@ class AppSettings:
     firebase_credentials_path: Optional[str]
     firebase_users_collection: str
     firebase_profile_collection: str
+    firebase_server_aggregation: bool
     web3_enabled: bool
     bsc_rpc_url: Optional[str]
     opbnb_rpc_url: Optional[str]
@@ -172,6 +173,7 @@ def load_settings() -> AppSettings:
     firebase_credentials_path = firebase_cfg.get("credentials_path")
     firebase_users_collection = str(firebase_cfg.get("users_collection", "users"))
     firebase_profile_collection = str(firebase_cfg.get("profile_collection", "firebase_users"))
+    firebase_server_aggregation = _to_bool(firebase_cfg.get("server_aggregation", False), False)
 
     web3_enabled = _to_bool(web3_cfg.get("enabled", False), False)
     bsc_rpc_url = web3_cfg.get("bsc_rpc_url")
@@ -239,6 +241,7 @@ def load_settings() -> AppSettings:
         firebase_credentials_path=firebase_credentials_path,
         firebase_users_collection=firebase_users_collection,
         firebase_profile_collection=firebase_profile_collection,
+        firebase_server_aggregation=firebase_server_aggregation,
         web3_enabled=web3_enabled,
         bsc_rpc_url=bsc_rpc_url,
         opbnb_rpc_url=opbnb_rpc_url,
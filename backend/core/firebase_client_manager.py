@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 import logging
 import os
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 from google.cloud import firestore
 from google.oauth2 import service_account
@@ -12,6 +12,10 @@ from google.oauth2 import service_account
 logger = logging.getLogger(__name__)
 
 FilterTuple = Tuple[str, str, Any]
+T = TypeVar("T")
+
+# Firestore rejects write batches larger than this.
+BATCH_WRITE_LIMIT = 500
 
 
 def _utc_now() -> datetime:
@@ -75,6 +79,37 @@ class FirebaseClientManager:
             )
             raise
 
+    def set_documents_batch(
+        self,
+        writes: Sequence[Tuple[str, str, Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Create or replace several documents with batched commits.
+
+        Writes are committed in batches of at most ``BATCH_WRITE_LIMIT``
+        documents, so payloads up to that size commit atomically in one RPC.
+
+        Args:
+            writes: Sequence of `(collection_name, document_id, payload)` tuples.
+
+        Returns:
+            List[Dict[str, Any]]: Persisted payloads in input order.
+        """
+        try:
+            stored: List[Dict[str, Any]] = []
+            for start in range(0, len(writes), BATCH_WRITE_LIMIT):
+                batch = self._client.batch()
+                for collection_name, document_id, payload in writes[start:start + BATCH_WRITE_LIMIT]:
+                    safe_payload = dict(payload)
+                    safe_payload["updated_at"] = safe_payload.get("updated_at", _utc_now())
+                    safe_payload["created_at"] = safe_payload.get("created_at", _utc_now())
+                    batch.set(self._client.collection(collection_name).document(document_id), safe_payload)
+                    stored.append(safe_payload)
+                batch.commit()
+            return stored
+        except Exception:
+            logger.exception("Failed batched document write count=%d", len(writes))
+            raise
+
     def get_document(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
         """Get one Firestore document by id."""
         try:
@@ -92,6 +127,36 @@ class FirebaseClientManager:
             )
             raise
 
+    def get_documents(self, collection_name: str, document_ids: Sequence[str]) -> List[Optional[Dict[str, Any]]]:
+        """Fetch several documents by id in one batched read.
+
+        Args:
+            collection_name: Target collection.
+            document_ids: Document ids to fetch.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Payloads in ``document_ids`` order,
+            with ``None`` for missing documents.
+        """
+        try:
+            if not document_ids:
+                return []
+            collection = self._client.collection(collection_name)
+            found: Dict[str, Dict[str, Any]] = {}
+            for snapshot in self._client.get_all([collection.document(document_id) for document_id in document_ids]):
+                if snapshot.exists:
+                    data = snapshot.to_dict() or {}
+                    data["id"] = snapshot.id
+                    found[snapshot.id] = data
+            return [found.get(document_id) for document_id in document_ids]
+        except Exception:
+            logger.exception(
+                "Failed to get documents collection=%s count=%d",
+                collection_name,
+                len(document_ids),
+            )
+            raise
+
     def update_document(
         self,
         collection_name: str,
@@ -114,6 +179,29 @@ class FirebaseClientManager:
             )
             raise
 
+    def document_ref(self, collection_name: str, document_id: str) -> Any:
+        """Return a Firestore document reference for transactional reads and writes."""
+        return self._client.collection(collection_name).document(document_id)
+
+    def run_transaction(self, callback: Callable[[Any], T]) -> T:
+        """Run ``callback(transaction)`` inside a Firestore transaction.
+
+        Reads made with ``transaction=`` and writes queued on the transaction
+        commit atomically; Firestore retries the callback on contention.
+
+        Args:
+            callback: Function receiving the transaction and returning a result.
+
+        Returns:
+            T: The callback result from the committed attempt.
+        """
+        try:
+            transaction = self._client.transaction()
+            return firestore.transactional(callback)(transaction)
+        except Exception:
+            logger.exception("Firestore transaction failed.")
+            raise
+
     def soft_delete_document(self, collection_name: str, document_id: str) -> None:
         """Soft delete a document by setting `is_deleted=True`."""
         try:
@@ -145,6 +233,7 @@ class FirebaseClientManager:
         filters: Optional[Sequence[FilterTuple]] = None,
         order_by: Optional[str] = None,
         limit: Optional[int] = None,
+        select_fields: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Run a filtered query and return document payloads.
 
@@ -153,11 +242,14 @@ class FirebaseClientManager:
             filters: Sequence of tuples `(field, op, value)`.
             order_by: Optional field name for sorting.
             limit: Optional maximum result count.
+            select_fields: Optional field projection; only these fields are fetched.
         """
         try:
             query = self._client.collection(collection_name)
             for field_name, operator, value in filters or []:
                 query = query.where(field_name, operator, value)
+            if select_fields:
+                query = query.select(list(select_fields))
             if order_by:
                 query = query.order_by(order_by)
             if limit is not None:
@@ -172,3 +264,120 @@ class FirebaseClientManager:
         except Exception:
             logger.exception("Failed query for collection=%s", collection_name)
             raise
+
+    def sum_fields(
+        self,
+        collection_name: str,
+        field_names: Sequence[str],
+        filters: Optional[Sequence[FilterTuple]] = None,
+    ) -> Dict[str, Any]:
+        """Sum numeric fields over filtered documents with one aggregation query.
+
+        Firestore skips non-numeric and missing values, and only the totals are
+        transferred.
+
+        Args:
+            collection_name: Target collection.
+            field_names: Fields to sum; each total is keyed by its field name.
+            filters: Sequence of tuples `(field, op, value)`.
+
+        Returns:
+            Dict[str, Any]: Totals by field name, ``0`` when nothing matched.
+        """
+        try:
+            query = self._client.collection(collection_name)
+            for field_name, operator, value in filters or []:
+                query = query.where(field_name, operator, value)
+            aggregation = query
+            for field_name in field_names:
+                aggregation = aggregation.sum(field_name, alias=field_name)
+
+            totals: Dict[str, Any] = {field_name: 0 for field_name in field_names}
+            for row in aggregation.get():
+                for result in row:
+                    if result.value is not None:
+                        totals[result.alias] = result.value
+            return totals
+        except Exception:
+            logger.exception("Failed sum aggregation for collection=%s", collection_name)
+            raise
+
+    def stream_documents(
+        self,
+        collection_name: str,
+        filters: Optional[Sequence[FilterTuple]] = None,
+        select_fields: Optional[Sequence[str]] = None,
+        page_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield filtered document payloads page by page in document-id order.
+
+        Only one page of snapshots is held at a time, so memory stays bounded
+        by ``page_size`` regardless of collection size.
+
+        Args:
+            collection_name: Target collection.
+            filters: Sequence of tuples `(field, op, value)`.
+            select_fields: Optional field projection; only these fields are fetched.
+            page_size: Maximum documents fetched per round-trip.
+        """
+        try:
+            cursor: Optional[str] = None
+            while True:
+                payloads, cursor = self.query_page(
+                    collection_name=collection_name,
+                    filters=filters,
+                    select_fields=select_fields,
+                    page_size=page_size,
+                    cursor=cursor,
+                )
+                yield from payloads
+                if cursor is None:
+                    return
+        except Exception:
+            logger.exception("Failed streaming query for collection=%s", collection_name)
+            raise
+
+    def query_page(
+        self,
+        collection_name: str,
+        filters: Optional[Sequence[FilterTuple]] = None,
+        select_fields: Optional[Sequence[str]] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one page of filtered payloads in document-id order.
+
+        Args:
+            collection_name: Target collection.
+            filters: Sequence of tuples `(field, op, value)`.
+            select_fields: Optional field projection; only these fields are fetched.
+            page_size: Maximum documents in the page.
+            cursor: Document id to resume after, as returned by the previous page.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: Page payloads and the
+            cursor for the next page, or ``None`` when this is the last page.
+        """
+        try:
+            page_size = max(1, int(page_size))
+            collection = self._client.collection(collection_name)
+            query = collection
+            for field_name, operator, value in filters or []:
+                query = query.where(field_name, operator, value)
+            if select_fields:
+                query = query.select(list(select_fields))
+            document_id_path = firestore.FieldPath.document_id()
+            query = query.order_by(document_id_path).limit(page_size)
+            if cursor:
+                query = query.start_after({document_id_path: collection.document(cursor)})
+
+            payloads: List[Dict[str, Any]] = []
+            for snapshot in query.stream():
+                payload = snapshot.to_dict() or {}
+                payload["id"] = snapshot.id
+                payloads.append(payload)
+            next_cursor = payloads[-1]["id"] if len(payloads) == page_size else None
+            return payloads, next_cursor
+        except Exception:
+            logger.exception("Failed page query for collection=%s cursor=%s", collection_name, cursor)
+            raise
@@ -15,13 +15,14 @@ sys.path.insert(0, str(_BACKEND_DIR))
 if str(_REPO_ROOT) not in sys.path:
     sys.path.append(str(_REPO_ROOT))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 from api.router import build_router
-from api.risk_routes import build_risk_router
+from api.risk_routes import build_risk_router, close_batch_predictor
 from core import get_logger, load_settings, setup_logging
+from repositories import request_user_cache
 from services import LiquidationPoller
 
 
@@ -45,6 +46,12 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def _request_user_cache_scope(request: Request, call_next):
+        """Scope repeated user reads to a single request."""
+        with request_user_cache():
+            return await call_next(request)
+
     app.include_router(build_router(settings))
     app.include_router(build_risk_router())
 
@@ -67,6 +74,10 @@ def create_app() -> FastAPI:
             await app.state.liquidation_poller.stop()
         except Exception:
             logger.exception("Failed to stop background services during shutdown.")
+        try:
+            await close_batch_predictor()
+        except Exception:
+            logger.exception("Failed to stop risk prediction batching during shutdown.")
 
     logger.info("Application initialized: %s", settings.app_name)
     return app
@@ -0,0 +1,47 @@
+"""Shared persistence helpers for ML model artifacts."""
+
+import importlib.util
+import logging
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import Any, Dict, Union
+import warnings
+
+import joblib
+
+
+logger = logging.getLogger(__name__)
+
+# lz4 is optional; without it artifacts stay uncompressed so loads can memory-map arrays.
+_ARTIFACT_COMPRESSION: Union[int, tuple] = ("lz4", 3) if importlib.util.find_spec("lz4") is not None else 0
+
+
+def dump_artifact(artifact: Dict[str, Any], model_path: Path) -> None:
+    """Persist a model artifact with the highest pickle protocol.
+
+    The artifact is written to a temporary file beside ``model_path`` and then
+    renamed over it. Services that memory-mapped the previous file keep reading
+    the old inode instead of seeing it truncated under them.
+    """
+    model_path = Path(model_path)
+    fd, temp_name = tempfile.mkstemp(dir=model_path.parent, prefix=".{0}.".format(model_path.name), suffix=".tmp")
+    os.close(fd)
+    try:
+        # mkstemp creates owner-only files; keep the permissions a direct write would have had.
+        os.chmod(temp_name, 0o644)
+        joblib.dump(artifact, temp_name, compress=_ARTIFACT_COMPRESSION, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_name, model_path)
+    except Exception:
+        logger.exception("Failed to write model artifact path=%s", model_path)
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_artifact(model_path: Path) -> Dict[str, Any]:
+    """Load a model artifact, memory-mapping NumPy buffers when the file is uncompressed."""
+    with warnings.catch_warnings():
+        # Compressed artifacts cannot be memory-mapped; joblib falls back to a regular read.
+        warnings.filterwarnings("ignore", message=r'mmap_mode ".*" is not compatible with compressed file')
+        return joblib.load(model_path, mmap_mode="r")
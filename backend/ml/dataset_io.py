@@ -0,0 +1,66 @@
+"""Shared read/write helpers for synthetic training datasets."""
+
+import importlib.util
+import logging
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+# Columnar formats need pyarrow; without it datasets fall back to CSV.
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+DEFAULT_DATASET_FORMAT = "parquet" if PARQUET_AVAILABLE else "csv"
+COLUMNAR_SUFFIXES = frozenset({".parquet", ".feather"})
+DATASET_CHUNK_ROWS = 4096
+
+
+def write_dataset(dataframe: pd.DataFrame, output_path: Union[str, Path]) -> Path:
+    """Write a dataset in the format implied by the output suffix.
+
+    Args:
+        dataframe: Dataset to persist.
+        output_path: Target path ending in ``.parquet``, ``.feather``, or ``.csv``.
+
+    Returns:
+        Path: The written file path.
+    """
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        _write_parquet_chunked(dataframe, path)
+    elif suffix == ".feather":
+        dataframe.reset_index(drop=True).to_feather(path)
+    else:
+        dataframe.to_csv(path, index=False, chunksize=DATASET_CHUNK_ROWS)
+    return path
+
+
+def _write_parquet_chunked(dataframe: pd.DataFrame, path: Path) -> None:
+    """Stream a dataframe into Parquet one row-group chunk at a time.
+
+    Converting slices keeps only one chunk's Arrow copy alive instead of a
+    full-table copy next to the dataframe.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(dataframe.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for start in range(0, len(dataframe), DATASET_CHUNK_ROWS):
+            chunk = dataframe.iloc[start:start + DATASET_CHUNK_ROWS]
+            writer.write_batch(pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def read_dataset(data_path: Union[str, Path]) -> pd.DataFrame:
+    """Read a dataset written by ``write_dataset``, dispatching on the file suffix."""
+    path = Path(data_path)
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(path, engine="pyarrow")
+    if suffix == ".feather":
+        return pd.read_feather(path)
+    return pd.read_csv(path)
@@ -2,11 +2,12 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from threading import Lock
+from typing import Any, Dict, List, Optional
 
-import joblib
 import pandas as pd
 
+from .artifact_io import load_artifact
 from .default_schema import DefaultPredictionInput
 
 
@@ -25,6 +26,7 @@ class DefaultPredictionInferenceService:
         self._model_path = Path(model_path)
         self._artifact: Dict[str, Any] = {}
         self._loaded = False
+        self._reload_lock = Lock()
         self._high_threshold = high_threshold
         self._medium_threshold = medium_threshold
         self._load_model()
@@ -47,12 +49,14 @@ class DefaultPredictionInferenceService:
             "medium": float(self._medium_threshold),
         }
 
-    def reload(self, model_path: str = "") -> None:
-        """Reload model artifact, optionally from a different path."""
+    def reload(self, model_path: str = "") -> bool:
+        """Reload model artifact, optionally from a different path.
+
+        The new artifact is swapped in only after it loads successfully; a
+        failed reload keeps the current artifact serving.
+        """
         try:
-            if model_path:
-                self._model_path = Path(model_path)
-            self._load_model()
+            return self._load_model(Path(model_path) if model_path else None)
         except Exception:
             logger.exception("Failed reloading default model path=%s", model_path or self._model_path)
             raise
@@ -95,21 +99,27 @@ class DefaultPredictionInferenceService:
             )
             raise
 
-    def _load_model(self) -> None:
-        """Load model artifact from disk."""
-        try:
-            if not self._model_path.exists():
-                logger.warning("Default model file not found path=%s", self._model_path)
-                self._loaded = False
-                return
-            self._artifact = joblib.load(self._model_path)
-            self._high_threshold = float(self._artifact.get("high_threshold", self._high_threshold))
-            self._medium_threshold = float(self._artifact.get("medium_threshold", self._medium_threshold))
+    def _load_model(self, model_path: Optional[Path] = None) -> bool:
+        """Load model artifact from disk and atomically swap it in."""
+        target_path = model_path or self._model_path
+        with self._reload_lock:
+            try:
+                if not target_path.exists():
+                    logger.warning("Default model file not found path=%s", target_path)
+                    return False
+                artifact = load_artifact(target_path)
+                high_threshold = float(artifact.get("high_threshold", self._high_threshold))
+                medium_threshold = float(artifact.get("medium_threshold", self._medium_threshold))
+            except Exception:
+                logger.exception("Failed loading default model path=%s", target_path)
+                return False
+            self._artifact = artifact
+            self._model_path = target_path
+            self._high_threshold = high_threshold
+            self._medium_threshold = medium_threshold
             self._loaded = True
-            logger.info("Default model loaded path=%s", self._model_path)
-        except Exception:
-            logger.exception("Failed loading default model path=%s", self._model_path)
-            self._loaded = False
+        logger.info("Default model loaded path=%s", target_path)
+        return True
 
     def predict(self, payload: DefaultPredictionInput) -> Dict[str, Any]:
         """Predict probability of missing next installment and map to tier/actions."""
@@ -117,8 +127,9 @@ class DefaultPredictionInferenceService:
             raise RuntimeError("Default prediction model not loaded.")
 
         try:
-            feature_columns: List[str] = self._artifact["feature_columns"]
-            model = self._artifact["model"]
+            artifact = self._artifact
+            feature_columns: List[str] = artifact["feature_columns"]
+            model = artifact["model"]
             payload_dict = payload.dict()
             x = pd.DataFrame([payload_dict], columns=feature_columns)
             p_miss_next = float(model.predict_proba(x)[0][1])
@@ -149,8 +160,8 @@ class DefaultPredictionInferenceService:
                 },
                 "actions": actions,
                 "top_reasons": self._top_reasons(payload),
-                "model_name": self._artifact.get("model_name", "gradient_boosting_calibrated"),
-                "model_version": self._artifact.get("version", "v1"),
+                "model_name": artifact.get("model_name", "gradient_boosting_calibrated"),
+                "model_version": artifact.get("version", "v1"),
             }
         except Exception:
             logger.exception("Default prediction inference failed.")
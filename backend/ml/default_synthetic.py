@@ -6,6 +6,8 @@ import logging
 import numpy as np
 import pandas as pd
 
+from .synthetic import _plan_column, _sample_plans
+
 try:
     from common.emi_plan_catalog import get_default_emi_plan_catalog
 except ImportError:  # pragma: no cover - compatibility for script package style imports
@@ -20,22 +22,11 @@ def generate_synthetic_default_dataset(rows: int = 12000, seed: int = 42) -> pd.
     rng = np.random.default_rng(seed)
     plans = get_default_emi_plan_catalog().list_plan_models(include_disabled=False)
     if plans:
-        selected_indices = rng.integers(0, len(plans), size=rows)
-        selected_plans = [plans[idx] for idx in selected_indices]
-        tenure_days = np.array([plan.tenure_days for plan in selected_plans], dtype=int)
-        installment_count = np.array([plan.installment_count for plan in selected_plans], dtype=int)
-        cadence_days = np.array([plan.cadence_days for plan in selected_plans], dtype=int)
-        emi_plan_id = np.array([plan.plan_id for plan in selected_plans], dtype=object)
-        plan_amount = np.array(
-            [
-                rng.uniform(
-                    max(float(plan.principal_min_minor), 1000.0),
-                    max(float(plan.principal_max_minor), max(float(plan.principal_min_minor), 1000.0) + 1.0),
-                )
-                for plan in selected_plans
-            ],
-            dtype=float,
-        )
+        selected_indices, plan_amount = _sample_plans(plans, rows, rng)
+        tenure_days = _plan_column(plans, "tenure_days", selected_indices, int)
+        installment_count = _plan_column(plans, "installment_count", selected_indices, int)
+        cadence_days = _plan_column(plans, "cadence_days", selected_indices, int)
+        emi_plan_id = _plan_column(plans, "plan_id", selected_indices, object)
     else:
         tenure_days = rng.choice([30, 60, 90, 120, 180], size=rows)
         installment_count = np.clip((tenure_days / 30).astype(int), 1, None)
@@ -55,10 +46,8 @@ def generate_synthetic_default_dataset(rows: int = 12000, seed: int = 42) -> pd.
     days_since_last_late = np.clip(rng.gamma(2.5, 8.0, size=rows), 0, 180)
     consecutive_on_time_count = rng.poisson(4.0, size=rows)
 
-    installment_number = np.array(
-        [rng.integers(1, max(int(installment_count[idx]), 1) + 1) for idx in range(rows)],
-        dtype=int,
-    )
+    # Array bounds draw the same stream as per-row scalar calls.
+    installment_number = rng.integers(1, np.maximum(installment_count, 1) + 1).astype(int)
     installment_amount = np.maximum(plan_amount / np.maximum(installment_count, 1), 100)
     days_until_due = np.clip(rng.normal(2.0, 1.2, size=rows), 0, 7)
 
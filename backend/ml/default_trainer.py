@@ -4,7 +4,6 @@ import logging
 from pathlib import Path
 from typing import Dict, List
 
-import joblib
 import pandas as pd
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.compose import ColumnTransformer
@@ -13,6 +12,8 @@ from sklearn.metrics import average_precision_score, roc_auc_score
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
+from .artifact_io import dump_artifact
+
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +103,7 @@ def train_and_save_default_model(
     }
     model_path = Path(output_path)
     model_path.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(artifact, model_path)
+    dump_artifact(artifact, model_path)
     logger.info("Default prediction model artifact saved at %s", model_path)
 
     return {
@@ -2,11 +2,12 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from threading import Lock
+from typing import Any, Dict, Optional
 
-import joblib
 import pandas as pd
 
+from .artifact_io import load_artifact
 from .deposit_policy import recommend_deposit_by_policy
 from .deposit_schema import DepositRecommendationRequest
 
@@ -21,6 +22,7 @@ class DepositRecommendationInferenceService:
         self._model_path = Path(model_path)
         self._artifact: Dict[str, Any] = {}
         self._loaded = False
+        self._reload_lock = Lock()
         self._load_model()
 
     @property
@@ -33,29 +35,35 @@ class DepositRecommendationInferenceService:
         """Whether model artifact is loaded."""
         return self._loaded
 
-    def reload(self, model_path: str = "") -> None:
-        """Reload model artifact, optionally from a new path."""
+    def reload(self, model_path: str = "") -> bool:
+        """Reload model artifact, optionally from a different path.
+
+        The new artifact is swapped in only after it loads successfully; a
+        failed reload keeps the current artifact serving.
+        """
         try:
-            if model_path:
-                self._model_path = Path(model_path)
-            self._load_model()
+            return self._load_model(Path(model_path) if model_path else None)
         except Exception:
             logger.exception("Failed reloading deposit model path=%s", model_path or self._model_path)
             raise
 
-    def _load_model(self) -> None:
-        """Load model artifact from filesystem."""
-        try:
-            if not self._model_path.exists():
-                logger.warning("Deposit model file not found path=%s", self._model_path)
-                self._loaded = False
-                return
-            self._artifact = joblib.load(self._model_path)
+    def _load_model(self, model_path: Optional[Path] = None) -> bool:
+        """Load model artifact from filesystem and atomically swap it in."""
+        target_path = model_path or self._model_path
+        with self._reload_lock:
+            try:
+                if not target_path.exists():
+                    logger.warning("Deposit model file not found path=%s", target_path)
+                    return False
+                artifact = load_artifact(target_path)
+            except Exception:
+                logger.exception("Failed to load deposit model path=%s", target_path)
+                return False
+            self._artifact = artifact
+            self._model_path = target_path
             self._loaded = True
-            logger.info("Deposit model loaded path=%s", self._model_path)
-        except Exception:
-            logger.exception("Failed to load deposit model path=%s", self._model_path)
-            self._loaded = False
+        logger.info("Deposit model loaded path=%s", target_path)
+        return True
 
     def predict(self, payload: DepositRecommendationRequest) -> Dict[str, Any]:
         """Predict required collateral using model or policy fallback."""
@@ -65,8 +73,9 @@ class DepositRecommendationInferenceService:
             return policy_result
 
         try:
-            feature_columns = self._artifact["feature_columns"]
-            model = self._artifact["pipeline"]
+            artifact = self._artifact
+            feature_columns = artifact["feature_columns"]
+            model = artifact["pipeline"]
             data = payload.dict()
             if data.get("outstanding_debt_inr") in (None, 0):
                 data["outstanding_debt_inr"] = payload.plan_amount_inr
@@ -88,9 +97,9 @@ class DepositRecommendationInferenceService:
                 "current_locked_token": round(payload.locked_token, 12),
                 "current_locked_inr": round(payload.locked_token * payload.price_inr, 6),
                 "topup_token": round(topup_token, 12),
-                "model_name": self._artifact.get("model_name", "random_forest_regressor"),
-                "model_version": self._artifact.get("version", "v1"),
-                "metric_mae": self._artifact.get("metric_mae"),
+                "model_name": artifact.get("model_name", "random_forest_regressor"),
+                "model_version": artifact.get("version", "v1"),
+                "metric_mae": artifact.get("metric_mae"),
             }
         except Exception:
             logger.exception("Deposit recommendation ML prediction failed.")
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 
 from .deposit_policy import DEFAULT_STRESS_DROP, DEFAULT_TARGET_LTV
+from .synthetic import _plan_column, _sample_plans
 
 try:
     from common.emi_plan_catalog import get_default_emi_plan_catalog
@@ -21,20 +22,9 @@ def generate_synthetic_deposit_dataset(rows: int = 10000, seed: int = 42) -> pd.
     rng = np.random.default_rng(seed)
     plans = get_default_emi_plan_catalog().list_plan_models(include_disabled=False)
     if plans:
-        selected_indices = rng.integers(0, len(plans), size=rows)
-        selected_plans = [plans[idx] for idx in selected_indices]
-        tenure_days = np.array([plan.tenure_days for plan in selected_plans], dtype=int)
-        emi_plan_id = np.array([plan.plan_id for plan in selected_plans], dtype=object)
-        plan_amount_inr = np.array(
-            [
-                rng.uniform(
-                    max(float(plan.principal_min_minor), 1000.0),
-                    max(float(plan.principal_max_minor), max(float(plan.principal_min_minor), 1000.0) + 1.0),
-                )
-                for plan in selected_plans
-            ],
-            dtype=float,
-        )
+        selected_indices, plan_amount_inr = _sample_plans(plans, rows, rng)
+        tenure_days = _plan_column(plans, "tenure_days", selected_indices, int)
+        emi_plan_id = _plan_column(plans, "plan_id", selected_indices, object)
     else:
         tenure_days = rng.choice([30, 60, 90, 120, 180], size=rows)
         emi_plan_id = np.array(["fallback_plan"] * rows, dtype=object)
@@ -50,24 +40,24 @@ def generate_synthetic_deposit_dataset(rows: int = 10000, seed: int = 42) -> pd.
     )
 
     if plans:
-        stress_drop_pct = np.array(
-            [
-                plan.stress_drop_pct_stable if collateral_types[idx] == "stable" else plan.stress_drop_pct_volatile
-                for idx, plan in enumerate(selected_plans)
-            ],
-            dtype=float,
+        stress_drop_pct = np.where(
+            collateral_types == "stable",
+            _plan_column(plans, "stress_drop_pct_stable", selected_indices, float),
+            _plan_column(plans, "stress_drop_pct_volatile", selected_indices, float),
         )
     else:
         stress_drop_pct = np.array([DEFAULT_STRESS_DROP[item] for item in collateral_types], dtype=float)
     fees_buffer_pct = rng.uniform(0.02, 0.06, size=rows)
     if plans:
-        target_ltv = np.array(
-            [
-                float(plan.target_ltv_by_risk_tier.get(risk_tiers[idx], DEFAULT_TARGET_LTV.get(risk_tiers[idx], 0.50)))
-                for idx, plan in enumerate(selected_plans)
-            ],
-            dtype=float,
-        )
+        # Per-plan LTV lookups are resolved once per tier, then gathered by plan index.
+        target_ltv = np.empty(rows, dtype=float)
+        for tier in ("LOW", "MEDIUM", "HIGH"):
+            tier_ltv = np.array(
+                [float(plan.target_ltv_by_risk_tier.get(tier, DEFAULT_TARGET_LTV.get(tier, 0.50))) for plan in plans],
+                dtype=float,
+            )
+            tier_mask = risk_tiers == tier
+            target_ltv[tier_mask] = tier_ltv[selected_indices[tier_mask]]
     else:
         target_ltv = np.array([DEFAULT_TARGET_LTV[item] for item in risk_tiers], dtype=float)
     required_inr = (outstanding_debt_inr * (1 + fees_buffer_pct)) / target_ltv / (1 - stress_drop_pct)
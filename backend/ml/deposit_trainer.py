@@ -4,7 +4,6 @@ import logging
 from pathlib import Path
 from typing import Dict, List
 
-import joblib
 import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.ensemble import RandomForestRegressor
@@ -13,6 +12,8 @@ from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder
 
+from .artifact_io import dump_artifact
+
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +78,7 @@ def train_and_save_deposit_model(dataframe: pd.DataFrame, output_path: str) -> D
     }
     model_path = Path(output_path)
     model_path.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(artifact, model_path)
+    dump_artifact(artifact, model_path)
     logger.info("Deposit model artifact saved at %s", model_path)
 
     return {
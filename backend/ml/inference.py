@@ -2,18 +2,26 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
-import joblib
 import numpy as np
 import pandas as pd
 
+from .artifact_io import load_artifact
 from .schema import RiskFeatureInput
 
 
 logger = logging.getLogger(__name__)
 
 
+class CompactRiskPrediction(NamedTuple):
+    """Risk tier plus class probabilities as a fixed-order vector."""
+
+    risk_tier: str
+    probs: np.ndarray
+
+
 class RiskModelInferenceService:
     """Loads trained artifact and serves model inference requests."""
 
@@ -21,6 +29,7 @@ class RiskModelInferenceService:
         self._model_path = Path(model_path)
         self._artifact: Dict[str, Any] = {}
         self._loaded = False
+        self._reload_lock = Lock()
         self._load_model()
 
     @property
@@ -33,83 +42,192 @@ class RiskModelInferenceService:
         """Return whether model artifact is available and loaded."""
         return self._loaded
 
-    def reload(self, model_path: str = "") -> None:
+    def reload(self, model_path: str = "") -> bool:
         """Reload model artifact, optionally from a new path.
 
+        The new artifact is loaded into a shadow buffer and swapped in only on
+        success, so in-flight predictions finish on the artifact they started
+        with and a failed reload keeps the current artifact serving.
+
         Args:
             model_path: Optional new model path.
+
+        Returns:
+            bool: Whether the new artifact was loaded and swapped in.
         """
         try:
-            if model_path:
-                self._model_path = Path(model_path)
-            self._load_model()
+            return self._load_model(Path(model_path) if model_path else None)
         except Exception:
             logger.exception("Failed to reload ML model path=%s", model_path or self._model_path)
             raise
 
-    def _load_model(self) -> None:
-        """Load model artifact from disk."""
-        try:
-            if not self._model_path.exists():
-                logger.warning("ML model file not found path=%s", self._model_path)
-                self._loaded = False
-                return
-            self._artifact = joblib.load(self._model_path)
+    def _load_model(self, model_path: Optional[Path] = None) -> bool:
+        """Load model artifact from disk and atomically swap it in."""
+        target_path = model_path or self._model_path
+        with self._reload_lock:
+            try:
+                if not target_path.exists():
+                    logger.warning("ML model file not found path=%s", target_path)
+                    return False
+                artifact = load_artifact(target_path)
+            except Exception:
+                logger.exception("Failed to load ML model path=%s", target_path)
+                return False
+            self._artifact = artifact
+            self._model_path = target_path
             self._loaded = True
-            logger.info("ML model loaded path=%s", self._model_path)
-        except Exception:
-            logger.exception("Failed to load ML model path=%s", self._model_path)
-            self._loaded = False
+        logger.info("ML model loaded path=%s", target_path)
+        return True
 
     def predict(self, features: RiskFeatureInput) -> Dict[str, Any]:
         """Predict risk tier, probabilities, and top reasons."""
+        return self.predict_batch([features])[0]
+
+    def predict_batch(self, features: Sequence[RiskFeatureInput]) -> List[Dict[str, Any]]:
+        """Predict many rows with a single vectorized model call.
+
+        Args:
+            features: Feature rows to score together.
+
+        Returns:
+            List[Dict[str, Any]]: One prediction payload per input row, in order.
+        """
         if not self._loaded:
             raise RuntimeError("ML model not loaded. Train model first.")
+        if not features:
+            return []
 
         try:
-            feature_columns: List[str] = self._artifact["feature_columns"]
-            pipeline = self._artifact["pipeline"]
-
-            payload = features.dict()
-            x = pd.DataFrame([payload], columns=feature_columns)
-            prediction = pipeline.predict(x)[0]
-            probabilities_arr = pipeline.predict_proba(x)[0]
-            classes = list(pipeline.classes_)
-            probabilities = {classes[idx]: float(probabilities_arr[idx]) for idx in range(len(classes))}
-
-            top_reasons = self._extract_top_reasons(pipeline=pipeline, x=x, feature_columns=feature_columns, tier=prediction)
-            return {
-                "risk_tier": prediction,
-                "probabilities": probabilities,
-                "top_reasons": top_reasons,
-                "model_name": self._artifact.get("model_name", "logistic_regression_ovr"),
-                "model_version": self._artifact.get("version", "v1"),
-            }
+            # Read the artifact once so a concurrent reload cannot mix old and new weights.
+            artifact = self._artifact
+            feature_columns: List[str] = artifact["feature_columns"]
+            x, probabilities_matrix, classes = self._score(artifact=artifact, features=features)
+            class_indices = np.argmax(probabilities_matrix, axis=1)
+            predictions = [classes[idx] for idx in class_indices]
+            model_name = artifact.get("model_name", "logistic_regression_ovr")
+            model_version = artifact.get("version", "v1")
+
+            top_reasons = self._extract_top_reasons(
+                artifact=artifact,
+                x=x,
+                feature_columns=feature_columns,
+                class_indices=class_indices,
+            )
+
+            results: List[Dict[str, Any]] = []
+            for row_idx, prediction in enumerate(predictions):
+                probabilities_arr = probabilities_matrix[row_idx]
+                results.append(
+                    {
+                        "risk_tier": prediction,
+                        "probabilities": {classes[idx]: float(probabilities_arr[idx]) for idx in range(len(classes))},
+                        "top_reasons": top_reasons[row_idx],
+                        "model_name": model_name,
+                        "model_version": model_version,
+                    }
+                )
+            return results
         except Exception:
-            logger.exception("ML prediction failed.")
+            logger.exception("ML prediction failed rows=%d.", len(features))
             raise
 
-    def _extract_top_reasons(self, pipeline: Any, x: pd.DataFrame, feature_columns: List[str], tier: str) -> List[Dict[str, Any]]:
-        """Compute top 3 feature contributions for explainability."""
+    def predict_compact(self, features: RiskFeatureInput, class_order: Sequence[str]) -> CompactRiskPrediction:
+        """Predict one row as a tier plus a probability vector in ``class_order``."""
+        return self.predict_compact_batch([features], class_order=class_order)[0]
+
+    def predict_compact_batch(
+        self,
+        features: Sequence[RiskFeatureInput],
+        class_order: Sequence[str],
+    ) -> List[CompactRiskPrediction]:
+        """Predict many rows without building probability dicts or top reasons.
+
+        Args:
+            features: Feature rows to score together.
+            class_order: Upper-case class names defining the probability vector
+                layout; classes the model lacks get probability zero.
+
+        Returns:
+            List[CompactRiskPrediction]: One compact prediction per input row, in order.
+        """
+        if not self._loaded:
+            raise RuntimeError("ML model not loaded. Train model first.")
+        if not features:
+            return []
+
         try:
-            scaler = pipeline.named_steps["scaler"]
-            model = pipeline.named_steps["model"]
-            x_scaled = scaler.transform(x)[0]
-            class_index = list(model.classes_).index(tier)
-            coef = model.coef_[class_index]
-            contributions = coef * x_scaled
-
-            ranked_idx = np.argsort(np.abs(contributions))[::-1][:3]
-            result: List[Dict[str, Any]] = []
-            for idx in ranked_idx:
-                result.append(
-                    {
-                        "feature": feature_columns[idx],
-                        "contribution": float(contributions[idx]),
-                        "direction": "increase_risk" if contributions[idx] > 0 else "decrease_risk",
-                    }
-                )
-            return result
+            _, probabilities_matrix, classes = self._score(artifact=self._artifact, features=features)
+            class_indices = np.argmax(probabilities_matrix, axis=1)
+            ordered = np.zeros((probabilities_matrix.shape[0], len(class_order)), dtype=np.float64)
+            positions = {name: idx for idx, name in enumerate(class_order)}
+            for class_idx, class_name in enumerate(classes):
+                position = positions.get(str(class_name).upper())
+                if position is not None:
+                    ordered[:, position] = probabilities_matrix[:, class_idx]
+            return [
+                CompactRiskPrediction(risk_tier=str(classes[class_idx]), probs=ordered[row_idx])
+                for row_idx, class_idx in enumerate(class_indices)
+            ]
+        except Exception:
+            logger.exception("ML compact prediction failed rows=%d.", len(features))
+            raise
+
+    def _score(
+        self,
+        artifact: Dict[str, Any],
+        features: Sequence[RiskFeatureInput],
+    ) -> Tuple[Any, np.ndarray, List[str]]:
+        """Return the model input, probability matrix, and class labels for ``features``."""
+        feature_columns: List[str] = artifact["feature_columns"]
+        rows = [row.dict() for row in features]
+        if "coef" in artifact:
+            x = np.array([[row[column] for column in feature_columns] for row in rows], dtype=np.float32)
+            return x, self._predict_proba_linear(artifact=artifact, x=x), list(artifact["classes"])
+        pipeline = artifact["pipeline"]
+        x = pd.DataFrame(rows, columns=feature_columns)
+        return x, pipeline.predict_proba(x), list(pipeline.classes_)
+
+    @staticmethod
+    def _predict_proba_linear(artifact: Dict[str, Any], x: np.ndarray) -> np.ndarray:
+        """Score a baked multinomial model: one matmul plus a stable softmax."""
+        scores = x @ artifact["coef"].T + artifact["intercept"]
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def _extract_top_reasons(
+        self,
+        artifact: Dict[str, Any],
+        x: Any,
+        feature_columns: List[str],
+        class_indices: np.ndarray,
+    ) -> List[List[Dict[str, Any]]]:
+        """Compute top 3 feature contributions per row for explainability."""
+        try:
+            if "coef" in artifact:
+                # Baked coef equals coef / scale, so coef * (x - mean) reproduces scaled contributions.
+                contributions_matrix = artifact["coef"][class_indices] * (x - artifact["feature_means"])
+            else:
+                pipeline = artifact["pipeline"]
+                scaler = pipeline.named_steps["scaler"]
+                model = pipeline.named_steps["model"]
+                contributions_matrix = model.coef_[class_indices] * scaler.transform(x)
+
+            results: List[List[Dict[str, Any]]] = []
+            for contributions in contributions_matrix:
+                ranked_idx = np.argsort(np.abs(contributions))[::-1][:3]
+                result: List[Dict[str, Any]] = []
+                for idx in ranked_idx:
+                    result.append(
+                        {
+                            "feature": feature_columns[idx],
+                            "contribution": float(contributions[idx]),
+                            "direction": "increase_risk" if contributions[idx] > 0 else "decrease_risk",
+                        }
+                    )
+                results.append(result)
+            return results
         except Exception:
             logger.exception("Failed extracting top reasons.")
-            return []
+            return [[] for _ in class_indices]
@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, validator
 
 
-_SUPPORTED_MODEL_TYPES = {"risk", "default", "deposit"}
+_SUPPORTED_MODEL_TYPES = frozenset({"risk", "default", "deposit"})
 
 
 class MlOrchestrationRequest(BaseModel):
@@ -37,6 +37,8 @@ class MlPayloadAnalysisRequest(BaseModel):
     @validator("model_type")
     def _validate_model_type(cls, value: str) -> str:
         """Validate analysis target model type."""
+        if value in _SUPPORTED_MODEL_TYPES:
+            return value
         normalized = value.strip().lower()
         if normalized not in _SUPPORTED_MODEL_TYPES:
             raise ValueError("model_type must be one of: risk, default, deposit")
@@ -53,6 +55,8 @@ class MlTrainingRowBuildRequest(BaseModel):
     @validator("model_type")
     def _validate_model_type(cls, value: str) -> str:
         """Validate target model type."""
+        if value in _SUPPORTED_MODEL_TYPES:
+            return value
         normalized = value.strip().lower()
         if normalized not in _SUPPORTED_MODEL_TYPES:
             raise ValueError("model_type must be one of: risk, default, deposit")
@@ -7,27 +7,48 @@ to the liquidation-risk response shape used by ``/api/risk/predict``.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+import functools
 import logging
 import math
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from .inference import RiskModelInferenceService
-from .schema import RiskFeatureInput
+import numpy as np
+
+from .inference import CompactRiskPrediction, RiskModelInferenceService
+from .schema import RiskFeatureInput, parse_risk_feature_rows
 
 
 logger = logging.getLogger(__name__)
 
 
 DEFAULT_MODEL_PATH = Path(__file__).resolve().parent / "artifacts" / "risk_model.joblib"
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 5.0
 _TIER_BASE_PROBABILITY = {
     "LOW": 0.08,
     "MEDIUM": 0.35,
     "HIGH": 0.75,
     "CRITICAL": 0.92,
 }
+_TIER_ORDER = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+_TIER_BASE_ARRAY = np.array([_TIER_BASE_PROBABILITY[tier] for tier in _TIER_ORDER], dtype=np.float64)
+_TIER_KEY_PAIRS = tuple((tier, tier.lower()) for tier in _TIER_ORDER)
+# Common spellings resolve to the canonical tier without allocating via ``str.upper``.
+_TIER_LOOKUP = {
+    variant: key
+    for key in _TIER_BASE_PROBABILITY
+    for variant in (key, key.lower(), key.title())
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_cached_inference(model_path: str) -> RiskModelInferenceService:
+    """Return a process-wide inference service so each artifact is unpickled once per path."""
+    return RiskModelInferenceService(model_path=model_path)
 
 
 @dataclass(frozen=True)
@@ -48,13 +69,34 @@ class LiquidationPredictor:
             or os.getenv("PING_MASTERS_RISK_MODEL_PATH", "").strip()
             or str(DEFAULT_MODEL_PATH)
         )
-        self._inference = RiskModelInferenceService(model_path=resolved_model_path)
-        if not self._inference.is_loaded:
-            raise FileNotFoundError("Risk model artifact not found or failed to load.")
+        self._model_path = resolved_model_path
+        inference = self._current_inference()
         self._model_version = "liquidation-adapter:{0}".format(
-            Path(self._inference.model_path).name
+            Path(inference.model_path).name
         )
-        logger.info("LiquidationPredictor initialized model_path=%s", self._inference.model_path)
+        logger.info("LiquidationPredictor initialized model_path=%s", inference.model_path)
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop cached inference services so live predictors re-read artifacts on their next call."""
+        _get_cached_inference.cache_clear()
+        logger.info("LiquidationPredictor inference cache cleared.")
+
+    def _current_inference(self) -> RiskModelInferenceService:
+        """Return the cached inference service for this predictor's artifact.
+
+        The lookup runs on every prediction so ``invalidate_cache`` also reaches
+        long-lived predictor instances.
+
+        Raises:
+            FileNotFoundError: If the artifact is missing or fails to load.
+        """
+        inference = _get_cached_inference(self._model_path)
+        if not inference.is_loaded:
+            # Do not pin a failed load; a later call should retry the disk read.
+            _get_cached_inference.cache_clear()
+            raise FileNotFoundError("Risk model artifact not found or failed to load.")
+        return inference
 
     def predict(
         self,
@@ -70,14 +112,17 @@ class LiquidationPredictor:
             current_price=current_price,
             volatility=volatility,
         )
-        inference_output = self._inference.predict(features)
+        return self.predict_features([features])[0]
 
-        risk_tier = str(inference_output.get("risk_tier", "MEDIUM")).upper()
-        probabilities = inference_output.get("probabilities", {})
-        liquidation_probability = self._to_liquidation_probability(
-            risk_tier=risk_tier,
-            probabilities=probabilities if isinstance(probabilities, dict) else {},
-        )
+    def predict_features(self, features: Sequence[RiskFeatureInput]) -> List[LiquidationPredictionResult]:
+        """Score prebuilt feature rows with one vectorized inference call."""
+        predictions = self._current_inference().predict_compact_batch(features, class_order=_TIER_ORDER)
+        return [self._to_result(prediction) for prediction in predictions]
+
+    def _to_result(self, prediction: CompactRiskPrediction) -> LiquidationPredictionResult:
+        """Map one compact risk-tier prediction into the liquidation response shape."""
+        risk_tier = self._normalize_tier(prediction.risk_tier or "MEDIUM")
+        liquidation_probability = self._blend_tier_probabilities(risk_tier=risk_tier, probs=prediction.probs)
 
         return LiquidationPredictionResult(
             liquidation_probability=liquidation_probability,
@@ -85,6 +130,32 @@ class LiquidationPredictor:
             model_version=self._model_version,
         )
 
+    def predict_batch(
+        self,
+        collateral_bnb: np.ndarray,
+        debt_fiat: np.ndarray,
+        current_price: np.ndarray,
+        volatility: np.ndarray,
+    ) -> List[LiquidationPredictionResult]:
+        """Predict liquidation probability for many positions with one model call.
+
+        Args:
+            collateral_bnb: Collateral amounts; broadcast against the other inputs.
+            debt_fiat: Outstanding debt values.
+            current_price: Collateral prices.
+            volatility: Volatility estimates.
+
+        Returns:
+            List[LiquidationPredictionResult]: One result per broadcast position, in order.
+        """
+        features = self._build_feature_rows(
+            collateral_bnb=collateral_bnb,
+            debt_fiat=debt_fiat,
+            current_price=current_price,
+            volatility=volatility,
+        )
+        return self.predict_features(features)
+
     @staticmethod
     def _build_features(
         collateral_bnb: float,
@@ -93,61 +164,230 @@ class LiquidationPredictor:
         volatility: float,
     ) -> RiskFeatureInput:
         """Build model features from risk-route payload."""
-        safe_collateral_bnb = max(float(collateral_bnb), 0.0)
-        safe_debt_fiat = max(float(debt_fiat), 0.0)
-        safe_current_price = max(float(current_price), 0.000001)
-        safe_volatility = max(float(volatility), 0.0)
+        return LiquidationPredictor._build_feature_rows(
+            collateral_bnb=collateral_bnb,
+            debt_fiat=debt_fiat,
+            current_price=current_price,
+            volatility=volatility,
+        )[0]
+
+    @staticmethod
+    def _build_feature_rows(
+        collateral_bnb: Any,
+        debt_fiat: Any,
+        current_price: Any,
+        volatility: Any,
+    ) -> List[RiskFeatureInput]:
+        """Build model features elementwise from scalar or array risk-route observables."""
+        collateral_bnb, debt_fiat, current_price, volatility = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(collateral_bnb, dtype=np.float64)),
+            np.atleast_1d(np.asarray(debt_fiat, dtype=np.float64)),
+            np.atleast_1d(np.asarray(current_price, dtype=np.float64)),
+            np.atleast_1d(np.asarray(volatility, dtype=np.float64)),
+        )
+        safe_collateral_bnb = np.maximum(collateral_bnb, 0.0)
+        safe_debt_fiat = np.maximum(debt_fiat, 0.0)
+        safe_current_price = np.maximum(current_price, 0.000001)
+        safe_volatility = np.maximum(volatility, 0.0)
 
         collateral_value = safe_collateral_bnb * safe_current_price
-        if safe_debt_fiat <= 0.0:
-            safety_ratio = 10.0
-        else:
-            safety_ratio = collateral_value / safe_debt_fiat
-        safety_ratio = max(0.01, min(safety_ratio, 25.0))
+        has_debt = safe_debt_fiat > 0.0
+        safety_ratio = np.where(has_debt, collateral_value / np.where(has_debt, safe_debt_fiat, 1.0), 10.0)
+        safety_ratio = np.clip(safety_ratio, 0.01, 25.0)
 
         # Keep the adapter deterministic and explainable for hackathon demos.
-        risk_pressure = max(0.0, (1.3 - min(safety_ratio, 1.3))) + max(0.0, safe_volatility - 0.5)
-        missed_payment_count = int(max(0, min(3, round(risk_pressure * 2.2))))
-        on_time_ratio = max(0.05, min(0.99, 0.97 - (missed_payment_count * 0.14) - (safe_volatility * 0.04)))
-        avg_delay_hours = max(0.0, min(96.0, (safe_volatility * 8.0) + (max(0.0, 1.2 - safety_ratio) * 22.0)))
-        topup_count_last_30d = int(max(0, min(4, round(max(0.0, (1.2 - safety_ratio) * 3.0)))))
-        plan_amount = max(safe_debt_fiat, 100.0)
-        tenure_days = 120
-        installment_amount = max(plan_amount / 4.0, 1.0)
-
-        return RiskFeatureInput(
-            safety_ratio=float(safety_ratio),
-            missed_payment_count=missed_payment_count,
-            on_time_ratio=float(on_time_ratio),
-            avg_delay_hours=float(avg_delay_hours),
-            topup_count_last_30d=topup_count_last_30d,
-            plan_amount=float(plan_amount),
-            tenure_days=tenure_days,
-            installment_amount=float(installment_amount),
+        risk_pressure = np.maximum(0.0, 1.3 - np.minimum(safety_ratio, 1.3)) + np.maximum(0.0, safe_volatility - 0.5)
+        missed_payment_count = np.clip(np.round(risk_pressure * 2.2), 0, 3).astype(np.int64)
+        on_time_ratio = np.clip(0.97 - (missed_payment_count * 0.14) - (safe_volatility * 0.04), 0.05, 0.99)
+        avg_delay_hours = np.clip((safe_volatility * 8.0) + (np.maximum(0.0, 1.2 - safety_ratio) * 22.0), 0.0, 96.0)
+        topup_count_last_30d = np.clip(np.round(np.maximum(0.0, (1.2 - safety_ratio) * 3.0)), 0, 4).astype(np.int64)
+        plan_amount = np.maximum(safe_debt_fiat, 100.0)
+        installment_amount = np.maximum(plan_amount / 4.0, 1.0)
+
+        return parse_risk_feature_rows(
+            [
+                {
+                    "safety_ratio": row[0],
+                    "missed_payment_count": row[1],
+                    "on_time_ratio": row[2],
+                    "avg_delay_hours": row[3],
+                    "topup_count_last_30d": row[4],
+                    "plan_amount": row[5],
+                    "tenure_days": 120,
+                    "installment_amount": row[6],
+                }
+                for row in zip(
+                    safety_ratio.tolist(),
+                    missed_payment_count.tolist(),
+                    on_time_ratio.tolist(),
+                    avg_delay_hours.tolist(),
+                    topup_count_last_30d.tolist(),
+                    plan_amount.tolist(),
+                    installment_amount.tolist(),
+                )
+            ]
         )
 
+    @staticmethod
+    def _normalize_tier(risk_tier: Any) -> str:
+        """Return the upper-case tier name, skipping ``str.upper`` for known spellings."""
+        return _TIER_LOOKUP.get(risk_tier) or str(risk_tier).upper()
+
     @staticmethod
     def _to_liquidation_probability(risk_tier: str, probabilities: Dict[str, float]) -> float:
         """Convert class probabilities from risk-tier model into liquidation probability."""
-        if probabilities:
-            weighted = 0.0
-            total_weight = 0.0
-            for tier, prob in probabilities.items():
-                tier_key = str(tier).upper()
-                tier_base = _TIER_BASE_PROBABILITY.get(tier_key, 0.5)
-                prob_value = max(0.0, min(float(prob), 1.0))
-                weighted += tier_base * prob_value
-                total_weight += prob_value
-            if total_weight > 0.0:
-                value = weighted / total_weight
-                return round(max(0.0, min(value, 1.0)), 6)
-
-        fallback = _TIER_BASE_PROBABILITY.get(risk_tier.upper(), 0.5)
+        probs = np.fromiter(
+            (float(probabilities.get(tier, probabilities.get(lower, 0.0))) for tier, lower in _TIER_KEY_PAIRS),
+            dtype=np.float64,
+            count=len(_TIER_ORDER),
+        )
+        return LiquidationPredictor._blend_tier_probabilities(risk_tier=risk_tier, probs=probs)
+
+    @staticmethod
+    def _blend_tier_probabilities(risk_tier: str, probs: np.ndarray) -> float:
+        """Weight tier base probabilities by a class-probability vector in ``_TIER_ORDER``."""
+        probs = np.clip(np.nan_to_num(probs, nan=0.0), 0.0, 1.0)
+        total_weight = float(probs.sum())
+        if total_weight > 0.0:
+            value = float(np.dot(_TIER_BASE_ARRAY, probs)) / total_weight
+            return round(max(0.0, min(value, 1.0)), 6)
+
+        fallback = _TIER_BASE_PROBABILITY.get(LiquidationPredictor._normalize_tier(risk_tier), 0.5)
         if math.isnan(fallback):
             fallback = 0.5
         return round(max(0.0, min(float(fallback), 1.0)), 6)
 
 
+def _env_number(name: str, default: float) -> float:
+    """Read a positive numeric setting from the environment with a fallback."""
+    raw_value = os.getenv(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        value = float(raw_value)
+    except ValueError:
+        logger.warning("Invalid numeric env value name=%s value=%s; using default=%s", name, raw_value, default)
+        return default
+    return value if value > 0 else default
+
+
+class LiquidationBatchPredictor:
+    """Coalesce concurrent predictions into micro-batches for one model call each.
+
+    Requests are queued with a future; a background task drains up to
+    ``max_batch_size`` rows or waits at most ``max_wait_ms`` after the first
+    row, then scores the whole batch with a single ``predict_proba`` call.
+    """
+
+    def __init__(
+        self,
+        predictor: LiquidationPredictor,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ) -> None:
+        self._predictor = predictor
+        self._max_batch_size = int(
+            max_batch_size
+            or _env_number("PING_MASTERS_RISK_BATCH_MAX_SIZE", DEFAULT_MAX_BATCH_SIZE)
+        )
+        self._max_wait_seconds = (
+            max_wait_ms
+            if max_wait_ms is not None
+            else _env_number("PING_MASTERS_RISK_BATCH_MAX_WAIT_MS", DEFAULT_MAX_WAIT_MS)
+        ) / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(
+        self,
+        collateral_bnb: float,
+        debt_fiat: float,
+        current_price: float,
+        volatility: float,
+    ) -> LiquidationPredictionResult:
+        """Queue one prediction and wait for its batch to be scored."""
+        features = self._predictor._build_features(
+            collateral_bnb=collateral_bnb,
+            debt_fiat=debt_fiat,
+            current_price=current_price,
+            volatility=volatility,
+        )
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._ensure_worker()
+        await self._queue.put((features, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background batching task."""
+        worker = self._worker
+        self._worker = None
+        self._queue = None
+        if worker is None:
+            return
+        if worker.get_loop() is not asyncio.get_running_loop():
+            self._cancel_foreign_worker(worker)
+            return
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+
+    def _ensure_worker(self) -> None:
+        """Start the drain task on the running loop if it is not alive there.
+
+        The queue and worker belong to the loop that created them, so a new loop
+        (a restarted app or a new test client) gets a fresh pair.
+        """
+        loop = asyncio.get_running_loop()
+        worker = self._worker
+        if worker is not None and not worker.done():
+            if worker.get_loop() is loop:
+                return
+            self._cancel_foreign_worker(worker)
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._drain())
+
+    @staticmethod
+    def _cancel_foreign_worker(worker: asyncio.Task) -> None:
+        """Cancel a drain task owned by another loop, if that loop is still open."""
+        worker_loop = worker.get_loop()
+        if not worker_loop.is_closed():
+            worker_loop.call_soon_threadsafe(worker.cancel)
+
+    async def _drain(self) -> None:
+        """Collect queued rows into batches and resolve their futures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[RiskFeatureInput, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait_seconds
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await asyncio.to_thread(
+                    self._predictor.predict_features,
+                    [features for features, _ in batch],
+                )
+            except Exception as exc:
+                logger.exception("Batched liquidation prediction failed batch_size=%d", len(batch))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
 def classify_risk_tier(liquidation_probability: float) -> str:
     """Classify tier for compatibility with older callers."""
     if liquidation_probability < 0.10:
@@ -1,6 +1,13 @@
 """Schema definitions for ML feature input and output."""
 
+from typing import Any, Dict, List, Sequence
+
 from pydantic import BaseModel, Field
+try:
+    from pydantic import ConfigDict, TypeAdapter
+except ImportError:  # pragma: no cover - pydantic v1 fallback
+    ConfigDict = None  # type: ignore
+    TypeAdapter = None  # type: ignore
 
 
 class RiskFeatureInput(BaseModel):
@@ -14,3 +21,30 @@ class RiskFeatureInput(BaseModel):
     plan_amount: float = Field(..., gt=0)
     tenure_days: int = Field(..., gt=0)
     installment_amount: float = Field(..., gt=0)
+
+    if ConfigDict is not None:
+        model_config = ConfigDict(frozen=True)
+    else:
+        class Config:
+            """Pydantic config for pydantic v1 compatibility."""
+
+            allow_mutation = False
+
+
+# Reused adapters keep the compiled core schema warm for hot inference paths.
+RISK_FEATURE_ADAPTER = TypeAdapter(RiskFeatureInput) if TypeAdapter is not None else None
+RISK_FEATURE_LIST_ADAPTER = TypeAdapter(List[RiskFeatureInput]) if TypeAdapter is not None else None
+
+
+def parse_risk_features(payload: Dict[str, Any]) -> RiskFeatureInput:
+    """Validate one feature mapping into ``RiskFeatureInput``."""
+    if RISK_FEATURE_ADAPTER is not None:
+        return RISK_FEATURE_ADAPTER.validate_python(payload)
+    return RiskFeatureInput(**payload)  # pragma: no cover - pydantic v1
+
+
+def parse_risk_feature_rows(rows: Sequence[Dict[str, Any]]) -> List[RiskFeatureInput]:
+    """Validate many feature mappings in one call."""
+    if RISK_FEATURE_LIST_ADAPTER is not None:
+        return RISK_FEATURE_LIST_ADAPTER.validate_python(list(rows))
+    return [RiskFeatureInput(**row) for row in rows]  # pragma: no cover - pydantic v1
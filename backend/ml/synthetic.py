@@ -1,11 +1,17 @@
 """Synthetic data generator for hackathon-friendly risk model training."""
 
 import logging
-from typing import List
+from typing import Any, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+    prange = range
+
 try:
     from common.emi_plan_catalog import get_default_emi_plan_catalog
 except ImportError:  # pragma: no cover - compatibility for script package style imports
@@ -15,13 +21,106 @@ except ImportError:  # pragma: no cover - compatibility for script package style
 logger = logging.getLogger(__name__)
 
 
-def _assign_risk_tier(safety_ratio: float, missed_payment_count: int, avg_delay_hours: float, overdue_now: int) -> str:
-    """Assign risk tier using simple explainable rule logic."""
-    if missed_payment_count >= 1 or overdue_now == 1 or safety_ratio < 1.05:
-        return "HIGH"
-    if 1.05 <= safety_ratio < 1.25 or avg_delay_hours > 6:
-        return "MEDIUM"
-    return "LOW"
+# Tier codes from the label kernels index into this ordered category list.
+_RISK_TIER_LABELS = ["LOW", "MEDIUM", "HIGH"]
+
+
+def _compute_risk_pressure_numpy(
+    safety_ratio: np.ndarray,
+    tenure_days: np.ndarray,
+    installment_amount: np.ndarray,
+    plan_amount: np.ndarray,
+) -> np.ndarray:
+    """Compute clipped risk pressure used to parameterize behavioral draws."""
+    # In-place ufuncs reuse two buffers instead of materializing every temporary.
+    risk_pressure = np.clip(safety_ratio, 0.5, 2.5)
+    np.subtract(1.25, risk_pressure, out=risk_pressure)
+    scratch = np.divide(tenure_days, 180.0)
+    np.add(risk_pressure, scratch, out=risk_pressure)
+    np.maximum(plan_amount, 1.0, out=scratch)
+    np.divide(installment_amount, scratch, out=scratch)
+    np.add(risk_pressure, scratch, out=risk_pressure)
+    return np.clip(risk_pressure, 0.0, 2.0, out=risk_pressure)
+
+
+def _compute_risk_labels_numpy(
+    safety_ratio: np.ndarray,
+    missed_payment_count: np.ndarray,
+    avg_delay_hours: np.ndarray,
+    overdue_now: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Derive on-time ratio and tier codes (0=LOW, 1=MEDIUM, 2=HIGH) with rule logic."""
+    on_time_ratio = np.multiply(missed_payment_count, 0.15)
+    np.add(on_time_ratio, np.divide(avg_delay_hours, 72.0), out=on_time_ratio)
+    np.subtract(1.0, on_time_ratio, out=on_time_ratio)
+    np.clip(on_time_ratio, 0.0, 1.0, out=on_time_ratio)
+    high_mask = (missed_payment_count >= 1) | (overdue_now == 1) | (safety_ratio < 1.05)
+    medium_mask = ((safety_ratio >= 1.05) & (safety_ratio < 1.25)) | (avg_delay_hours > 6)
+    tier_code = np.zeros(safety_ratio.shape[0], dtype=np.int8)
+    tier_code[medium_mask] = 1
+    tier_code[high_mask] = 2
+    return on_time_ratio, tier_code
+
+
+def _compute_risk_pressure_loop(safety_ratio, tenure_days, installment_amount, plan_amount):  # pragma: no cover
+    """Fused single-pass risk pressure kernel compiled by numba."""
+    rows = safety_ratio.shape[0]
+    risk_pressure = np.empty(rows, dtype=np.float64)
+    for i in prange(rows):
+        clipped_ratio = min(max(safety_ratio[i], 0.5), 2.5)
+        pressure = (1.25 - clipped_ratio) + (tenure_days[i] / 180.0) + (installment_amount[i] / max(plan_amount[i], 1.0))
+        risk_pressure[i] = min(max(pressure, 0.0), 2.0)
+    return risk_pressure
+
+
+def _compute_risk_labels_loop(safety_ratio, missed_payment_count, avg_delay_hours, overdue_now):  # pragma: no cover
+    """Fused single-pass on-time ratio and tier-code kernel compiled by numba."""
+    rows = safety_ratio.shape[0]
+    on_time_ratio = np.empty(rows, dtype=np.float64)
+    tier_code = np.empty(rows, dtype=np.int8)
+    for i in prange(rows):
+        ratio = 1.0 - (missed_payment_count[i] * 0.15 + avg_delay_hours[i] / 72.0)
+        on_time_ratio[i] = min(max(ratio, 0.0), 1.0)
+        if missed_payment_count[i] >= 1 or overdue_now[i] == 1 or safety_ratio[i] < 1.05:
+            tier_code[i] = 2
+        elif 1.05 <= safety_ratio[i] < 1.25 or avg_delay_hours[i] > 6:
+            tier_code[i] = 1
+        else:
+            tier_code[i] = 0
+    return on_time_ratio, tier_code
+
+
+if njit is not None:  # pragma: no cover - exercised only when numba is installed
+    _compute_risk_pressure = njit(parallel=True, fastmath=True, cache=True)(_compute_risk_pressure_loop)
+    _compute_risk_labels = njit(parallel=True, fastmath=True, cache=True)(_compute_risk_labels_loop)
+else:
+    _compute_risk_pressure = _compute_risk_pressure_numpy
+    _compute_risk_labels = _compute_risk_labels_numpy
+
+
+def _sample_plans(plans: Sequence[Any], rows: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw plan assignments and principal amounts for every row.
+
+    Principal bounds are computed once per plan and gathered by index, so the
+    draw is one vectorized ``uniform`` call. NumPy consumes the same stream as
+    per-row scalar draws, keeping seeded datasets unchanged.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Selected plan indices and plan amounts.
+    """
+    selected_indices = rng.integers(0, len(plans), size=rows)
+    principal_low = np.array([max(float(plan.principal_min_minor), 1000.0) for plan in plans], dtype=float)
+    principal_high = np.array(
+        [max(float(plan.principal_max_minor), low + 1.0) for plan, low in zip(plans, principal_low)],
+        dtype=float,
+    )
+    plan_amount = rng.uniform(principal_low[selected_indices], principal_high[selected_indices])
+    return selected_indices, plan_amount
+
+
+def _plan_column(plans: Sequence[Any], attribute: str, selected_indices: np.ndarray, dtype: Any) -> np.ndarray:
+    """Gather one plan attribute per row from a per-plan lookup array."""
+    return np.array([getattr(plan, attribute) for plan in plans], dtype=dtype)[selected_indices]
 
 
 def generate_synthetic_risk_dataset(rows: int = 10000, seed: int = 42) -> pd.DataFrame:
@@ -38,22 +137,11 @@ def generate_synthetic_risk_dataset(rows: int = 10000, seed: int = 42) -> pd.Dat
 
     plans = get_default_emi_plan_catalog().list_plan_models(include_disabled=False)
     if plans:
-        selected_indices = rng.integers(0, len(plans), size=rows)
-        selected_plans = [plans[idx] for idx in selected_indices]
-        tenure_days = np.array([plan.tenure_days for plan in selected_plans], dtype=int)
-        installment_count = np.array([plan.installment_count for plan in selected_plans], dtype=int)
-        plan_amount = np.array(
-            [
-                rng.uniform(
-                    max(float(plan.principal_min_minor), 1000.0),
-                    max(float(plan.principal_max_minor), max(float(plan.principal_min_minor), 1000.0) + 1.0),
-                )
-                for plan in selected_plans
-            ],
-            dtype=float,
-        )
-        emi_plan_id = np.array([plan.plan_id for plan in selected_plans], dtype=object)
-        cadence_days = np.array([plan.cadence_days for plan in selected_plans], dtype=int)
+        selected_indices, plan_amount = _sample_plans(plans, rows, rng)
+        tenure_days = _plan_column(plans, "tenure_days", selected_indices, int)
+        installment_count = _plan_column(plans, "installment_count", selected_indices, int)
+        emi_plan_id = _plan_column(plans, "plan_id", selected_indices, object)
+        cadence_days = _plan_column(plans, "cadence_days", selected_indices, int)
     else:
         plan_amount = rng.uniform(1000, 100000, size=rows)
         tenure_days = rng.choice([30, 60, 90, 120, 180], size=rows)
@@ -62,53 +150,53 @@ def generate_synthetic_risk_dataset(rows: int = 10000, seed: int = 42) -> pd.Dat
         cadence_days = np.maximum(1, (tenure_days / np.maximum(installment_count, 1)).astype(int))
     installment_amount = plan_amount / installment_count
 
-    collateral_buffer = rng.uniform(0.8, 1.8, size=rows)
-    outstanding_debt = plan_amount * rng.uniform(0.3, 1.0, size=rows)
-    collateral_value = outstanding_debt * collateral_buffer
-    safety_ratio = collateral_value / np.maximum(outstanding_debt, 1.0)
-
-    risk_pressure = (
-        (1.25 - np.clip(safety_ratio, 0.5, 2.5))
-        + (tenure_days / 180.0)
-        + (installment_amount / np.maximum(plan_amount, 1.0))
+    # Derived arrays are written in place; one scratch buffer carries each draw's parameters.
+    collateral_value = rng.uniform(0.8, 1.8, size=rows)
+    outstanding_debt = rng.uniform(0.3, 1.0, size=rows)
+    np.multiply(plan_amount, outstanding_debt, out=outstanding_debt)
+    np.multiply(outstanding_debt, collateral_value, out=collateral_value)
+    safety_ratio = np.maximum(outstanding_debt, 1.0, out=outstanding_debt)
+    np.divide(collateral_value, safety_ratio, out=safety_ratio)
+
+    risk_pressure = _compute_risk_pressure(
+        np.ascontiguousarray(safety_ratio, dtype=np.float64),
+        np.ascontiguousarray(tenure_days, dtype=np.float64),
+        np.ascontiguousarray(installment_amount, dtype=np.float64),
+        np.ascontiguousarray(plan_amount, dtype=np.float64),
     )
-    risk_pressure = np.clip(risk_pressure, 0.0, 2.0)
-
-    missed_payment_count = rng.binomial(n=3, p=np.clip(risk_pressure / 3.0, 0.01, 0.75), size=rows)
-    avg_delay_hours = rng.gamma(shape=1.5 + risk_pressure, scale=2.0)
-    on_time_ratio = np.clip(1.0 - (missed_payment_count * 0.15 + avg_delay_hours / 72.0), 0.0, 1.0)
-    topup_count_last_30d = rng.binomial(
-        n=4,
-        p=np.clip((1.3 - np.clip(safety_ratio, 0.5, 2.5)) / 2.0, 0.05, 0.8),
-        size=rows,
-    )
-    overdue_now = rng.binomial(n=1, p=np.clip((1.1 - np.clip(safety_ratio, 0.5, 2.5)) / 1.5, 0.01, 0.9), size=rows)
-
-    risk_tier: List[str] = []
-    for i in range(rows):
-        risk_tier.append(
-            _assign_risk_tier(
-                safety_ratio=float(safety_ratio[i]),
-                missed_payment_count=int(missed_payment_count[i]),
-                avg_delay_hours=float(avg_delay_hours[i]),
-                overdue_now=int(overdue_now[i]),
-            )
-        )
-
+    clipped_ratio = np.clip(safety_ratio, 0.5, 2.5, out=collateral_value)
+    scratch = np.empty(rows, dtype=np.float64)
+
+    # RNG draws stay in NumPy so the generated stream matches the seed regardless of numba.
+    np.divide(risk_pressure, 3.0, out=scratch)
+    missed_payment_count = rng.binomial(n=3, p=np.clip(scratch, 0.01, 0.75, out=scratch), size=rows)
+    avg_delay_hours = rng.gamma(shape=np.add(risk_pressure, 1.5, out=scratch), scale=2.0)
+    np.subtract(1.3, clipped_ratio, out=scratch)
+    np.divide(scratch, 2.0, out=scratch)
+    topup_count_last_30d = rng.binomial(n=4, p=np.clip(scratch, 0.05, 0.8, out=scratch), size=rows)
+    np.subtract(1.1, clipped_ratio, out=scratch)
+    np.divide(scratch, 1.5, out=scratch)
+    overdue_now = rng.binomial(n=1, p=np.clip(scratch, 0.01, 0.9, out=scratch), size=rows)
+
+    on_time_ratio, tier_code = _compute_risk_labels(safety_ratio, missed_payment_count, avg_delay_hours, overdue_now)
+    risk_tier = pd.Categorical.from_codes(tier_code, categories=_RISK_TIER_LABELS, ordered=True)
+
+    # Compact dtypes keep numeric blocks small and avoid repeated object strings.
     dataframe = pd.DataFrame(
         {
-            "safety_ratio": safety_ratio,
-            "missed_payment_count": missed_payment_count,
-            "on_time_ratio": on_time_ratio,
-            "avg_delay_hours": avg_delay_hours,
-            "topup_count_last_30d": topup_count_last_30d,
-            "plan_amount": plan_amount,
-            "tenure_days": tenure_days,
-            "installment_amount": installment_amount,
-            "emi_plan_id": emi_plan_id,
-            "cadence_days": cadence_days,
+            "safety_ratio": safety_ratio.astype(np.float32, copy=False),
+            "missed_payment_count": missed_payment_count.astype(np.int16, copy=False),
+            "on_time_ratio": on_time_ratio.astype(np.float32, copy=False),
+            "avg_delay_hours": avg_delay_hours.astype(np.float32, copy=False),
+            "topup_count_last_30d": topup_count_last_30d.astype(np.int16, copy=False),
+            "plan_amount": plan_amount.astype(np.float32, copy=False),
+            "tenure_days": tenure_days.astype(np.int16, copy=False),
+            "installment_amount": installment_amount.astype(np.float32, copy=False),
+            "emi_plan_id": pd.Categorical(emi_plan_id),
+            "cadence_days": cadence_days.astype(np.int16, copy=False),
             "risk_tier": risk_tier,
-        }
+        },
+        copy=False,
     )
     logger.info("Generated synthetic dataset rows=%d", rows)
     return dataframe
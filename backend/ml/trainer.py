@@ -4,14 +4,17 @@ import logging
 from pathlib import Path
 from typing import Dict, List
 
-import joblib
+import numpy as np
 import pandas as pd
+import sklearn
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
+from .artifact_io import dump_artifact
+
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +28,21 @@ FEATURE_COLUMNS: List[str] = [
     "tenure_days",
     "installment_amount",
 ]
+# ``multi_class`` is deprecated from scikit-learn 1.5 (multinomial is the default) and later removed.
+_SKLEARN_NEEDS_MULTI_CLASS = tuple(int(part) for part in sklearn.__version__.split(".")[:2]) < (1, 5)
+
+
+def _build_classifier() -> LogisticRegression:
+    """Build the multinomial saga classifier across scikit-learn versions."""
+    params: Dict[str, object] = {
+        "solver": "saga",
+        "max_iter": 800,
+        "tol": 1e-3,
+        "random_state": 42,
+    }
+    if _SKLEARN_NEEDS_MULTI_CLASS:
+        params["multi_class"] = "multinomial"
+    return LogisticRegression(**params)
 
 
 def train_and_save_model(dataframe: pd.DataFrame, output_path: str) -> Dict[str, str]:
@@ -42,7 +60,7 @@ def train_and_save_model(dataframe: pd.DataFrame, output_path: str) -> Dict[str,
     if missing:
         raise ValueError("Missing required columns: {0}".format(sorted(missing)))
 
-    x = dataframe[FEATURE_COLUMNS].copy()
+    x = dataframe[FEATURE_COLUMNS].astype(np.float32)
     y = dataframe["risk_tier"].copy()
 
     x_train, x_test, y_train, y_test = train_test_split(
@@ -56,14 +74,7 @@ def train_and_save_model(dataframe: pd.DataFrame, output_path: str) -> Dict[str,
     pipeline = Pipeline(
         steps=[
             ("scaler", StandardScaler()),
-            (
-                "model",
-                LogisticRegression(
-                    multi_class="ovr",
-                    max_iter=1200,
-                    random_state=42,
-                ),
-            ),
+            ("model", _build_classifier()),
         ]
     )
     pipeline.fit(x_train, y_train)
@@ -71,16 +82,32 @@ def train_and_save_model(dataframe: pd.DataFrame, output_path: str) -> Dict[str,
     report = classification_report(y_test, y_pred, output_dict=False)
     logger.info("Training complete.\n%s", report)
 
+    # StandardScaler is affine, so fold mean_/scale_ into the linear weights and ship plain arrays.
+    scaler = pipeline.named_steps["scaler"]
+    model = pipeline.named_steps["model"]
+    coef = model.coef_
+    intercept = model.intercept_
+    if coef.shape[0] == 1:
+        # Binary fits keep one weight row for the positive class. Split it as -w/2 and +w/2 so the
+        # scorer's softmax over two rows equals the sigmoid and both classes get explanations.
+        coef = np.vstack([-coef / 2.0, coef / 2.0])
+        intercept = np.concatenate([-intercept / 2.0, intercept / 2.0])
+    baked_coef = coef / scaler.scale_
+    baked_intercept = intercept - (coef * (scaler.mean_ / scaler.scale_)).sum(axis=1)
+
     artifact = {
-        "pipeline": pipeline,
+        "coef": baked_coef.astype(np.float32),
+        "intercept": baked_intercept.astype(np.float32),
+        "feature_means": scaler.mean_.astype(np.float32),
+        "classes": [str(label) for label in model.classes_],
         "feature_columns": FEATURE_COLUMNS,
-        "model_name": "logistic_regression_ovr",
-        "version": "v1",
+        "model_name": "logistic_regression_multinomial",
+        "version": "v2",
     }
 
     model_path = Path(output_path)
     model_path.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(artifact, model_path)
+    dump_artifact(artifact, model_path)
     logger.info("Model artifact saved at %s", model_path)
 
     return {
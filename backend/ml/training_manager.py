@@ -1,11 +1,15 @@
 """Management utilities for ML dataset generation, training, and runtime reload."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
+from .dataset_io import COLUMNAR_SUFFIXES, read_dataset, write_dataset
 from .default_inference import DefaultPredictionInferenceService
 from .default_synthetic import generate_synthetic_default_dataset
 from .default_trainer import FEATURE_COLUMNS as DEFAULT_FEATURE_COLUMNS
@@ -15,6 +19,7 @@ from .deposit_synthetic import generate_synthetic_deposit_dataset
 from .deposit_trainer import FEATURE_COLUMNS as DEPOSIT_FEATURE_COLUMNS
 from .deposit_trainer import train_and_save_deposit_model
 from .inference import RiskModelInferenceService
+from .predictor import LiquidationPredictor
 from .synthetic import generate_synthetic_risk_dataset
 from .trainer import FEATURE_COLUMNS as RISK_FEATURE_COLUMNS
 from .trainer import train_and_save_model
@@ -28,6 +33,63 @@ from .training_schema import (
 
 logger = logging.getLogger(__name__)
 
+_CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+# Money columns stay float64 so rupee amounts keep full precision; ratios and counts use narrow types.
+_RISK_DTYPES: Dict[str, str] = {
+    "safety_ratio": "float32",
+    "missed_payment_count": "int16",
+    "on_time_ratio": "float32",
+    "avg_delay_hours": "float32",
+    "topup_count_last_30d": "int16",
+    "plan_amount": "float64",
+    "tenure_days": "int16",
+    "installment_amount": "float64",
+    "risk_tier": "category",
+}
+_DEFAULT_DTYPES: Dict[str, str] = {
+    "on_time_ratio": "float32",
+    "missed_count_90d": "int16",
+    "max_days_late_180d": "float32",
+    "avg_days_late": "float32",
+    "days_since_last_late": "float32",
+    "consecutive_on_time_count": "int16",
+    "plan_amount": "float64",
+    "tenure_days": "int16",
+    "installment_amount": "float64",
+    "installment_number": "int16",
+    "days_until_due": "float32",
+    "current_safety_ratio": "float32",
+    "distance_to_liquidation_threshold": "float32",
+    "collateral_type": "category",
+    "collateral_volatility_bucket": "category",
+    "topup_count_30d": "int16",
+    "topup_recency_days": "float32",
+    "opened_app_last_7d": "int8",
+    "clicked_pay_now_last_7d": "int8",
+    "payment_attempt_failed_count": "int16",
+    "wallet_age_days": "float32",
+    "tx_count_30d": "int16",
+    "stablecoin_balance_bucket": "category",
+    "y_miss_next": "int8",
+}
+_DEPOSIT_DTYPES: Dict[str, str] = {
+    "plan_amount_inr": "float64",
+    "tenure_days": "int16",
+    "risk_tier": "category",
+    "collateral_type": "category",
+    "locked_token": "float32",
+    "price_inr": "float64",
+    "stress_drop_pct": "float32",
+    "fees_buffer_pct": "float32",
+    "outstanding_debt_inr": "float64",
+    "required_collateral_inr": "float64",
+}
+_DTYPES_BY_MODEL: Dict[str, Dict[str, str]] = {
+    "risk": _RISK_DTYPES,
+    "default": _DEFAULT_DTYPES,
+    "deposit": _DEPOSIT_DTYPES,
+}
+
 
 class MlModelManagementService:
     """Service for managing ML data and model lifecycle operations."""
@@ -58,6 +120,8 @@ class MlModelManagementService:
             "default": "backend/ml/artifacts/default_training_data.csv",
             "deposit": "backend/ml/artifacts/deposit_training_data.csv",
         }
+        # One worker per model type; NumPy RNG and sklearn BLAS release the GIL so jobs overlap.
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="ml-gen")
 
     def get_training_specs(self) -> Dict[str, Any]:
         """Return model feature/label requirements and runtime configuration."""
@@ -120,25 +184,7 @@ class MlModelManagementService:
     def generate_dataset(self, request: MlGenerateDatasetRequest) -> Dict[str, Any]:
         """Generate synthetic dataset for a target model type and persist CSV."""
         try:
-            dataset_path = Path(request.output_path or self._dataset_paths[request.model_type])
-            dataset_path.parent.mkdir(parents=True, exist_ok=True)
-
-            generator: Callable[[int, int], pd.DataFrame]
-            if request.model_type == "risk":
-                generator = generate_synthetic_risk_dataset
-            elif request.model_type == "default":
-                generator = generate_synthetic_default_dataset
-            else:
-                generator = generate_synthetic_deposit_dataset
-
-            dataframe = generator(rows=request.rows, seed=request.seed)
-            dataframe.to_csv(dataset_path, index=False)
-            logger.info(
-                "Generated dataset model_type=%s rows=%d output_path=%s",
-                request.model_type,
-                len(dataframe),
-                dataset_path,
-            )
+            dataframe, dataset_path = self._generate_dataframe(request)
             return {
                 "model_type": request.model_type,
                 "rows": int(len(dataframe)),
@@ -148,6 +194,22 @@ class MlModelManagementService:
             logger.exception("Dataset generation failed request=%s", request.dict())
             raise
 
+    def generate_all_datasets(self, requests: Sequence[MlGenerateDatasetRequest]) -> List[Dict[str, Any]]:
+        """Generate several datasets concurrently, returning summaries in request order."""
+        try:
+            return list(self._executor.map(self.generate_dataset, requests))
+        except Exception:
+            logger.exception("Concurrent dataset generation failed count=%d", len(requests))
+            raise
+
+    def train_models(self, requests: Sequence[MlTrainModelRequest]) -> List[Dict[str, Any]]:
+        """Train several models concurrently, returning results in request order."""
+        try:
+            return list(self._executor.map(self.train_model, requests))
+        except Exception:
+            logger.exception("Concurrent model training failed count=%d", len(requests))
+            raise
+
     def train_model(self, request: MlTrainModelRequest) -> Dict[str, Any]:
         """Train selected model from dataset file or synthetic generation."""
         try:
@@ -219,38 +281,45 @@ class MlModelManagementService:
             results: Dict[str, Any] = {}
 
             if request.reload_risk:
-                self._risk_model_path = request.risk_model_path or self._risk_model_path
+                risk_path = request.risk_model_path or self._risk_model_path
                 if self._risk_inference is None:
                     results["risk"] = {"reloaded": False, "reason": "risk inference service unavailable"}
                 else:
-                    self._risk_inference.reload(self._risk_model_path)
-                    results["risk"] = {
-                        "reloaded": bool(self._risk_inference.is_loaded),
-                        "path": self._risk_model_path,
-                    }
+                    reloaded = bool(self._risk_inference.reload(risk_path))
+                    results["risk"] = {"reloaded": reloaded, "path": risk_path}
+                    if reloaded:
+                        self._risk_model_path = risk_path
+                        LiquidationPredictor.invalidate_cache()
+                    else:
+                        results["risk"]["active_path"] = self._risk_model_path
 
             if request.reload_default:
-                self._default_model_path = request.default_model_path or self._default_model_path
+                default_path = request.default_model_path or self._default_model_path
                 if self._default_inference is None:
                     results["default"] = {"reloaded": False, "reason": "default inference service unavailable"}
                 else:
-                    self._default_inference.reload(self._default_model_path)
+                    reloaded = bool(self._default_inference.reload(default_path))
                     results["default"] = {
-                        "reloaded": bool(self._default_inference.is_loaded),
-                        "path": self._default_model_path,
+                        "reloaded": reloaded,
+                        "path": default_path,
                         "thresholds": self._default_inference.thresholds,
                     }
+                    if reloaded:
+                        self._default_model_path = default_path
+                    else:
+                        results["default"]["active_path"] = self._default_model_path
 
             if request.reload_deposit:
-                self._deposit_model_path = request.deposit_model_path or self._deposit_model_path
+                deposit_path = request.deposit_model_path or self._deposit_model_path
                 if self._deposit_inference is None:
                     results["deposit"] = {"reloaded": False, "reason": "deposit inference service unavailable"}
                 else:
-                    self._deposit_inference.reload(self._deposit_model_path)
-                    results["deposit"] = {
-                        "reloaded": bool(self._deposit_inference.is_loaded),
-                        "path": self._deposit_model_path,
-                    }
+                    reloaded = bool(self._deposit_inference.reload(deposit_path))
+                    results["deposit"] = {"reloaded": reloaded, "path": deposit_path}
+                    if reloaded:
+                        self._deposit_model_path = deposit_path
+                    else:
+                        results["deposit"]["active_path"] = self._deposit_model_path
 
             logger.info("Reload models result=%s", results)
             return {"results": results, "runtime": self.get_runtime_status()}
@@ -258,6 +327,14 @@ class MlModelManagementService:
             logger.exception("Model reload failed request=%s", request.dict())
             raise
 
+    async def reload_models_async(self, request: MlReloadModelsRequest) -> Dict[str, Any]:
+        """Reload model artifacts on a worker thread without blocking the event loop.
+
+        Each inference service loads into a shadow buffer and swaps atomically,
+        so predictions keep serving the previous artifact until the swap.
+        """
+        return await asyncio.to_thread(self.reload_models, request)
+
     def update_default_thresholds(self, request: MlUpdateDefaultThresholdRequest) -> Dict[str, Any]:
         """Update runtime thresholds for default prediction tiers."""
         try:
@@ -293,7 +370,7 @@ class MlModelManagementService:
                 data_path = Path(request.data_path)
                 if data_path.exists():
                     logger.info("Loading training data from file path=%s", data_path)
-                    dataframe = pd.read_csv(data_path)
+                    dataframe = self._read_training_csv(data_path=data_path, model_type=request.model_type)
                     return self._normalize_training_dataframe(
                         dataframe=dataframe,
                         model_type=request.model_type,
@@ -305,7 +382,8 @@ class MlModelManagementService:
                     data_path,
                 )
 
-            generator = self.generate_dataset(
+            # Persist the generated CSV for reproducibility but train on the in-memory frame.
+            dataframe, _ = self._generate_dataframe(
                 MlGenerateDatasetRequest(
                     model_type=request.model_type,
                     rows=request.rows,
@@ -313,8 +391,6 @@ class MlModelManagementService:
                     output_path=self._dataset_paths[request.model_type],
                 )
             )
-            generated_path = Path(generator["output_path"])
-            dataframe = pd.read_csv(generated_path)
             return self._normalize_training_dataframe(
                 dataframe=dataframe,
                 model_type=request.model_type,
@@ -323,6 +399,50 @@ class MlModelManagementService:
             logger.exception("Failed preparing training dataframe request=%s", request.dict())
             raise
 
+    def _generate_dataframe(self, request: MlGenerateDatasetRequest) -> Tuple[pd.DataFrame, Path]:
+        """Generate a synthetic dataframe, write it in the format its path suffix names, and return both."""
+        dataset_path = Path(request.output_path or self._dataset_paths[request.model_type])
+
+        generator: Callable[[int, int], pd.DataFrame]
+        if request.model_type == "risk":
+            generator = generate_synthetic_risk_dataset
+        elif request.model_type == "default":
+            generator = generate_synthetic_default_dataset
+        else:
+            generator = generate_synthetic_deposit_dataset
+
+        dataframe = generator(rows=request.rows, seed=request.seed)
+        # Match _read_training_csv, which reads .parquet/.feather paths as columnar files.
+        write_dataset(dataframe, dataset_path)
+        logger.info(
+            "Generated dataset model_type=%s rows=%d output_path=%s",
+            request.model_type,
+            len(dataframe),
+            dataset_path,
+        )
+        return dataframe, dataset_path
+
+    @staticmethod
+    def _read_training_csv(data_path: Path, model_type: str) -> pd.DataFrame:
+        """Read a training CSV with compact, pre-declared column dtypes."""
+        if data_path.suffix.lower() in COLUMNAR_SUFFIXES:
+            # Columnar files already carry their dtypes.
+            return read_dataset(data_path)
+        header = pd.read_csv(data_path, nrows=0).columns
+        dtypes = {
+            column: dtype
+            for column, dtype in _DTYPES_BY_MODEL.get(model_type, {}).items()
+            if column in header
+        }
+        parse_dates = ["due_at"] if model_type == "default" and "due_at" in header else None
+        try:
+            return pd.read_csv(data_path, engine=_CSV_ENGINE, dtype=dtypes, parse_dates=parse_dates)
+        except ValueError:
+            # Fixed-width integer dtypes reject empty cells; let those columns be inferred instead.
+            logger.warning("Integer dtypes rejected %s; re-reading with inferred integer columns.", data_path)
+            dtypes = {column: dtype for column, dtype in dtypes.items() if not dtype.startswith("int")}
+            return pd.read_csv(data_path, engine=_CSV_ENGINE, dtype=dtypes, parse_dates=parse_dates)
+
     def _get_default_model_output_path(self, model_type: str) -> str:
         """Resolve default artifact output path for model type."""
         if model_type == "risk":
@@ -334,11 +454,14 @@ class MlModelManagementService:
     def _normalize_training_dataframe(self, dataframe: pd.DataFrame, model_type: str) -> pd.DataFrame:
         """Normalize training dataframe dtypes required by model trainer."""
         try:
-            normalized = dataframe.copy()
-            if model_type == "default" and "due_at" in normalized.columns:
-                normalized["due_at"] = pd.to_datetime(normalized["due_at"], errors="coerce", utc=True)
-                normalized = normalized.dropna(subset=["due_at"]).reset_index(drop=True)
-            return normalized
+            if model_type == "default" and "due_at" in dataframe.columns:
+                return (
+                    dataframe.assign(due_at=pd.to_datetime(dataframe["due_at"], errors="coerce", utc=True))
+                    .dropna(subset=["due_at"])
+                    .reset_index(drop=True)
+                )
+            # Trainers select feature columns into new frames, so the input is never mutated.
+            return dataframe
         except Exception:
             logger.exception("Failed normalizing training dataframe model_type=%s", model_type)
             raise
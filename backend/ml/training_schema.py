@@ -2,33 +2,46 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, root_validator, validator
 
 
-SUPPORTED_MODEL_TYPES = {"risk", "default", "deposit"}
+SUPPORTED_MODEL_TYPES = frozenset({"risk", "default", "deposit"})
+
+
+def _normalize_model_type(value: str) -> str:
+    """Normalize and validate a target model type."""
+    if value in SUPPORTED_MODEL_TYPES:
+        return value
+    normalized = value.strip().lower()
+    if normalized not in SUPPORTED_MODEL_TYPES:
+        raise ValueError("model_type must be one of: risk, default, deposit")
+    return normalized
+
+
+def _check_threshold_order(values: dict) -> dict:
+    """Ensure medium threshold is lower than high threshold when both are provided."""
+    medium_threshold = values.get("medium_threshold")
+    high_threshold = values.get("high_threshold")
+    if medium_threshold is not None and high_threshold is not None and medium_threshold >= high_threshold:
+        raise ValueError("medium_threshold must be less than high_threshold")
+    return values
 
 
 class MlGenerateDatasetRequest(BaseModel):
     """Request payload for synthetic dataset generation."""
 
-    model_type: str = Field(..., min_length=4)
+    model_type: str = Field(...)
     rows: int = Field(default=10000, gt=100, le=500000)
     seed: int = Field(default=42, ge=0)
     output_path: Optional[str] = Field(default=None, min_length=5)
 
-    @validator("model_type")
-    def _validate_model_type(cls, value: str) -> str:
-        """Validate target model type."""
-        normalized = value.strip().lower()
-        if normalized not in SUPPORTED_MODEL_TYPES:
-            raise ValueError("model_type must be one of: risk, default, deposit")
-        return normalized
+    _validate_model_type = validator("model_type", allow_reuse=True)(_normalize_model_type)
 
 
 class MlTrainModelRequest(BaseModel):
     """Request payload for model training operations."""
 
-    model_type: str = Field(..., min_length=4)
+    model_type: str = Field(...)
     data_path: Optional[str] = Field(default=None, min_length=5)
     rows: int = Field(default=10000, gt=100, le=500000)
     seed: int = Field(default=42, ge=0)
@@ -38,21 +51,9 @@ class MlTrainModelRequest(BaseModel):
     high_threshold: Optional[float] = Field(default=None, gt=0.0, lt=1.0)
     medium_threshold: Optional[float] = Field(default=None, gt=0.0, lt=1.0)
 
-    @validator("model_type")
-    def _validate_model_type(cls, value: str) -> str:
-        """Validate target model type."""
-        normalized = value.strip().lower()
-        if normalized not in SUPPORTED_MODEL_TYPES:
-            raise ValueError("model_type must be one of: risk, default, deposit")
-        return normalized
+    _validate_model_type = validator("model_type", allow_reuse=True)(_normalize_model_type)
 
-    @validator("medium_threshold")
-    def _validate_threshold_pair(cls, medium_threshold: Optional[float], values: dict) -> Optional[float]:
-        """Ensure medium threshold is lower than high threshold when both are provided."""
-        high_threshold = values.get("high_threshold")
-        if medium_threshold is not None and high_threshold is not None and medium_threshold >= high_threshold:
-            raise ValueError("medium_threshold must be less than high_threshold")
-        return medium_threshold
+    _validate_threshold_pair = root_validator(skip_on_failure=True, allow_reuse=True)(_check_threshold_order)
 
 
 class MlUpdateDefaultThresholdRequest(BaseModel):
@@ -61,13 +62,7 @@ class MlUpdateDefaultThresholdRequest(BaseModel):
     high_threshold: float = Field(..., gt=0.0, lt=1.0)
     medium_threshold: float = Field(..., gt=0.0, lt=1.0)
 
-    @validator("medium_threshold")
-    def _validate_pair(cls, medium_threshold: float, values: dict) -> float:
-        """Validate ordering against high threshold."""
-        high_threshold = values.get("high_threshold")
-        if high_threshold is not None and medium_threshold >= high_threshold:
-            raise ValueError("medium_threshold must be less than high_threshold")
-        return medium_threshold
+    _validate_pair = root_validator(skip_on_failure=True, allow_reuse=True)(_check_threshold_order)
 
 
 class MlReloadModelsRequest(BaseModel):
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple, Union, get_args, get_origin
 
 from pydantic import BaseModel, Field
 try:
@@ -10,6 +10,7 @@ try:
 except ImportError:  # pragma: no cover - pydantic v1 fallback
     ConfigDict = None  # type: ignore
 
+from .enums import StringEnum
 from .exceptions import ModelValidationError
 
 
@@ -18,10 +19,32 @@ logger = logging.getLogger(__name__)
 Money = int
 PercentageBps = int
 
+# Resolved once at import so serialization does not probe the pydantic API per call.
+_PYDANTIC_V2 = hasattr(BaseModel, "model_dump")
+
+# Per model class: (enum-typed field name, value-to-member map) pairs, built once per class.
+_ENUM_FIELD_MAPS: Dict[type, Tuple[Tuple[str, Mapping[Any, StringEnum]], ...]] = {}
+
+
+def _enum_type(annotation: Any) -> Optional[type]:
+    """Return the StringEnum type behind a field annotation, unwrapping ``Optional``."""
+    if get_origin(annotation) is Union:
+        for arg in get_args(annotation):
+            if isinstance(arg, type) and issubclass(arg, StringEnum):
+                return arg
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, StringEnum):
+        return annotation
+    return None
+
+
+_UTC = timezone.utc
+_now = datetime.now
+
 
 def utc_now() -> datetime:
     """Return current UTC timestamp."""
-    return datetime.now(timezone.utc)
+    return _now(_UTC)
 
 
 class BaseDocumentModel(BaseModel):
@@ -47,6 +70,12 @@ class BaseDocumentModel(BaseModel):
             validate_assignment = True
             use_enum_values = False
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute field introspection once the subclass fields are complete."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._enum_field_maps()
+
     def to_firestore(self) -> Dict[str, Any]:
         """Serialize model into a Firestore-ready document dictionary.
 
@@ -57,8 +86,9 @@ class BaseDocumentModel(BaseModel):
             ModelValidationError: If serialization fails.
         """
         try:
-            if hasattr(self, "model_dump"):
-                payload = self.model_dump(exclude_none=True)  # pydantic v2
+            if _PYDANTIC_V2:
+                # Call the compiled core serializer directly; model_dump only adds argument plumbing.
+                payload = self.__pydantic_serializer__.to_python(self, exclude_none=True)
             else:
                 payload = self.dict(exclude_none=True)  # pydantic v1
             return payload
@@ -66,6 +96,23 @@ class BaseDocumentModel(BaseModel):
             logger.exception("Failed to serialize %s with id=%s", self.__class__.__name__, self.id)
             raise ModelValidationError(str(exc))
 
+    def to_firestore_bytes(self) -> bytes:
+        """Serialize model into UTF-8 JSON bytes in one pass, without an intermediate dict.
+
+        Returns:
+            bytes: JSON-encoded model payload with ``None`` fields omitted.
+
+        Raises:
+            ModelValidationError: If serialization fails.
+        """
+        try:
+            if _PYDANTIC_V2:
+                return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+            return self.json(exclude_none=True).encode("utf-8")  # pydantic v1
+        except Exception as exc:
+            logger.exception("Failed to encode %s with id=%s", self.__class__.__name__, self.id)
+            raise ModelValidationError(str(exc))
+
     @classmethod
     def from_firestore(cls, data: Dict[str, Any], doc_id: Optional[str] = None) -> "BaseDocumentModel":
         """Create model instance from Firestore document data.
@@ -88,3 +135,51 @@ class BaseDocumentModel(BaseModel):
         except Exception as exc:
             logger.exception("Failed to parse Firestore payload for %s doc_id=%s", cls.__name__, doc_id)
             raise ModelValidationError(str(exc))
+
+    @classmethod
+    def from_firestore_trusted(cls, data: Dict[str, Any], doc_id: Optional[str] = None) -> "BaseDocumentModel":
+        """Build model instance from trusted Firestore data without re-validation.
+
+        Use only for documents this service wrote through ``to_firestore`` and
+        reads back for display. Enum fields are resolved through cached
+        value maps; every other value is stored as-is. Use ``from_firestore``
+        for ingestion paths or when the result will be mutated and persisted
+        again.
+
+        Args:
+            data: Firestore document payload.
+            doc_id: Optional Firestore document id.
+
+        Returns:
+            BaseDocumentModel: Domain instance built via ``model_construct``.
+        """
+        payload = dict(data)
+        if doc_id is not None and "id" not in payload:
+            payload["id"] = doc_id
+        for field_name, members in cls._enum_field_maps():
+            raw_value = payload.get(field_name)
+            if raw_value is not None:
+                payload[field_name] = members.get(raw_value, raw_value)
+        if _PYDANTIC_V2:
+            return cls.model_construct(**payload)
+        return cls.construct(**payload)  # pydantic v1
+
+    @classmethod
+    def _enum_field_maps(cls) -> Tuple[Tuple[str, Mapping[Any, StringEnum]], ...]:
+        """Return cached ``(field_name, value_map)`` pairs for enum-typed fields.
+
+        Built at class creation on pydantic v2 and on first use on v1, so the
+        trusted read path only iterates a precomputed tuple.
+        """
+        maps = _ENUM_FIELD_MAPS.get(cls)
+        if maps is None:
+            fields = cls.model_fields if _PYDANTIC_V2 else cls.__fields__
+            pairs = []
+            for field_name, field in fields.items():
+                annotation = field.annotation if _PYDANTIC_V2 else field.outer_type_
+                enum_type = _enum_type(annotation)
+                if enum_type is not None:
+                    pairs.append((field_name, enum_type.value_map()))
+            maps = tuple(pairs)
+            _ENUM_FIELD_MAPS[cls] = maps
+        return maps
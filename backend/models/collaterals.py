@@ -42,16 +42,12 @@ class CollateralModel(BaseDocumentModel):
     @root_validator(skip_on_failure=True)
     def _validate_recovery(cls, values: dict) -> dict:
         """Ensure recovered collateral does not exceed recoverable amount."""
-        try:
-            recoverable_minor = int(values.get("recoverable_minor", 0))
-            recovered_minor = int(values.get("recovered_minor", 0))
-            if recovered_minor > recoverable_minor:
-                raise ValueError("recovered_minor cannot exceed recoverable_minor")
-            return values
-        except Exception:
-            logger.exception(
-                "Collateral validation failed collateral_id=%s loan_id=%s",
-                values.get("collateral_id"),
-                values.get("loan_id"),
-            )
-            raise
+        if values["recovered_minor"] > values["recoverable_minor"]:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Collateral validation failed collateral_id=%s loan_id=%s",
+                    values.get("collateral_id"),
+                    values.get("loan_id"),
+                )
+            raise ValueError("recovered_minor cannot exceed recoverable_minor")
+        return values
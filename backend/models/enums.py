@@ -1,11 +1,21 @@
 """Reusable enums for BNPL domain models."""
 
 from enum import Enum
+from typing import Any, Mapping
 
 
 class StringEnum(str, Enum):
     """Base enum class with string behavior for JSON serialization."""
 
+    @classmethod
+    def value_map(cls) -> Mapping[Any, "StringEnum"]:
+        """Return the value-to-member mapping for direct dict lookups.
+
+        Deserialization paths can resolve raw values with one ``dict.get``
+        instead of going through ``EnumMeta.__call__``.
+        """
+        return cls._value2member_map_
+
 
 class UserStatus(StringEnum):
     """User account lifecycle states."""
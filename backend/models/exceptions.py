@@ -4,14 +4,22 @@
 class ModelError(Exception):
     """Base class for model-related failures."""
 
+    __slots__ = ()
+
 
 class ModelValidationError(ModelError):
     """Raised when model data fails custom business validation."""
 
+    __slots__ = ()
+
 
 class ModelNotFoundError(ModelError):
     """Raised when a requested document does not exist."""
 
+    __slots__ = ()
+
 
 class VersionConflictError(ModelError):
     """Raised when optimistic concurrency version checks fail."""
+
+    __slots__ = ()
@@ -34,7 +34,7 @@ class InstallmentModel(BaseDocumentModel):
     late_fee_minor: Money = Field(default=0, ge=0)
     missed_reason: Optional[str] = Field(default=None)
 
-    calculation_trace: Dict[str, str] = Field(default_factory=dict)
+    calculation_trace: Optional[Dict[str, str]] = Field(default=None)
 
     @classmethod
     def validate_schedule(cls, installments: List["InstallmentModel"], expected_total_minor: Money) -> None:
@@ -51,16 +51,28 @@ class InstallmentModel(BaseDocumentModel):
             if not installments:
                 raise ModelValidationError("Installment schedule cannot be empty")
 
-            ordered = sorted(installments, key=lambda item: item.sequence_no)
-            for index, installment in enumerate(ordered, start=1):
+            # Single pass for the common already-ordered schedule; sort only when it is not.
+            total_minor = 0
+            in_order = True
+            for index, installment in enumerate(installments, start=1):
                 if installment.sequence_no != index:
-                    raise ModelValidationError("Installment sequence numbers must be continuous from 1")
+                    in_order = False
+                    break
+                total_minor += installment.amount_minor
+
+            if not in_order:
+                total_minor = 0
+                ordered = sorted(installments, key=lambda item: item.sequence_no)
+                for index, installment in enumerate(ordered, start=1):
+                    if installment.sequence_no != index:
+                        raise ModelValidationError("Installment sequence numbers must be continuous from 1")
+                    total_minor += installment.amount_minor
 
-            total_minor = sum(item.amount_minor for item in ordered)
             if total_minor != expected_total_minor:
                 raise ModelValidationError("Installment sum does not match expected total")
         except ModelValidationError:
             raise
         except Exception as exc:
-            logger.exception("Failed schedule validation for installments.")
-            raise ModelValidationError(str(exc))
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception("Failed schedule validation for installments.")
+            raise ModelValidationError(str(exc)) from exc
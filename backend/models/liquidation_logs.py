@@ -42,27 +42,22 @@ class LiquidationLogModel(BaseDocumentModel):
     @root_validator(skip_on_failure=True)
     def _validate_recovery_math(cls, values: dict) -> dict:
         """Validate recovery constraints for partial/full liquidation events."""
-        try:
-            seized_minor = int(values.get("seized_minor", 0))
-            needed_minor = int(values.get("needed_minor", 0))
-            returned_minor = int(values.get("returned_minor", 0))
-            missed_amount_minor = int(values.get("missed_amount_minor", 0))
-            penalty_minor = int(values.get("penalty_minor", 0))
-
-            if seized_minor > needed_minor:
-                raise ValueError("seized_minor cannot exceed needed_minor")
-
-            if needed_minor < missed_amount_minor + penalty_minor:
-                raise ValueError("needed_minor must cover missed_amount_minor + penalty_minor")
-
-            if returned_minor < 0:
-                raise ValueError("returned_minor cannot be negative")
-
-            return values
-        except Exception:
-            logger.exception(
-                "Liquidation validation failed log_id=%s loan_id=%s",
-                values.get("log_id"),
-                values.get("loan_id"),
-            )
-            raise
+        needed_minor = values["needed_minor"]
+        error = None
+        if values["seized_minor"] > needed_minor:
+            error = "seized_minor cannot exceed needed_minor"
+        elif needed_minor < values["missed_amount_minor"] + values["penalty_minor"]:
+            error = "needed_minor must cover missed_amount_minor + penalty_minor"
+        elif values["returned_minor"] < 0:
+            error = "returned_minor cannot be negative"
+
+        if error is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Liquidation validation failed log_id=%s loan_id=%s reason=%s",
+                    values.get("log_id"),
+                    values.get("loan_id"),
+                    error,
+                )
+            raise ValueError(error)
+        return values
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 import logging
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from pydantic import Field, root_validator, validator
 
@@ -31,7 +31,7 @@ class LoanModel(BaseDocumentModel):
     liquidation_threshold_bps: PercentageBps = Field(..., ge=0, le=10000)
 
     schedule_hash: Optional[str] = Field(default=None)
-    installment_ids: List[str] = Field(default_factory=list)
+    installment_ids: Tuple[str, ...] = Field(default=())
     emi_plan_id: Optional[str] = Field(default=None, min_length=3)
     emi_plan_name: Optional[str] = Field(default=None)
     emi_source_platform: Optional[str] = Field(default=None)
@@ -51,38 +51,28 @@ class LoanModel(BaseDocumentModel):
     @validator("currency")
     def _uppercase_currency(cls, value: str) -> str:
         """Force ISO-like uppercase currency formatting."""
-        try:
-            return value.upper()
-        except Exception:
-            logger.exception("Failed to normalize currency value=%s", value)
+        if value.isascii() and value.isupper():
             return value
+        return value.upper()
 
     @root_validator(skip_on_failure=True)
     def _validate_business_rules(cls, values: dict) -> dict:
         """Validate loan policy and balance rules."""
-        try:
-            danger_limit_bps = int(values.get("danger_limit_bps", 0))
-            liquidation_threshold_bps = int(values.get("liquidation_threshold_bps", 0))
-            outstanding_minor = int(values.get("outstanding_minor", 0))
-            principal_minor = int(values.get("principal_minor", 0))
-            penalty_accrued_minor = int(values.get("penalty_accrued_minor", 0))
-            status = values.get("status")
-            paused_penalties_until = values.get("paused_penalties_until")
-
-            if danger_limit_bps >= liquidation_threshold_bps:
-                raise ValueError("danger_limit_bps must be lower than liquidation_threshold_bps")
-
-            if outstanding_minor > principal_minor + penalty_accrued_minor:
-                raise ValueError("outstanding_minor exceeds principal + penalty_accrued_minor")
-
-            if status == LoanStatus.DISPUTE_OPEN and paused_penalties_until is None:
-                raise ValueError("paused_penalties_until is required when status is DISPUTE_OPEN")
-
-            return values
-        except Exception:
-            logger.exception(
-                "Loan validation failed loan_id=%s user_id=%s",
-                values.get("loan_id"),
-                values.get("user_id"),
-            )
-            raise
+        error = None
+        if values["danger_limit_bps"] >= values["liquidation_threshold_bps"]:
+            error = "danger_limit_bps must be lower than liquidation_threshold_bps"
+        elif values["outstanding_minor"] > values["principal_minor"] + values["penalty_accrued_minor"]:
+            error = "outstanding_minor exceeds principal + penalty_accrued_minor"
+        elif values["status"] == LoanStatus.DISPUTE_OPEN and values["paused_penalties_until"] is None:
+            error = "paused_penalties_until is required when status is DISPUTE_OPEN"
+
+        if error is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Loan validation failed loan_id=%s user_id=%s reason=%s",
+                    values.get("loan_id"),
+                    values.get("user_id"),
+                    error,
+                )
+            raise ValueError(error)
+        return values
@@ -1,9 +1,8 @@
 """Repository interfaces for datastore-agnostic model access."""
 
-from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
-from typing import List, Optional
+from typing import List, Optional, Protocol
 
 from pydantic import ValidationError
 
@@ -19,34 +18,32 @@ from .users import UserModel
 logger = logging.getLogger(__name__)
 
 
-class BaseRepository(ABC):
-    """Common contract for CRUD and soft-delete operations."""
+class BaseRepository(Protocol):
+    """Common contract for CRUD and soft-delete operations.
+
+    Repositories are structural protocols: implementations satisfy them by
+    shape for static type checking and need not inherit from them.
+    """
 
-    @abstractmethod
     def create(self, model):
         """Persist a new model."""
 
-    @abstractmethod
     def get_by_id(self, model_id: str):
         """Return model by identifier."""
 
-    @abstractmethod
     def update(self, model):
         """Update existing model with optimistic version check."""
 
-    @abstractmethod
     def soft_delete(self, model_id: str) -> None:
         """Mark a model as deleted."""
 
 
-class UserRepository(BaseRepository):
+class UserRepository(BaseRepository, Protocol):
     """User data access abstraction."""
 
-    @abstractmethod
     def create(self, model: UserModel) -> UserModel:
         """Persist a new user model."""
 
-    @abstractmethod
     def get_by_id(self, model_id: str) -> UserModel:
         """Fetch a user by identifier.
 
@@ -55,7 +52,13 @@ class UserRepository(BaseRepository):
             ValidationError: If payload is malformed.
         """
 
-    @abstractmethod
+    def get_by_id_readonly(self, model_id: str) -> UserModel:
+        """Fetch a user for display without re-validating stored fields.
+
+        Raises:
+            ModelNotFoundError: If user does not exist.
+        """
+
     def update(self, model: UserModel) -> UserModel:
         """Update user document.
 
@@ -65,23 +68,19 @@ class UserRepository(BaseRepository):
             ValidationError: If payload is malformed.
         """
 
-    @abstractmethod
     def soft_delete(self, model_id: str) -> None:
         """Soft delete user document."""
 
-    @abstractmethod
     def get_active_users(self) -> List[UserModel]:
         """Fetch active users only."""
 
 
-class LoanRepository(BaseRepository):
+class LoanRepository(BaseRepository, Protocol):
     """Loan data access abstraction."""
 
-    @abstractmethod
     def create(self, model: LoanModel) -> LoanModel:
         """Persist a new loan model."""
 
-    @abstractmethod
     def get_by_id(self, model_id: str) -> LoanModel:
         """Fetch a loan by identifier.
 
@@ -90,7 +89,6 @@ class LoanRepository(BaseRepository):
             ValidationError: If payload is malformed.
         """
 
-    @abstractmethod
     def update(self, model: LoanModel) -> LoanModel:
         """Update loan document.
 
@@ -100,111 +98,88 @@ class LoanRepository(BaseRepository):
             ValidationError: If payload is malformed.
         """
 
-    @abstractmethod
     def soft_delete(self, model_id: str) -> None:
         """Soft delete loan document."""
 
-    @abstractmethod
     def get_active_loans_by_user(self, user_id: str) -> List[LoanModel]:
         """Return active loans for a user."""
 
 
-class CollateralRepository(BaseRepository):
+class CollateralRepository(BaseRepository, Protocol):
     """Collateral data access abstraction."""
 
-    @abstractmethod
     def create(self, model: CollateralModel) -> CollateralModel:
         """Persist new collateral document."""
 
-    @abstractmethod
     def get_by_id(self, model_id: str) -> CollateralModel:
         """Fetch collateral by identifier."""
 
-    @abstractmethod
     def update(self, model: CollateralModel) -> CollateralModel:
         """Update collateral document."""
 
-    @abstractmethod
     def soft_delete(self, model_id: str) -> None:
         """Soft delete collateral document."""
 
-    @abstractmethod
     def get_by_loan_id(self, loan_id: str) -> List[CollateralModel]:
         """Return collateral documents for a loan."""
 
 
-class RiskScoreRepository(BaseRepository):
+class RiskScoreRepository(BaseRepository, Protocol):
     """Risk score data access abstraction."""
 
-    @abstractmethod
     def create(self, model: RiskScoreModel) -> RiskScoreModel:
         """Persist risk score snapshot."""
 
-    @abstractmethod
     def get_by_id(self, model_id: str) -> RiskScoreModel:
         """Fetch risk score by identifier."""
 
-    @abstractmethod
     def update(self, model: RiskScoreModel) -> RiskScoreModel:
         """Update risk score snapshot."""
 
-    @abstractmethod
     def soft_delete(self, model_id: str) -> None:
         """Soft delete risk score document."""
 
-    @abstractmethod
     def get_latest_by_user(self, user_id: str) -> Optional[RiskScoreModel]:
         """Fetch most recent risk score for a user."""
 
 
-class InstallmentRepository(BaseRepository):
+class InstallmentRepository(BaseRepository, Protocol):
     """Installment data access abstraction."""
 
-    @abstractmethod
     def create(self, model: InstallmentModel) -> InstallmentModel:
         """Persist installment document."""
 
-    @abstractmethod
     def get_by_id(self, model_id: str) -> InstallmentModel:
         """Fetch installment by identifier."""
 
-    @abstractmethod
     def update(self, model: InstallmentModel) -> InstallmentModel:
         """Update installment document."""
 
-    @abstractmethod
     def soft_delete(self, model_id: str) -> None:
         """Soft delete installment document."""
 
-    @abstractmethod
     def get_due_installments(self, before: datetime) -> List[InstallmentModel]:
         """Fetch due installments up to a timestamp."""
 
-    @abstractmethod
     def get_by_loan_id(self, loan_id: str) -> List[InstallmentModel]:
         """Fetch installments belonging to one loan."""
 
 
-class LiquidationLogRepository(BaseRepository):
+class LiquidationLogRepository(BaseRepository, Protocol):
     """Liquidation log data access abstraction."""
 
-    @abstractmethod
     def create(self, model: LiquidationLogModel) -> LiquidationLogModel:
         """Persist liquidation log."""
 
-    @abstractmethod
     def get_by_id(self, model_id: str) -> LiquidationLogModel:
         """Fetch liquidation log by identifier."""
 
-    @abstractmethod
     def update(self, model: LiquidationLogModel) -> LiquidationLogModel:
         """Update liquidation log document."""
 
-    @abstractmethod
     def soft_delete(self, model_id: str) -> None:
         """Soft delete liquidation log."""
 
-    @abstractmethod
     def get_by_loan_id(self, loan_id: str) -> List[LiquidationLogModel]:
         """Fetch liquidation logs for a loan."""
 
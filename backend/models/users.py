@@ -2,7 +2,8 @@
 
 from datetime import datetime
 import logging
-from typing import List, Optional
+import re
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, validator
 
@@ -12,6 +13,14 @@ from .enums import UserStatus
 
 logger = logging.getLogger(__name__)
 
+_CURRENCY_RE = re.compile(r"[A-Za-z]{3}")
+
+# Known channels map to bits assigned in sorted name order, so each bitmask has one precomputed output.
+_CHANNEL_BITS = {"email": 1, "push": 2, "sms": 4, "whatsapp": 8}
+_CHANNELS_BY_MASK = tuple(
+    tuple(name for name, bit in _CHANNEL_BITS.items() if mask & bit) for mask in range(1 << len(_CHANNEL_BITS))
+)
+
 
 class WalletAddressModel(BaseModel):
     """Wallet metadata entry for a user profile."""
@@ -27,7 +36,7 @@ class UserModel(BaseDocumentModel):
     email: str = Field(..., min_length=5)
     phone: str = Field(..., min_length=8)
     full_name: str = Field(..., min_length=2)
-    currency_code: str = Field(default="INR", min_length=3, max_length=3)
+    currency_code: str = Field(default="INR")
     currency_symbol: str = Field(default="Rs", min_length=1, max_length=3)
     autopay_enabled: bool = Field(default=False)
     notification_channels: List[str] = Field(default_factory=list)
@@ -37,48 +46,63 @@ class UserModel(BaseDocumentModel):
     on_time_payment_count: int = Field(default=0, ge=0)
     late_payment_count: int = Field(default=0, ge=0)
     top_up_count: int = Field(default=0, ge=0)
-    loan_currency: Optional[str] = Field(default=None, min_length=3, max_length=3)
+    loan_currency: Optional[str] = Field(default=None)
     total_borrowed_fiat: float = Field(default=0.0, ge=0.0)
     total_repaid_fiat: float = Field(default=0.0, ge=0.0)
     outstanding_debt_fiat: float = Field(default=0.0, ge=0.0)
     last_loan_action: Optional[str] = Field(default=None)
     last_loan_action_at: Optional[datetime] = Field(default=None)
 
+    @classmethod
+    def from_firestore_trusted(cls, data: Dict[str, Any], doc_id: Optional[str] = None) -> "UserModel":
+        """Build a user from trusted Firestore data, hydrating nested wallet entries.
+
+        Args:
+            data: Firestore document payload written by ``to_firestore``.
+            doc_id: Optional Firestore document id.
+
+        Returns:
+            UserModel: User instance built without re-running field validators.
+        """
+        wallets = data.get("wallet_address")
+        if wallets:
+            data = dict(data)
+            data["wallet_address"] = [
+                WalletAddressModel(**wallet) if isinstance(wallet, dict) else wallet for wallet in wallets
+            ]
+        return super().from_firestore_trusted(data, doc_id=doc_id)
+
     @validator("notification_channels", pre=True, always=True)
     def _normalize_channels(cls, value: List[str]) -> List[str]:
         """Normalize notification channel list to lowercase unique values."""
-        try:
-            channels = [str(channel).strip().lower() for channel in (value or []) if str(channel).strip()]
-            return sorted(set(channels))
-        except Exception:
-            logger.exception("Failed to normalize notification channels.")
-            return []
+        mask = 0
+        extra_channels = None
+        for channel in value or []:
+            bit = _CHANNEL_BITS.get(channel) if isinstance(channel, str) else None
+            if bit is None:
+                normalized = str(channel).strip().lower()
+                bit = _CHANNEL_BITS.get(normalized)
+                if bit is None:
+                    # Unknown channels are kept and sorted with the known ones.
+                    if normalized:
+                        extra_channels = extra_channels or set()
+                        extra_channels.add(normalized)
+                    continue
+            mask |= bit
+        if extra_channels is None:
+            return list(_CHANNELS_BY_MASK[mask])
+        return sorted(extra_channels.union(_CHANNELS_BY_MASK[mask]))
 
     @validator("wallet_address", pre=True, always=True)
     def _normalize_wallet_address(cls, value: Optional[List[dict]]) -> List[dict]:
         """Normalize missing wallet list to an empty array for stable storage."""
-        try:
-            return value or []
-        except Exception:
-            logger.exception("Failed to normalize wallet_address payload.")
-            return []
-
-    @validator("currency_code")
-    def _normalize_currency_code(cls, value: str) -> str:
-        """Normalize currency code to upper-case ISO style."""
-        try:
-            return value.upper()
-        except Exception:
-            logger.exception("Failed to normalize currency_code value=%s", value)
-            return value
+        return value or []
 
-    @validator("loan_currency")
-    def _normalize_loan_currency(cls, value: Optional[str]) -> Optional[str]:
-        """Normalize loan currency to upper-case when present."""
+    @validator("currency_code", "loan_currency")
+    def _normalize_currency(cls, value: Optional[str]) -> Optional[str]:
+        """Check a three-letter currency code and normalize it to upper-case ISO style."""
         if value is None:
-            return None
-        try:
-            return value.upper()
-        except Exception:
-            logger.exception("Failed to normalize loan_currency value=%s", value)
             return value
+        if _CURRENCY_RE.fullmatch(value) is None:
+            raise ValueError("currency must be a three-letter ISO code")
+        return value if value.isupper() else value.upper()
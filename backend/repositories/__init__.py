@@ -1,5 +1,5 @@
 """Concrete repository implementations."""
 
-from .firestore_user_repository import FirestoreUserRepository
+from .firestore_user_repository import FirestoreUserRepository, request_user_cache
 
-__all__ = ["FirestoreUserRepository"]
+__all__ = ["FirestoreUserRepository", "request_user_cache"]
@@ -1,18 +1,42 @@
 """Firestore implementation of the user repository."""
 
+from contextlib import contextmanager
+import copy
+from contextvars import ContextVar
 import logging
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from pydantic import ValidationError
 
 from core.firebase_client_manager import FirebaseClientManager
+from models.base import utc_now
 from models.enums import UserStatus
-from models.exceptions import ModelNotFoundError, VersionConflictError
+from models.exceptions import ModelNotFoundError, ModelValidationError, VersionConflictError
 from models.users import UserModel
 
 
 logger = logging.getLogger(__name__)
 
+# Request-scoped user_id -> validated model cache; None outside a request_user_cache() scope.
+_REQUEST_USER_CACHE: ContextVar[Optional[Dict[str, UserModel]]] = ContextVar(
+    "request_user_cache",
+    default=None,
+)
+
+
+@contextmanager
+def request_user_cache() -> Iterator[None]:
+    """Cache user reads for the duration of one request.
+
+    Inside the scope, repeated ``get_by_id`` calls for the same user skip the
+    Firestore read. Writes through the repository refresh or drop the entry.
+    """
+    token = _REQUEST_USER_CACHE.set({})
+    try:
+        yield
+    finally:
+        _REQUEST_USER_CACHE.reset(token)
+
 
 class FirestoreUserRepository:
     """Persist and fetch user documents from Cloud Firestore."""
@@ -53,9 +77,10 @@ class FirestoreUserRepository:
                 payload=payload,
                 merge=False,
             )
-            return UserModel.from_firestore(stored, doc_id=model.user_id)
+            created = UserModel.from_firestore(stored, doc_id=model.user_id)
+            self._remember(model.user_id, created)
+            return created
         except ValidationError:
-            logger.exception("User validation failed while creating user_id=%s", model.user_id)
             raise
         except Exception:
             logger.exception("Failed to create user_id=%s", model.user_id)
@@ -69,46 +94,87 @@ class FirestoreUserRepository:
             ValidationError: If document shape is invalid.
         """
         try:
+            cache = _REQUEST_USER_CACHE.get()
+            cached = cache.get(model_id) if cache is not None else None
+            if cached is not None:
+                # Cached models were validated on the way in; the copy keeps caller mutations out of the cache.
+                return copy.deepcopy(cached)
             payload = self._firebase_manager.get_document(self._collection_name, model_id)
             if payload is None:
                 raise ModelNotFoundError("User not found: {0}".format(model_id))
-            return UserModel.from_firestore(payload, doc_id=model_id)
-        except ModelNotFoundError:
-            raise
-        except ValidationError:
-            logger.exception("Invalid user payload in Firestore user_id=%s", model_id)
+            # Callers mutate and save the result, so it must pass full validation.
+            model = UserModel.from_firestore(payload, doc_id=model_id)
+            self._remember(model_id, model)
+            return model
+        except (ModelNotFoundError, ValidationError):
             raise
         except Exception:
             logger.exception("Failed to get user_id=%s", model_id)
             raise
 
+    def get_by_id_readonly(self, model_id: str) -> UserModel:
+        """Fetch a user for display only, skipping field validation.
+
+        The result must not be mutated and saved; use ``get_by_id`` for that.
+
+        Raises:
+            ModelNotFoundError: If document does not exist.
+        """
+        try:
+            payload = self._firebase_manager.get_document(self._collection_name, model_id)
+            if payload is None:
+                raise ModelNotFoundError("User not found: {0}".format(model_id))
+            return UserModel.from_firestore_trusted(payload, doc_id=model_id)
+        except ModelNotFoundError:
+            raise
+        except Exception:
+            logger.exception("Failed to get read-only user_id=%s", model_id)
+            raise
+
     def update(self, model: UserModel) -> UserModel:
         """Update an existing user using optimistic version checks.
 
+        Expected errors are re-raised without logging; callers decide how to
+        report them.
+
         Raises:
             ModelNotFoundError: If user does not exist.
             VersionConflictError: If version is stale.
+            ModelValidationError: If the merged document fails validation; nothing is written.
         """
         try:
-            current_payload = self._firebase_manager.get_document(self._collection_name, model.user_id)
-            if current_payload is None:
-                raise ModelNotFoundError("User not found: {0}".format(model.user_id))
+            payload = model.to_firestore()
+            ref = self._firebase_manager.document_ref(self._collection_name, model.user_id)
 
-            current = UserModel.from_firestore(current_payload, doc_id=model.user_id)
-            if model.version <= current.version:
-                raise VersionConflictError("Version conflict for user_id={0}".format(model.user_id))
+            def _apply(transaction: Any) -> Tuple[str, Any]:
+                # Read, version check, validation, and merge-write commit together in one transaction.
+                snapshot = ref.get(transaction=transaction)
+                if not snapshot.exists:
+                    return "missing", None
+                current = snapshot.to_dict() or {}
+                if model.version <= int(current.get("version", 1)):
+                    return "conflict", None
+                updated_payload = dict(payload)
+                updated_payload["updated_at"] = utc_now()
+                current.update(updated_payload)
+                try:
+                    merged = UserModel.from_firestore(current, doc_id=model.user_id)
+                except ModelValidationError as exc:
+                    # Nothing is written, so a malformed merge never reaches the stored document.
+                    return "invalid", exc
+                transaction.set(ref, updated_payload, merge=True)
+                return "updated", merged
 
-            payload = model.to_firestore()
-            updated_payload = self._firebase_manager.update_document(
-                collection_name=self._collection_name,
-                document_id=model.user_id,
-                payload=payload,
-            )
-            return UserModel.from_firestore(updated_payload, doc_id=model.user_id)
-        except (ModelNotFoundError, VersionConflictError):
-            raise
-        except ValidationError:
-            logger.exception("User validation failed while updating user_id=%s", model.user_id)
+            outcome, result = self._firebase_manager.run_transaction(_apply)
+            if outcome == "missing":
+                raise ModelNotFoundError("User not found: {0}".format(model.user_id))
+            if outcome == "conflict":
+                raise VersionConflictError("Version conflict for user_id={0}".format(model.user_id))
+            if outcome == "invalid":
+                raise result
+            self._remember(model.user_id, result)
+            return result
+        except (ModelNotFoundError, ModelValidationError, VersionConflictError, ValidationError):
             raise
         except Exception:
             logger.exception("Failed to update user_id=%s", model.user_id)
@@ -121,26 +187,88 @@ class FirestoreUserRepository:
             if payload is None:
                 raise ModelNotFoundError("User not found: {0}".format(model_id))
             self._firebase_manager.soft_delete_document(self._collection_name, model_id)
+            cache = _REQUEST_USER_CACHE.get()
+            if cache is not None:
+                cache.pop(model_id, None)
         except ModelNotFoundError:
             raise
         except Exception:
             logger.exception("Failed to soft delete user_id=%s", model_id)
             raise
 
+    @staticmethod
+    def _active_user_filters() -> List[Tuple[str, str, Any]]:
+        """Return Firestore filters selecting non-deleted active users."""
+        return [
+            ("is_deleted", "==", False),
+            ("status", "==", UserStatus.ACTIVE.value),
+        ]
+
+    @staticmethod
+    def _remember(user_id: str, model: UserModel) -> None:
+        """Store a copy of a validated user in the active request cache, if any."""
+        cache = _REQUEST_USER_CACHE.get()
+        if cache is not None:
+            cache[user_id] = copy.deepcopy(model)
+
     def get_active_users(self) -> List[UserModel]:
         """Return non-deleted active users."""
         try:
-            payloads = self._firebase_manager.query_documents(
-                collection_name=self._collection_name,
-                filters=[
-                    ("is_deleted", "==", False),
-                    ("status", "==", UserStatus.ACTIVE.value),
-                ],
-            )
-            return [UserModel.from_firestore(payload, doc_id=payload.get("id")) for payload in payloads]
+            return list(self.iter_active_users())
         except ValidationError:
-            logger.exception("Invalid user payload while listing active users.")
             raise
         except Exception:
             logger.exception("Failed to list active users.")
             raise
+
+    def get_active_users_page(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Tuple[List[UserModel], Optional[str]]:
+        """Return one page of active users and the cursor for the next page.
+
+        Args:
+            cursor: Opaque cursor from the previous page; ``None`` for the first page.
+            page_size: Maximum users in the page.
+
+        Returns:
+            Tuple[List[UserModel], Optional[str]]: Users and next cursor, or
+            ``None`` when no pages remain.
+        """
+        try:
+            payloads, next_cursor = self._firebase_manager.query_page(
+                collection_name=self._collection_name,
+                filters=self._active_user_filters(),
+                page_size=page_size,
+                cursor=cursor,
+            )
+            users = [UserModel.from_firestore_trusted(payload, doc_id=payload.get("id")) for payload in payloads]
+            return users, next_cursor
+        except Exception:
+            logger.exception("Failed to list active users page cursor=%s", cursor)
+            raise
+
+    def iter_active_users(
+        self,
+        select_fields: Optional[Sequence[str]] = None,
+        page_size: int = 500,
+    ) -> Iterator[UserModel]:
+        """Stream non-deleted active users page by page.
+
+        Args:
+            select_fields: Optional field projection. Projected users only carry
+                the selected fields, so read only those attributes.
+            page_size: Maximum documents fetched per Firestore round-trip.
+
+        Yields:
+            UserModel: Active users in document-id order.
+        """
+        payloads = self._firebase_manager.stream_documents(
+            collection_name=self._collection_name,
+            filters=self._active_user_filters(),
+            select_fields=select_fields,
+            page_size=page_size,
+        )
+        for payload in payloads:
+            yield UserModel.from_firestore_trusted(payload, doc_id=payload.get("id"))
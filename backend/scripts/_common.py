@@ -0,0 +1,18 @@
+"""Shared helpers for the backend command-line scripts."""
+
+import logging
+
+
+CLI_LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+
+def setup_cli_logging(level: int = logging.INFO) -> None:
+    """Configure root logging for a script entry point.
+
+    Called from ``main()`` only, so importing a script module as a library
+    leaves the root logger's handlers untouched.
+
+    Args:
+        level: Root log level for the run.
+    """
+    logging.basicConfig(level=level, format=CLI_LOG_FORMAT)
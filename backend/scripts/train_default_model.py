@@ -5,25 +5,25 @@ import logging
 from pathlib import Path
 import sys
 
-import pandas as pd
-
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from backend.ml.dataset_io import read_dataset
 from backend.ml.default_synthetic import generate_synthetic_default_dataset
 from backend.ml.default_trainer import train_and_save_default_model
+from backend.scripts._common import setup_cli_logging
 
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
 logger = logging.getLogger(__name__)
 
 
 def main() -> None:
     """Train and save default prediction model artifact."""
+    setup_cli_logging()
     parser = argparse.ArgumentParser(description="Train calibrated GBDT default prediction model.")
-    parser.add_argument("--data", type=str, default="", help="Optional input CSV path.")
+    parser.add_argument("--data", type=str, default="", help="Optional input dataset (.parquet, .feather, .csv).")
     parser.add_argument("--rows", type=int, default=12000, help="Synthetic rows if --data omitted.")
     parser.add_argument(
         "--output",
@@ -39,7 +39,7 @@ def main() -> None:
         data_path = Path(args.data)
         if not data_path.exists():
             raise FileNotFoundError("Dataset not found: {0}".format(data_path))
-        dataframe = pd.read_csv(data_path)
+        dataframe = read_dataset(data_path)
         logger.info("Loaded default training data from %s rows=%d", data_path, len(dataframe))
     else:
         dataframe = generate_synthetic_default_dataset(rows=args.rows)
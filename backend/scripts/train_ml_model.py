@@ -5,23 +5,23 @@ import logging
 from pathlib import Path
 import sys
 
-import pandas as pd
-
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from backend.ml.dataset_io import read_dataset
 from backend.ml.synthetic import generate_synthetic_risk_dataset
 from backend.ml.trainer import train_and_save_model
+from backend.scripts._common import setup_cli_logging
 
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
 logger = logging.getLogger(__name__)
 
 
 def main() -> None:
     """Train model and save artifact."""
+    setup_cli_logging()
     parser = argparse.ArgumentParser(description="Train risk tier ML model.")
     parser.add_argument(
         "--data",
@@ -47,7 +47,7 @@ def main() -> None:
         data_path = Path(args.data)
         if not data_path.exists():
             raise FileNotFoundError("Dataset file not found: {0}".format(data_path))
-        dataframe = pd.read_csv(data_path)
+        dataframe = read_dataset(data_path)
         logger.info("Loaded training data from %s rows=%d", data_path, len(dataframe))
     else:
         dataframe = generate_synthetic_risk_dataset(rows=args.rows)
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import bisect
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
+import functools
 import hashlib
 import logging
+import operator
 import re
+import secrets
 from threading import RLock
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-from uuid import uuid4
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
 
 from common.emi_plan_catalog import EmiPlanCatalog
 from core.config import AppSettings
@@ -35,6 +42,41 @@ logger = logging.getLogger(__name__)
 
 FilterTuple = Tuple[str, str, Any]
 
+_NON_DIGIT_RE = re.compile(r"\D")
+# Deletes every ASCII non-digit; used for ASCII input, which covers nearly all contacts.
+_ASCII_NON_DIGITS = str.maketrans("", "", "".join(chr(code) for code in range(128) if not chr(code).isdigit()))
+
+# In-memory secondary indexes: collection alias -> fields with equality lookups.
+_INDEXED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "installments": ("loan_id", "user_id"),
+    "collaterals": ("loan_id", "user_id"),
+    "loans": ("user_id", "merchant_id"),
+}
+# Soft-delete filter answered from per-collection live id sets in indexed collections.
+_LIVE_FILTER: FilterTuple = ("is_deleted", "==", False)
+# Firestore accepts at most 30 values in one ``in`` filter.
+_IN_FILTER_MAX_VALUES = 30
+_STABLE_ASSETS: FrozenSet[str] = frozenset({"USDT", "USDC", "DAI", "BUSD", "USDP", "TUSD", "FDUSD"})
+_LATE_FEE_ELIGIBLE_STATUSES: FrozenSet[InstallmentStatus] = frozenset(
+    {InstallmentStatus.DUE, InstallmentStatus.MISSED, InstallmentStatus.UPCOMING}
+)
+# Band lookups: bisect over ascending thresholds picks the label index.
+_SAFETY_COLOR_THRESHOLDS = (1.1, 1.3)
+_SAFETY_COLOR_LABELS = ("red", "yellow", "green")
+_TIERS_BY_SEVERITY = (RiskTier.LOW, RiskTier.MEDIUM, RiskTier.HIGH, RiskTier.CRITICAL)
+# Safety ratio below 1.0 / 1.1 / 1.3 is CRITICAL / HIGH / MEDIUM.
+_SAFETY_RATIO_THRESHOLDS = (1.0, 1.1, 1.3)
+# Average delay above 4 / 12 / 24 hours is MEDIUM / HIGH / CRITICAL.
+_DELAY_HOURS_THRESHOLDS = (4.0, 12.0, 24.0)
+# Severity for 0, 1 and 2+ missed installments.
+_MISSED_COUNT_SEVERITY = (0, 2, 3)
+_DEFAULT_PROBABILITY_BPS_BY_TIER: Dict[RiskTier, int] = {
+    RiskTier.LOW: 700,
+    RiskTier.MEDIUM: 2400,
+    RiskTier.HIGH: 5600,
+    RiskTier.CRITICAL: 8300,
+}
+
 
 def _now_utc() -> datetime:
     """Return current UTC datetime."""
@@ -43,7 +85,13 @@ def _now_utc() -> datetime:
 
 def _as_int(value: Any, default: int = 0) -> int:
     """Convert value to int with fallback."""
+    # Exact-type checks let ints skip the float round-trip, which also keeps large values exact.
+    value_type = type(value)
+    if value_type is int:
+        return value
     try:
+        if value_type is float or value_type is bool:
+            return int(value)
         if value is None:
             return int(default)
         return int(float(value))
@@ -53,6 +101,8 @@ def _as_int(value: Any, default: int = 0) -> int:
 
 def _as_float(value: Any, default: float = 0.0) -> float:
     """Convert value to float with fallback."""
+    if type(value) is float:
+        return value
     try:
         if value is None:
             return float(default)
@@ -61,8 +111,27 @@ def _as_float(value: Any, default: float = 0.0) -> float:
         return float(default)
 
 
+def _numeric_sort_key(value: Any) -> tuple:
+    """Sort key for numeric values, including booleans."""
+    return (0, float(value), "")
+
+
+# Exact-type dispatch for the common Firestore value types; subclasses use the isinstance chain.
+_SORT_KEY_BY_TYPE = {
+    type(None): lambda value: (3, 0.0, ""),
+    bool: _numeric_sort_key,
+    int: _numeric_sort_key,
+    float: _numeric_sort_key,
+    datetime: lambda value: (0, value.timestamp(), ""),
+    str: lambda value: (1, 0.0, value),
+}
+
+
 def _orderable_sort_key(value: Any) -> tuple:
     """Return a safe sortable tuple for heterogeneous Firestore values."""
+    key_builder = _SORT_KEY_BY_TYPE.get(type(value))
+    if key_builder is not None:
+        return key_builder(value)
     if value is None:
         return (3, 0.0, "")
     if isinstance(value, bool):
@@ -74,6 +143,54 @@ def _orderable_sort_key(value: Any) -> tuple:
     return (1, 0.0, str(value))
 
 
+def _gt(actual: Any, expected: Any) -> bool:
+    """Return True when a present value is greater than expected."""
+    return actual is not None and actual > expected
+
+
+def _ge(actual: Any, expected: Any) -> bool:
+    """Return True when a present value is greater than or equal to expected."""
+    return actual is not None and actual >= expected
+
+
+def _lt(actual: Any, expected: Any) -> bool:
+    """Return True when a present value is less than expected."""
+    return actual is not None and actual < expected
+
+
+def _le(actual: Any, expected: Any) -> bool:
+    """Return True when a present value is less than or equal to expected."""
+    return actual is not None and actual <= expected
+
+
+def _is_in(actual: Any, expected: Any) -> bool:
+    """Return True when value is a member of the expected collection."""
+    return actual in expected
+
+
+# Firestore-style operators for the in-memory store; missing values never satisfy range filters.
+_FILTER_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": _gt,
+    ">=": _ge,
+    "<": _lt,
+    "<=": _le,
+    "in": _is_in,
+}
+
+
+def _compile_filters(filters: Sequence[FilterTuple]) -> List[Tuple[str, Callable[[Any, Any], bool], Any]]:
+    """Resolve filter operators once so row scans only call predicates."""
+    compiled = []
+    for field_name, operator_name, expected_value in filters:
+        predicate = _FILTER_OPERATORS.get(operator_name)
+        if predicate is None:
+            raise ValueError("Unsupported filter operator: {0}".format(operator_name))
+        compiled.append((field_name, predicate, expected_value))
+    return compiled
+
+
 def _normalize_contact_number(contact: Optional[str]) -> Optional[str]:
     """Normalize and validate customer contact for payment provider constraints."""
     if contact is None:
@@ -81,10 +198,13 @@ def _normalize_contact_number(contact: Optional[str]) -> Optional[str]:
     raw_value = str(contact).strip()
     if not raw_value:
         return None
-    digits_only = re.sub(r"\D", "", raw_value)
+    if raw_value.isascii():
+        digits_only = raw_value.translate(_ASCII_NON_DIGITS)
+    else:
+        digits_only = _NON_DIGIT_RE.sub("", raw_value)
     if len(digits_only) < 10 or len(digits_only) > 15:
         raise ValueError("customer_contact must contain 10 to 15 digits.")
-    if len(set(digits_only)) == 1:
+    if digits_only.count(digits_only[0]) == len(digits_only):
         raise ValueError("customer_contact cannot contain the same digit repeated.")
     return digits_only
 
@@ -114,7 +234,11 @@ class BnplFeatureService:
         )
         self._razorpay_service = razorpay_service
         self._lock = RLock()
-        self._memory_store: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # (monotonic expiry, payload) for the emergency pause flag read on every risky action.
+        self._pause_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._pause_ttl_sec = 2.0
+        # (collection, order_by, filter fields) shapes Firestore rejected for a missing composite index.
+        self._known_missing_indexes: Set[Tuple[str, str, Tuple[str, ...]]] = set()
 
         self._collections = {
             "loans": "bnpl_loans",
@@ -128,9 +252,50 @@ class BnplFeatureService:
             "settings": "bnpl_settings",
         }
 
+        # Collection names are fixed, so every in-memory bucket exists up front.
+        self._memory_store: Dict[str, Dict[str, Dict[str, Any]]] = {
+            name: {} for name in self._collections.values()
+        }
+        # collection name -> field -> value -> document ids, kept in insertion order.
+        self._indexed_fields = {
+            self._collections[alias]: fields for alias, fields in _INDEXED_FIELDS.items()
+        }
+        self._memory_indexes: Dict[str, Dict[str, Dict[str, Dict[str, None]]]] = {
+            name: {field_name: {} for field_name in fields} for name, fields in self._indexed_fields.items()
+        }
+        self._memory_live_ids: Dict[str, Set[str]] = {name: set() for name in self._indexed_fields}
+
+        # Storage backend is fixed for the service lifetime; bind its implementations once.
+        if firebase_manager is not None:
+            self._set_doc_impl = self._firestore_set_document
+            self._set_docs_impl = self._firestore_set_documents
+            self._get_doc_impl = self._firestore_get_document
+            self._get_doc_readonly_impl = self._firestore_get_document
+            self._get_docs_impl = self._firestore_get_documents
+            self._query_doc_impl = self._firestore_query_documents
+            self._query_by_loan_impl = self._firestore_query_by_loan
+            self._sum_fields_impl = (
+                self._firestore_sum_fields if settings.firebase_server_aggregation else self._rows_sum_fields
+            )
+            # Independent Firestore reads overlap their round-trips on this pool.
+            self._io_pool: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+                max_workers=8,
+                thread_name_prefix="bnpl-io",
+            )
+        else:
+            self._set_doc_impl = self._memory_set_document
+            self._set_docs_impl = self._memory_set_documents
+            self._get_doc_impl = self._memory_get_document
+            self._get_doc_readonly_impl = self._memory_get_document_readonly
+            self._get_docs_impl = self._memory_get_documents
+            self._query_doc_impl = self._memory_query_documents
+            self._query_by_loan_impl = self._memory_query_by_loan
+            self._sum_fields_impl = self._rows_sum_fields
+            self._io_pool = None
+
     def _new_id(self, prefix: str) -> str:
         """Generate a prefixed unique identifier."""
-        return "{0}_{1}".format(prefix, uuid4().hex[:16])
+        return "{0}_{1}".format(prefix, secrets.token_hex(8))
 
     def _set_document(
         self,
@@ -140,31 +305,281 @@ class BnplFeatureService:
         merge: bool = False,
     ) -> Dict[str, Any]:
         """Persist document into Firestore or in-memory fallback."""
-        collection_name = self._collections[collection_alias]
-        if self._firebase_manager is not None:
-            return self._firebase_manager.set_document(
+        return self._set_doc_impl(self._collections[collection_alias], document_id, payload, merge)
+
+    def _set_documents(self, writes: Sequence[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Persist several new documents in one batch.
+
+        Args:
+            writes: Sequence of `(collection_alias, document_id, payload)` tuples.
+
+        Returns:
+            List[Dict[str, Any]]: Stored payloads in input order.
+        """
+        collections = self._collections
+        return self._set_docs_impl(
+            [(collections[alias], document_id, payload) for alias, document_id, payload in writes]
+        )
+
+    def _get_document(self, collection_alias: str, document_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch one document by id."""
+        return self._get_doc_impl(self._collections[collection_alias], document_id)
+
+    def _get_document_readonly(self, collection_alias: str, document_id: str) -> Optional[Mapping[str, Any]]:
+        """Fetch one document for read-only use, such as parsing into a model.
+
+        The in-memory backend returns a read-only view instead of copying the
+        stored payload; stored payloads are replaced, never mutated, on writes.
+        """
+        return self._get_doc_readonly_impl(self._collections[collection_alias], document_id)
+
+    def _get_documents(self, collection_alias: str, document_ids: Sequence[str]) -> List[Optional[Dict[str, Any]]]:
+        """Fetch several documents by id, ``None`` for missing ones, in input order."""
+        return self._get_docs_impl(self._collections[collection_alias], document_ids)
+
+    def _query_documents(
+        self,
+        collection_alias: str,
+        filters: Optional[Sequence[FilterTuple]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        select_fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Query documents by filters in active storage backend.
+
+        With ``select_fields``, rows carry only those fields plus ``id``.
+        """
+        return self._query_doc_impl(self._collections[collection_alias], filters, order_by, limit, select_fields)
+
+    def _query_by_loan(self, collection_alias: str, loan_id: str) -> List[Dict[str, Any]]:
+        """Return non-deleted rows of a loan-keyed collection, unordered."""
+        return self._query_by_loan_impl(self._collections[collection_alias], loan_id)
+
+    def _sum_fields(
+        self,
+        collection_alias: str,
+        field_names: Sequence[str],
+        filters: Optional[Sequence[FilterTuple]] = None,
+    ) -> Dict[str, int]:
+        """Sum integer fields over filtered documents, keyed by field name."""
+        return self._sum_fields_impl(self._collections[collection_alias], field_names, filters)
+
+    def _firestore_sum_fields(
+        self,
+        collection_name: str,
+        field_names: Sequence[str],
+        filters: Optional[Sequence[FilterTuple]],
+    ) -> Dict[str, int]:
+        """Sum fields with a Firestore aggregation query."""
+        totals = self._firebase_manager.sum_fields(
+            collection_name=collection_name,
+            field_names=field_names,
+            filters=filters,
+        )
+        return {field_name: _as_int(totals.get(field_name), 0) for field_name in field_names}
+
+    def _rows_sum_fields(
+        self,
+        collection_name: str,
+        field_names: Sequence[str],
+        filters: Optional[Sequence[FilterTuple]],
+    ) -> Dict[str, int]:
+        """Sum fields over matching rows fetched from the active backend."""
+        rows = self._query_doc_impl(collection_name, filters, None, None, field_names)
+        return {field_name: sum(_as_int(item.get(field_name), 0) for item in rows) for field_name in field_names}
+
+    def _firestore_set_document(
+        self,
+        collection_name: str,
+        document_id: str,
+        payload: Dict[str, Any],
+        merge: bool,
+    ) -> Dict[str, Any]:
+        """Persist document into Firestore."""
+        return self._firebase_manager.set_document(
+            collection_name=collection_name,
+            document_id=document_id,
+            payload=payload,
+            merge=merge,
+        )
+
+    def _firestore_set_documents(self, writes: Sequence[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Persist several documents into Firestore with one batched commit."""
+        return self._firebase_manager.set_documents_batch(writes)
+
+    def _firestore_get_document(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch one document by id from Firestore."""
+        return self._firebase_manager.get_document(collection_name=collection_name, document_id=document_id)
+
+    def _firestore_get_documents(
+        self,
+        collection_name: str,
+        document_ids: Sequence[str],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Fetch several documents from Firestore in one batched read."""
+        return self._firebase_manager.get_documents(collection_name=collection_name, document_ids=document_ids)
+
+    def _firestore_query_documents(
+        self,
+        collection_name: str,
+        filters: Optional[Sequence[FilterTuple]],
+        order_by: Optional[str],
+        limit: Optional[int],
+        select_fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Query Firestore, sorting in memory when the composite index is missing.
+
+        Query shapes that already failed for a missing index go straight to the
+        unordered query, skipping the doomed round-trip.
+        """
+        index_key = None
+        if order_by:
+            index_key = (collection_name, order_by, tuple(item[0] for item in filters or ()))
+            if index_key in self._known_missing_indexes:
+                return self._firestore_query_sorted_locally(collection_name, filters, order_by, limit, select_fields)
+        try:
+            return self._firebase_manager.query_documents(
                 collection_name=collection_name,
-                document_id=document_id,
-                payload=payload,
-                merge=merge,
+                filters=filters,
+                order_by=order_by,
+                limit=limit,
+                select_fields=select_fields,
             )
+        except Exception as exc:
+            if index_key is not None and "requires an index" in str(exc).lower():
+                logger.warning(
+                    "Firestore composite index missing. Falling back to in-memory sort "
+                    "collection=%s order_by=%s",
+                    collection_name,
+                    order_by,
+                )
+                self._known_missing_indexes.add(index_key)
+                return self._firestore_query_sorted_locally(collection_name, filters, order_by, limit, select_fields)
+            raise
+
+    def _firestore_query_sorted_locally(
+        self,
+        collection_name: str,
+        filters: Optional[Sequence[FilterTuple]],
+        order_by: str,
+        limit: Optional[int],
+        select_fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run an unordered Firestore query, then sort and limit the rows in Python."""
+        if select_fields and order_by not in select_fields:
+            # The sort key must be fetched for the local sort to see it.
+            select_fields = list(select_fields) + [order_by]
+        rows = self._firebase_manager.query_documents(
+            collection_name=collection_name,
+            filters=filters,
+            order_by=None,
+            limit=None,
+            select_fields=select_fields,
+        )
+        rows.sort(key=lambda item: _orderable_sort_key(item.get(order_by)))
+        if limit is not None:
+            return rows[: int(limit)]
+        return rows
+
+    def _memory_set_document(
+        self,
+        collection_name: str,
+        document_id: str,
+        payload: Dict[str, Any],
+        merge: bool,
+    ) -> Dict[str, Any]:
+        """Persist document into the in-memory fallback store."""
         with self._lock:
-            bucket = self._memory_store.setdefault(collection_name, {})
-            if merge and document_id in bucket:
-                merged = dict(bucket[document_id])
+            bucket = self._memory_store[collection_name]
+            previous = bucket.get(document_id)
+            if merge and previous is not None:
+                merged = dict(previous)
                 merged.update(payload)
                 bucket[document_id] = merged
             else:
                 bucket[document_id] = dict(payload)
+            if collection_name in self._indexed_fields:
+                self._reindex_memory_document(collection_name, document_id, previous, bucket[document_id])
             return dict(bucket[document_id])
 
-    def _get_document(self, collection_alias: str, document_id: str) -> Optional[Dict[str, Any]]:
-        """Fetch one document by id."""
-        collection_name = self._collections[collection_alias]
-        if self._firebase_manager is not None:
-            return self._firebase_manager.get_document(collection_name=collection_name, document_id=document_id)
+    def _reindex_memory_document(
+        self,
+        collection_name: str,
+        document_id: str,
+        previous: Optional[Dict[str, Any]],
+        current: Dict[str, Any],
+    ) -> None:
+        """Move a document between secondary index buckets and the live set after a write."""
+        live_ids = self._memory_live_ids[collection_name]
+        if current.get("is_deleted") == False:  # noqa: E712 - mirrors the == filter semantics
+            live_ids.add(document_id)
+        else:
+            live_ids.discard(document_id)
+        field_indexes = self._memory_indexes[collection_name]
+        for field_name in self._indexed_fields[collection_name]:
+            old_value = previous.get(field_name) if previous is not None else None
+            new_value = current.get(field_name)
+            if previous is not None and old_value == new_value:
+                continue
+            value_index = field_indexes[field_name]
+            if isinstance(old_value, str):
+                value_index.get(old_value, {}).pop(document_id, None)
+            if isinstance(new_value, str):
+                value_index.setdefault(new_value, {})[document_id] = None
+
+    def _firestore_query_by_loan(self, collection_name: str, loan_id: str) -> List[Dict[str, Any]]:
+        """Query Firestore for one loan's non-deleted rows."""
+        return self._firebase_manager.query_documents(
+            collection_name=collection_name,
+            filters=[("loan_id", "==", loan_id), _LIVE_FILTER],
+        )
+
+    def _memory_query_by_loan(self, collection_name: str, loan_id: str) -> List[Dict[str, Any]]:
+        """Read one loan's live rows straight from the ``loan_id`` index and live id set."""
+        with self._lock:
+            bucket = self._memory_store[collection_name]
+            live_ids = self._memory_live_ids[collection_name]
+            loan_ids = self._memory_indexes[collection_name]["loan_id"].get(loan_id, {})
+            records: List[Dict[str, Any]] = []
+            for document_id in loan_ids:
+                if document_id in live_ids:
+                    row = dict(bucket[document_id])
+                    row.setdefault("id", document_id)
+                    records.append(row)
+            return records
+
+    def _memory_candidate_ids(self, collection_name: str, filters: Sequence[FilterTuple]) -> Optional[Sequence[str]]:
+        """Return document ids from a secondary index matching one equality filter, if any applies."""
+        indexed = self._indexed_fields.get(collection_name)
+        if not indexed:
+            return None
+        for field_name, operator_name, expected_value in filters:
+            if field_name not in indexed:
+                continue
+            value_index = self._memory_indexes[collection_name][field_name]
+            if operator_name == "==" and isinstance(expected_value, str):
+                return list(value_index.get(expected_value, ()))
+            if operator_name == "in" and all(isinstance(value, str) for value in expected_value):
+                # Distinct values have disjoint buckets, so concatenating them never repeats an id.
+                return [
+                    document_id
+                    for value in dict.fromkeys(expected_value)
+                    for document_id in value_index.get(value, ())
+                ]
+        return None
+
+    def _memory_set_documents(self, writes: Sequence[Tuple[str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Persist several documents into the in-memory store under one lock."""
+        with self._lock:
+            return [
+                self._memory_set_document(collection_name, document_id, payload, False)
+                for collection_name, document_id, payload in writes
+            ]
+
+    def _memory_get_document(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch one document by id from the in-memory fallback store."""
         with self._lock:
-            bucket = self._memory_store.setdefault(collection_name, {})
+            bucket = self._memory_store[collection_name]
             payload = bucket.get(document_id)
             if payload is None:
                 return None
@@ -172,86 +587,74 @@ class BnplFeatureService:
             result.setdefault("id", document_id)
             return result
 
-    def _query_documents(
+    def _memory_get_documents(
         self,
-        collection_alias: str,
-        filters: Optional[Sequence[FilterTuple]] = None,
-        order_by: Optional[str] = None,
-        limit: Optional[int] = None,
+        collection_name: str,
+        document_ids: Sequence[str],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Fetch several in-memory documents by id under one lock."""
+        with self._lock:
+            return [self._memory_get_document(collection_name, document_id) for document_id in document_ids]
+
+    def _memory_get_document_readonly(self, collection_name: str, document_id: str) -> Optional[Mapping[str, Any]]:
+        """Return a read-only view of one in-memory document without copying it."""
+        with self._lock:
+            payload = self._memory_store[collection_name].get(document_id)
+            return MappingProxyType(payload) if payload is not None else None
+
+    def _memory_query_documents(
+        self,
+        collection_name: str,
+        filters: Optional[Sequence[FilterTuple]],
+        order_by: Optional[str],
+        limit: Optional[int],
+        select_fields: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Query documents by filters in active storage backend."""
-        collection_name = self._collections[collection_alias]
-        if self._firebase_manager is not None:
-            try:
-                return self._firebase_manager.query_documents(
-                    collection_name=collection_name,
-                    filters=filters,
-                    order_by=order_by,
-                    limit=limit,
-                )
-            except Exception as exc:
-                message = str(exc).lower()
-                if order_by and "requires an index" in message:
-                    logger.warning(
-                        "Firestore composite index missing. Falling back to in-memory sort "
-                        "collection=%s order_by=%s",
-                        collection_name,
-                        order_by,
-                    )
-                    rows = self._firebase_manager.query_documents(
-                        collection_name=collection_name,
-                        filters=filters,
-                        order_by=None,
-                        limit=None,
-                    )
-                    rows.sort(key=lambda item: _orderable_sort_key(item.get(order_by)))
-                    if limit is not None:
-                        return rows[: int(limit)]
-                    return rows
-                raise
+        """Query the in-memory fallback store with Firestore-like filters."""
+        filters = list(filters or [])
+        live_only = collection_name in self._indexed_fields and _LIVE_FILTER in filters
+        if live_only:
+            filters = [item for item in filters if item != _LIVE_FILTER]
+        compiled = _compile_filters(filters)
         with self._lock:
-            bucket = self._memory_store.setdefault(collection_name, {})
+            bucket = self._memory_store[collection_name]
+            candidate_ids = self._memory_candidate_ids(collection_name, filters)
+            if candidate_ids is None:
+                candidates = bucket.items()
+            else:
+                # Index hit: scan only documents sharing the filtered value.
+                candidates = ((document_id, bucket[document_id]) for document_id in candidate_ids)
+            if live_only:
+                live_ids = self._memory_live_ids[collection_name]
+                candidates = ((document_id, payload) for document_id, payload in candidates if document_id in live_ids)
             records: List[Dict[str, Any]] = []
-            for document_id, payload in bucket.items():
-                row = dict(payload)
-                row.setdefault("id", document_id)
-                if self._matches_filters(row, filters or []):
+            for document_id, payload in candidates:
+                for field_name, predicate, expected_value in compiled:
+                    # Rows expose their document id as "id" unless the payload stores one.
+                    if field_name == "id":
+                        actual_value = payload.get("id", document_id)
+                    else:
+                        actual_value = payload.get(field_name)
+                    if not predicate(actual_value, expected_value):
+                        break
+                else:
+                    row = dict(payload)
+                    row.setdefault("id", document_id)
                     records.append(row)
             if order_by:
                 records.sort(key=lambda item: item.get(order_by))
             if limit is not None:
                 records = records[: int(limit)]
+            if select_fields:
+                # Project after sorting so order_by need not be selected.
+                projected: List[Dict[str, Any]] = []
+                for row in records:
+                    item = {field_name: row[field_name] for field_name in select_fields if field_name in row}
+                    item["id"] = row["id"]
+                    projected.append(item)
+                return projected
             return records
 
-    def _matches_filters(self, payload: Dict[str, Any], filters: Sequence[FilterTuple]) -> bool:
-        """Evaluate query-like filters for in-memory fallback."""
-        for field_name, operator, expected_value in filters:
-            actual_value = payload.get(field_name)
-            if operator == "==":
-                if actual_value != expected_value:
-                    return False
-            elif operator == "!=":
-                if actual_value == expected_value:
-                    return False
-            elif operator == ">":
-                if actual_value is None or actual_value <= expected_value:
-                    return False
-            elif operator == ">=":
-                if actual_value is None or actual_value < expected_value:
-                    return False
-            elif operator == "<":
-                if actual_value is None or actual_value >= expected_value:
-                    return False
-            elif operator == "<=":
-                if actual_value is None or actual_value > expected_value:
-                    return False
-            elif operator == "in":
-                if actual_value not in expected_value:
-                    return False
-            else:
-                raise ValueError("Unsupported filter operator: {0}".format(operator))
-        return True
-
     def _ensure_not_paused(self) -> None:
         """Raise if emergency pause is enabled."""
         pause_state = self.get_pause_state()
@@ -261,20 +664,21 @@ class BnplFeatureService:
     def _record_event(self, event_type: str, actor: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Store audit-friendly event log for protocol actions."""
         event_id = self._new_id("evt")
+        now = _now_utc()
         event_payload = {
             "event_id": event_id,
             "event_type": event_type,
             "actor": actor,
             "payload": payload,
-            "created_at": _now_utc(),
-            "updated_at": _now_utc(),
+            "created_at": now,
+            "updated_at": now,
         }
         self._set_document("events", event_id, event_payload, merge=False)
         return event_payload
 
     def _load_loan(self, loan_id: str) -> LoanModel:
         """Load loan model by id."""
-        payload = self._get_document("loans", loan_id)
+        payload = self._get_document_readonly("loans", loan_id)
         if payload is None:
             raise ValueError("Loan not found: {0}".format(loan_id))
         return LoanModel.from_firestore(payload, doc_id=loan_id)
@@ -287,11 +691,30 @@ class BnplFeatureService:
 
     def _load_collateral(self, collateral_id: str) -> CollateralModel:
         """Load collateral model by id."""
-        payload = self._get_document("collaterals", collateral_id)
+        payload = self._get_document_readonly("collaterals", collateral_id)
         if payload is None:
             raise ValueError("Collateral not found: {0}".format(collateral_id))
         return CollateralModel.from_firestore(payload, doc_id=collateral_id)
 
+    def _batch_save(self, entities: Sequence[Tuple[str, str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Persist modified models with one batched commit.
+
+        Args:
+            entities: Sequence of `(collection_alias, document_id, model)` tuples.
+                Repeated documents are written once, with the last model given.
+
+        Returns:
+            Dict[Tuple[str, str], Dict[str, Any]]: Stored payloads keyed by
+            `(collection_alias, document_id)`.
+        """
+        latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for alias, document_id, model in entities:
+            latest[(alias, document_id)] = model.to_firestore()
+        stored = self._set_documents(
+            [(alias, document_id, payload) for (alias, document_id), payload in latest.items()]
+        )
+        return dict(zip(latest, stored))
+
     def _save_collateral(self, collateral: CollateralModel, merge: bool = False) -> CollateralModel:
         """Persist collateral model."""
         payload = collateral.to_firestore()
@@ -316,23 +739,81 @@ class BnplFeatureService:
         stored = self._set_document("liquidation_logs", log.log_id, payload, merge=merge)
         return LiquidationLogModel.from_firestore(stored, doc_id=log.log_id)
 
-    def _get_installments_for_loan(self, loan_id: str) -> List[InstallmentModel]:
-        """Fetch installments for one loan ordered by sequence."""
-        payloads = self._query_documents(
-            "installments",
-            filters=[("loan_id", "==", loan_id), ("is_deleted", "==", False)],
-            order_by=None,
-        )
+    def _get_installments_for_loan(self, loan_id: str, loan: Optional[LoanModel] = None) -> List[InstallmentModel]:
+        """Fetch installments for one loan ordered by sequence.
+
+        When the loaded loan is passed and carries ``installment_ids``, the
+        schedule is read by id in one batch; those ids are stored in sequence
+        order, so no query or sort is needed.
+        """
+        if loan is not None and loan.installment_ids:
+            payloads = self._get_documents("installments", loan.installment_ids)
+            return [
+                InstallmentModel.from_firestore(item, doc_id=item.get("id"))
+                for item in payloads
+                if item is not None and not item.get("is_deleted", False)
+            ]
+        payloads = self._query_by_loan("installments", loan_id)
         installments = [InstallmentModel.from_firestore(item, doc_id=item.get("id")) for item in payloads]
         installments.sort(key=lambda item: item.sequence_no)
         return installments
 
+    def _load_loan_with_collaterals(self, loan_id: str) -> Tuple[LoanModel, List[CollateralModel]]:
+        """Load a loan and its collateral rows, overlapping the two reads on Firestore."""
+        if self._io_pool is None:
+            return self._load_loan(loan_id), self._get_collaterals_for_loan(loan_id)
+        collaterals_future = self._io_pool.submit(self._get_collaterals_for_loan, loan_id)
+        loan = self._load_loan(loan_id)
+        return loan, collaterals_future.result()
+
+    def _run_concurrently(self, *calls: Callable[[], Any]) -> List[Any]:
+        """Run independent zero-argument calls, overlapping them on the I/O pool when present.
+
+        The first call runs on the calling thread, so a call that itself uses the
+        pool should go first. Results come back in call order; once every call
+        has finished, the first failure in that order is raised.
+        """
+        if self._io_pool is None:
+            return [call() for call in calls]
+        futures = [self._io_pool.submit(call) for call in calls[1:]]
+        try:
+            first = calls[0]()
+        finally:
+            wait(futures)
+        return [first] + [future.result() for future in futures]
+
+    def _live_collaterals_by_loan(self, loan_ids: Sequence[str]) -> Dict[str, List[CollateralModel]]:
+        """Fetch live collateral rows of the given loans, grouped by loan id.
+
+        Loan ids are queried in ``in`` chunks that overlap on the I/O pool, so only
+        those loans' rows are read rather than every collateral in the collection.
+        """
+        chunks = [
+            list(loan_ids[start:start + _IN_FILTER_MAX_VALUES])
+            for start in range(0, len(loan_ids), _IN_FILTER_MAX_VALUES)
+        ]
+        if not chunks:
+            return {}
+        results = self._run_concurrently(
+            *[
+                functools.partial(
+                    self._query_documents,
+                    "collaterals",
+                    filters=[("loan_id", "in", chunk), _LIVE_FILTER],
+                )
+                for chunk in chunks
+            ]
+        )
+        collaterals_by_loan: Dict[str, List[CollateralModel]] = {}
+        for rows in results:
+            for item in rows:
+                collateral = CollateralModel.from_firestore(item, doc_id=item.get("id"))
+                collaterals_by_loan.setdefault(collateral.loan_id, []).append(collateral)
+        return collaterals_by_loan
+
     def _get_collaterals_for_loan(self, loan_id: str) -> List[CollateralModel]:
         """Fetch collateral rows for a loan."""
-        payloads = self._query_documents(
-            "collaterals",
-            filters=[("loan_id", "==", loan_id), ("is_deleted", "==", False)],
-        )
+        payloads = self._query_by_loan("collaterals", loan_id)
         return [CollateralModel.from_firestore(item, doc_id=item.get("id")) for item in payloads]
 
     def _update_user_counts(self, user_id: str, top_up_delta: int = 0) -> None:
@@ -348,30 +829,30 @@ class BnplFeatureService:
             logger.exception("Failed updating user counters user_id=%s", user_id)
 
     def _risk_tier_from_metrics(self, safety_ratio: float, missed_count: int, avg_delay_hours: float) -> RiskTier:
-        """Convert behavioral metrics into a risk tier."""
-        if safety_ratio < 1.0 or missed_count >= 2 or avg_delay_hours > 24:
-            return RiskTier.CRITICAL
-        if safety_ratio < 1.1 or missed_count >= 1 or avg_delay_hours > 12:
-            return RiskTier.HIGH
-        if safety_ratio < 1.3 or avg_delay_hours > 4:
-            return RiskTier.MEDIUM
-        return RiskTier.LOW
+        """Convert behavioral metrics into a risk tier; the worst metric decides."""
+        severity = max(
+            len(_SAFETY_RATIO_THRESHOLDS) - bisect.bisect_right(_SAFETY_RATIO_THRESHOLDS, safety_ratio),
+            _MISSED_COUNT_SEVERITY[min(max(missed_count, 0), 2)],
+            bisect.bisect_left(_DELAY_HOURS_THRESHOLDS, avg_delay_hours),
+        )
+        return _TIERS_BY_SEVERITY[severity]
 
     def _safety_color(self, safety_ratio: float) -> str:
         """Map safety ratio to UI color."""
-        if safety_ratio >= 1.3:
-            return "green"
-        if safety_ratio >= 1.1:
-            return "yellow"
-        return "red"
+        return _SAFETY_COLOR_LABELS[bisect.bisect_right(_SAFETY_COLOR_THRESHOLDS, safety_ratio)]
 
     def _schedule_hash(self, installments: List[InstallmentModel]) -> str:
         """Build deterministic hash for generated installment schedule."""
-        raw = "|".join(
-            "{0}:{1}:{2}".format(item.sequence_no, int(item.due_at.timestamp()), item.amount_minor)
-            for item in installments
-        )
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        # Feed the hasher per installment; digests match the former "|"-joined string.
+        hasher = hashlib.sha256()
+        separator = b""
+        for item in installments:
+            hasher.update(separator)
+            hasher.update(
+                "{0}:{1}:{2}".format(item.sequence_no, int(item.due_at.timestamp()), item.amount_minor).encode("ascii")
+            )
+            separator = b"|"
+        return hasher.hexdigest()
 
     def _oracle_age_sec(self) -> Optional[int]:
         """Compute oracle staleness age in seconds from protocol state."""
@@ -386,17 +867,21 @@ class BnplFeatureService:
             return None
 
     def get_pause_state(self) -> Dict[str, Any]:
-        """Return emergency pause state."""
+        """Return emergency pause state, served from a short-lived cache."""
+        with self._lock:
+            cached = self._pause_cache
+            if cached is not None and time.monotonic() < cached[0]:
+                return dict(cached[1])
         payload = self._get_document("settings", "emergency_pause")
         if payload is None:
-            default_payload = {
+            payload = {
                 "paused": False,
                 "reason": "",
                 "updated_at": _now_utc(),
                 "updated_by": "system",
             }
-            self._set_document("settings", "emergency_pause", default_payload, merge=False)
-            return default_payload
+            self._set_document("settings", "emergency_pause", payload, merge=False)
+        self._cache_pause_state(payload)
         return payload
 
     def set_pause_state(self, paused: bool, reason: str, role: str, actor: str) -> Dict[str, Any]:
@@ -409,9 +894,15 @@ class BnplFeatureService:
             "role": role,
         }
         self._set_document("settings", "emergency_pause", payload, merge=False)
+        self._cache_pause_state(payload)
         self._record_event("EMERGENCY_PAUSE_UPDATED", actor, payload)
         return payload
 
+    def _cache_pause_state(self, payload: Dict[str, Any]) -> None:
+        """Remember pause state until the TTL expires."""
+        with self._lock:
+            self._pause_cache = (time.monotonic() + self._pause_ttl_sec, dict(payload))
+
     def list_emi_plans(self, currency: Optional[str] = None, include_disabled: bool = False) -> Dict[str, Any]:
         """List EMI plans available for schedule generation and ML orchestration."""
         try:
@@ -504,34 +995,38 @@ class BnplFeatureService:
             remainder = principal_minor % installment_count
             step_days = max(1, tenure_days // installment_count)
             now = _now_utc()
+            # Loop invariants are built once; validation copies the shared trace per installment.
+            step = timedelta(days=step_days)
+            grace_window = timedelta(hours=grace_window_hours)
+            calculation_trace = {
+                "principal_minor": str(principal_minor),
+                "installment_count": str(installment_count),
+                "base_amount_minor": str(base_amount),
+                "remainder_minor": str(remainder),
+                "emi_plan_id": str(emi_plan_id or ""),
+                "emi_plan_name": str(emi_plan_name or ""),
+            }
             installments: List[InstallmentModel] = []
+            due_at = now
             for sequence_no in range(1, installment_count + 1):
-                amount = base_amount + (1 if sequence_no <= remainder else 0)
-                due_at = now + timedelta(days=step_days * sequence_no)
-                grace_deadline = due_at + timedelta(hours=grace_window_hours)
-                installment = InstallmentModel(
-                    installment_id=self._new_id("ins"),
-                    loan_id=loan_id,
-                    user_id=user_id,
-                    sequence_no=sequence_no,
-                    due_at=due_at,
-                    amount_minor=amount,
-                    grace_deadline=grace_deadline,
-                    status=InstallmentStatus.UPCOMING,
-                    calculation_trace={
-                        "principal_minor": str(principal_minor),
-                        "installment_count": str(installment_count),
-                        "base_amount_minor": str(base_amount),
-                        "remainder_minor": str(remainder),
-                        "emi_plan_id": str(emi_plan_id or ""),
-                        "emi_plan_name": str(emi_plan_name or ""),
-                    },
+                due_at += step
+                installments.append(
+                    InstallmentModel(
+                        installment_id=self._new_id("ins"),
+                        loan_id=loan_id,
+                        user_id=user_id,
+                        sequence_no=sequence_no,
+                        due_at=due_at,
+                        amount_minor=base_amount + 1 if sequence_no <= remainder else base_amount,
+                        grace_deadline=due_at + grace_window,
+                        status=InstallmentStatus.UPCOMING,
+                        calculation_trace=calculation_trace,
+                    )
                 )
-                installments.append(installment)
 
             InstallmentModel.validate_schedule(installments, expected_total_minor=principal_minor)
             schedule_hash = self._schedule_hash(installments)
-            installment_ids = [item.installment_id for item in installments]
+            installment_ids = tuple(item.installment_id for item in installments)
 
             loan = LoanModel(
                 loan_id=loan_id,
@@ -558,8 +1053,16 @@ class BnplFeatureService:
                 paid_minor=0,
                 penalty_accrued_minor=0,
             )
-            persisted_loan = self._save_loan(loan, merge=False)
-            persisted_installments = [self._save_installment(item, merge=False) for item in installments]
+            # Loan and schedule are written together in one batch instead of one RPC per installment.
+            stored_payloads = self._set_documents(
+                [("loans", loan_id, loan.to_firestore())]
+                + [("installments", item.installment_id, item.to_firestore()) for item in installments]
+            )
+            persisted_loan = LoanModel.from_firestore(stored_payloads[0], doc_id=loan_id)
+            persisted_installments = [
+                InstallmentModel.from_firestore(payload, doc_id=item.installment_id)
+                for item, payload in zip(installments, stored_payloads[1:])
+            ]
 
             self._record_event(
                 event_type="BNPL_PLAN_CREATED",
@@ -606,7 +1109,7 @@ class BnplFeatureService:
                 raise ValueError("deposited_units must be > 0")
             if collateral_value_minor <= 0:
                 raise ValueError("collateral_value_minor must be > 0")
-            loan = self._load_loan(loan_id)
+            loan, collaterals = self._load_loan_with_collaterals(loan_id)
 
             collateral = CollateralModel(
                 collateral_id=self._new_id("col"),
@@ -626,8 +1129,14 @@ class BnplFeatureService:
                 status=CollateralStatus.LOCKED,
                 proof_page_url=proof_page_url,
             )
-            stored = self._save_collateral(collateral, merge=False)
-            meter = self.get_safety_meter(loan_id=loan_id)
+            collaterals.append(collateral)
+            meter, writes = self._apply_safety_meter(loan, collaterals)
+            # The new row carries its meter values in its first and only write.
+            persisted = self._batch_save([("collaterals", collateral.collateral_id, collateral)] + writes)
+            stored = CollateralModel.from_firestore(
+                persisted[("collaterals", collateral.collateral_id)],
+                doc_id=collateral.collateral_id,
+            )
             self._record_event(
                 event_type="COLLATERAL_LOCKED",
                 actor=user_id,
@@ -665,10 +1174,17 @@ class BnplFeatureService:
             collateral.oracle_price_minor = int(oracle_price_minor)
             collateral.status = CollateralStatus.TOPPED_UP
             collateral.updated_at = _now_utc()
-            updated_collateral = self._save_collateral(collateral, merge=False)
+
+            loan, collaterals = self._load_loan_with_collaterals(collateral.loan_id)
+            collaterals = [collateral if item.collateral_id == collateral_id else item for item in collaterals]
+            meter, writes = self._apply_safety_meter(loan, collaterals)
+            persisted = self._batch_save([("collaterals", collateral_id, collateral)] + writes)
+            updated_collateral = CollateralModel.from_firestore(
+                persisted[("collaterals", collateral_id)],
+                doc_id=collateral_id,
+            )
 
             self._update_user_counts(user_id=updated_collateral.user_id, top_up_delta=1)
-            meter = self.get_safety_meter(updated_collateral.loan_id)
 
             self._record_event(
                 event_type="COLLATERAL_TOPPED_UP",
@@ -689,51 +1205,75 @@ class BnplFeatureService:
     def get_safety_meter(self, loan_id: str) -> Dict[str, Any]:
         """Compute health factor and safety color for a loan (Feature 3)."""
         try:
-            loan = self._load_loan(loan_id)
-            collaterals = self._get_collaterals_for_loan(loan_id)
-            total_collateral_minor = sum(item.collateral_value_minor - item.recovered_minor for item in collaterals)
-            outstanding_minor = max(loan.outstanding_minor, 0)
-            if outstanding_minor <= 0:
-                health_factor = 999999.0
-            else:
-                health_factor = float(total_collateral_minor) / float(outstanding_minor)
-            safety_color = self._safety_color(health_factor)
-
-            for collateral in collaterals:
-                collateral.health_factor = health_factor
-                collateral.safety_color = safety_color
-                collateral.updated_at = _now_utc()
-                self._save_collateral(collateral, merge=False)
-
-            return {
-                "loan_id": loan_id,
-                "collateral_value_minor": int(total_collateral_minor),
-                "outstanding_minor": int(outstanding_minor),
-                "health_factor": round(health_factor, 6),
-                "safety_color": safety_color,
-                "danger_limit_bps": loan.danger_limit_bps,
-                "liquidation_threshold_bps": loan.liquidation_threshold_bps,
-            }
+            loan, collaterals = self._load_loan_with_collaterals(loan_id)
+            meter, writes = self._apply_safety_meter(loan, collaterals)
+            if writes:
+                self._batch_save(writes)
+            return meter
         except Exception:
             logger.exception("Failed computing safety meter loan_id=%s", loan_id)
             raise
 
+    def _apply_safety_meter(
+        self,
+        loan: LoanModel,
+        collaterals: Sequence[CollateralModel],
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, str, Any]]]:
+        """Compute a loan's safety meter and stage collateral updates.
+
+        Collaterals whose health factor or color changed are updated in place
+        and returned as pending `_batch_save` writes; callers commit them.
+
+        Returns:
+            Tuple[Dict[str, Any], List[Tuple[str, str, Any]]]: Meter payload and pending writes.
+        """
+        total_collateral_minor = sum(item.collateral_value_minor - item.recovered_minor for item in collaterals)
+        outstanding_minor = max(loan.outstanding_minor, 0)
+        if outstanding_minor <= 0:
+            health_factor = 999999.0
+        else:
+            health_factor = float(total_collateral_minor) / float(outstanding_minor)
+        safety_color = self._safety_color(health_factor)
+
+        writes: List[Tuple[str, str, Any]] = []
+        now = _now_utc()
+        for collateral in collaterals:
+            if collateral.health_factor == health_factor and collateral.safety_color == safety_color:
+                continue
+            collateral.health_factor = health_factor
+            collateral.safety_color = safety_color
+            collateral.updated_at = now
+            writes.append(("collaterals", collateral.collateral_id, collateral))
+
+        meter = {
+            "loan_id": loan.loan_id,
+            "collateral_value_minor": int(total_collateral_minor),
+            "outstanding_minor": int(outstanding_minor),
+            "health_factor": round(health_factor, 6),
+            "safety_color": safety_color,
+            "danger_limit_bps": loan.danger_limit_bps,
+            "liquidation_threshold_bps": loan.liquidation_threshold_bps,
+        }
+        return meter, writes
+
     def compute_eligibility(self, user_id: str) -> Dict[str, Any]:
         """Compute instant checkout eligibility based on collateral and LTV (Feature 14)."""
         try:
-            active_loans = self._query_documents(
-                "loans",
-                filters=[("user_id", "==", user_id), ("status", "in", [LoanStatus.ACTIVE.value, LoanStatus.GRACE.value])],
-            )
-            total_outstanding = sum(_as_int(item.get("outstanding_minor"), 0) for item in active_loans)
-            user_collaterals = self._query_documents(
-                "collaterals",
-                filters=[("user_id", "==", user_id), ("is_deleted", "==", False)],
-            )
-            total_collateral = sum(
-                _as_int(item.get("collateral_value_minor"), 0) - _as_int(item.get("recovered_minor"), 0)
-                for item in user_collaterals
+            active_statuses = [LoanStatus.ACTIVE.value, LoanStatus.GRACE.value]
+            loan_totals, collateral_totals = self._run_concurrently(
+                lambda: self._sum_fields(
+                    "loans",
+                    ["outstanding_minor"],
+                    filters=[("user_id", "==", user_id), ("status", "in", active_statuses)],
+                ),
+                lambda: self._sum_fields(
+                    "collaterals",
+                    ["collateral_value_minor", "recovered_minor"],
+                    filters=[("user_id", "==", user_id), _LIVE_FILTER],
+                ),
             )
+            total_outstanding = loan_totals["outstanding_minor"]
+            total_collateral = collateral_totals["collateral_value_minor"] - collateral_totals["recovered_minor"]
             default_ltv_bps = 7000
             max_credit = (total_collateral * default_ltv_bps) // 10000
             available_credit = max(0, max_credit - total_outstanding)
@@ -845,10 +1385,11 @@ class BnplFeatureService:
         """Open dispute and freeze penalties (Feature 9)."""
         try:
             loan = self._load_loan(loan_id)
-            loan.paused_penalties_until = _now_utc() + timedelta(days=7)
+            now = _now_utc()
+            loan.paused_penalties_until = now + timedelta(days=7)
             loan.dispute_state = "OPEN"
             loan.status = LoanStatus.DISPUTE_OPEN
-            loan.updated_at = _now_utc()
+            loan.updated_at = now
             updated = self._save_loan(loan, merge=False)
             self._record_event(
                 event_type="DISPUTE_OPENED",
@@ -873,9 +1414,10 @@ class BnplFeatureService:
         try:
             loan = self._load_loan(loan_id)
             loan.dispute_state = "RESOLVED"
-            loan.paused_penalties_until = _now_utc()
+            now = _now_utc()
+            loan.paused_penalties_until = now
             loan.status = LoanStatus.ACTIVE if restore_active else LoanStatus.CLOSED
-            loan.updated_at = _now_utc()
+            loan.updated_at = now
             updated = self._save_loan(loan, merge=False)
             refund_result: Optional[Dict[str, Any]] = None
             if refund_payment_id:
@@ -904,41 +1446,54 @@ class BnplFeatureService:
         """Preview grace-window status and late fee details (Feature 6)."""
         try:
             loan = self._load_loan(loan_id)
-            payload = self._get_document("installments", installment_id)
+            payload = self._get_document_readonly("installments", installment_id)
             if payload is None:
                 raise ValueError("Installment not found: {0}".format(installment_id))
             installment = InstallmentModel.from_firestore(payload, doc_id=installment_id)
-            reference_time = as_of or _now_utc()
-            grace_deadline = installment.grace_deadline or (installment.due_at + timedelta(hours=loan.grace_window_hours))
-            in_grace = reference_time <= grace_deadline
-            late_fee_minor = 0
-            if not in_grace and installment.status in {InstallmentStatus.DUE, InstallmentStatus.MISSED, InstallmentStatus.UPCOMING}:
-                late_fee_minor = int(loan.late_fee_flat_minor) + int((installment.amount_minor * loan.late_fee_bps) / 10000)
-            return {
-                "loan_id": loan_id,
-                "installment_id": installment_id,
-                "due_at": installment.due_at,
-                "grace_deadline": grace_deadline,
-                "in_grace": in_grace,
-                "late_fee_minor": int(late_fee_minor),
-                "late_fee_flat_minor": int(loan.late_fee_flat_minor),
-                "late_fee_bps": int(loan.late_fee_bps),
-            }
+            return self._late_fee_preview(loan, installment, as_of or _now_utc())
         except Exception:
             logger.exception("Failed previewing late fee loan_id=%s installment_id=%s", loan_id, installment_id)
             raise
 
+    def _late_fee_preview(
+        self,
+        loan: LoanModel,
+        installment: InstallmentModel,
+        reference_time: datetime,
+    ) -> Dict[str, Any]:
+        """Build the grace-window and late-fee preview for already loaded models."""
+        grace_deadline = installment.grace_deadline or (installment.due_at + timedelta(hours=loan.grace_window_hours))
+        in_grace = reference_time <= grace_deadline
+        late_fee_minor = 0
+        if not in_grace and installment.status in _LATE_FEE_ELIGIBLE_STATUSES:
+            late_fee_minor = int(loan.late_fee_flat_minor) + int((installment.amount_minor * loan.late_fee_bps) / 10000)
+        return {
+            "loan_id": loan.loan_id,
+            "installment_id": installment.installment_id,
+            "due_at": installment.due_at,
+            "grace_deadline": grace_deadline,
+            "in_grace": in_grace,
+            "late_fee_minor": int(late_fee_minor),
+            "late_fee_flat_minor": int(loan.late_fee_flat_minor),
+            "late_fee_bps": int(loan.late_fee_bps),
+        }
+
     def run_early_warning_scan(self, threshold_ratio: float = 1.15) -> Dict[str, Any]:
         """Generate early warnings when safety meter nears danger (Feature 4)."""
         try:
             alerts: List[Dict[str, Any]] = []
+            now = _now_utc()
             loan_payloads = self._query_documents(
                 "loans",
                 filters=[("status", "in", [LoanStatus.ACTIVE.value, LoanStatus.GRACE.value, LoanStatus.OVERDUE.value])],
             )
-            for payload in loan_payloads:
-                loan = LoanModel.from_firestore(payload, doc_id=payload.get("id"))
-                meter = self.get_safety_meter(loan.loan_id)
+            loans = [LoanModel.from_firestore(payload, doc_id=payload.get("id")) for payload in loan_payloads]
+            collaterals_by_loan = self._live_collaterals_by_loan([loan.loan_id for loan in loans])
+            # Collateral meter updates from every loan commit in one batch after the scan.
+            collateral_writes: List[Tuple[str, str, Any]] = []
+            for loan in loans:
+                meter, writes = self._apply_safety_meter(loan, collaterals_by_loan.get(loan.loan_id, []))
+                collateral_writes.extend(writes)
                 health_factor = _as_float(meter.get("health_factor"), default=0.0)
                 if health_factor <= threshold_ratio:
                     alert_id = self._new_id("alert")
@@ -949,11 +1504,13 @@ class BnplFeatureService:
                         "channel_candidates": ["email", "whatsapp", "push"],
                         "message": "Safety meter is close to danger threshold. Please top up collateral.",
                         "health_factor": health_factor,
-                        "created_at": _now_utc(),
-                        "updated_at": _now_utc(),
+                        "created_at": now,
+                        "updated_at": now,
                     }
                     self._set_document("alerts", alert_id, alert, merge=False)
                     alerts.append(alert)
+            if collateral_writes:
+                self._batch_save(collateral_writes)
             self._record_event(
                 event_type="EARLY_WARNING_SCAN",
                 actor="system",
@@ -967,14 +1524,14 @@ class BnplFeatureService:
     def simulate_missed_payment(self, loan_id: str, installment_id: str) -> Dict[str, Any]:
         """Run 'what happens if I miss payment' simulation (Feature 10)."""
         try:
-            payload = self._get_document("installments", installment_id)
+            payload = self._get_document_readonly("installments", installment_id)
             if payload is None:
                 raise ValueError("Installment not found: {0}".format(installment_id))
             installment = InstallmentModel.from_firestore(payload, doc_id=installment_id)
-            preview = self.preview_late_fee(loan_id=loan_id, installment_id=installment_id)
+            loan, collaterals = self._load_loan_with_collaterals(loan_id)
+            preview = self._late_fee_preview(loan, installment, _now_utc())
             penalty_minor = _as_int(preview.get("late_fee_minor"), 0)
             needed_minor = installment.amount_minor + penalty_minor
-            collaterals = self._get_collaterals_for_loan(loan_id)
             available_minor = sum(item.collateral_value_minor - item.recovered_minor for item in collaterals)
             seized_minor = min(available_minor, needed_minor)
             returned_minor = max(0, available_minor - seized_minor)
@@ -1009,7 +1566,7 @@ class BnplFeatureService:
             gateway_payload: Optional[Dict[str, Any]] = None
             provider = "simulation"
             provider_error: Optional[str] = None
-            normalized_external_ref = external_ref or "rzp_{0}".format(uuid4().hex[:12])
+            normalized_external_ref = external_ref or "rzp_{0}".format(secrets.token_hex(6))
             if use_razorpay and self._razorpay_service is not None:
                 try:
                     gateway_payload = self._razorpay_service.create_order(
@@ -1033,6 +1590,7 @@ class BnplFeatureService:
                         merchant_id,
                     )
 
+            now = _now_utc()
             order_payload = {
                 "order_id": order_id,
                 "merchant_id": merchant_id,
@@ -1044,15 +1602,17 @@ class BnplFeatureService:
                 "provider": provider,
                 "provider_error": provider_error,
                 "gateway_payload": gateway_payload,
-                "created_at": _now_utc(),
-                "updated_at": _now_utc(),
+                "created_at": now,
+                "updated_at": now,
                 "is_deleted": False,
             }
-            self._set_document("orders", order_id, order_payload, merge=False)
-            self._record_event(
-                event_type="MERCHANT_SETTLEMENT_RECORDED",
-                actor=merchant_id,
-                payload={"order_id": order_id, "loan_id": loan_id, "amount_minor": amount_minor, "status": status},
+            self._run_concurrently(
+                lambda: self._set_document("orders", order_id, order_payload, merge=False),
+                lambda: self._record_event(
+                    event_type="MERCHANT_SETTLEMENT_RECORDED",
+                    actor=merchant_id,
+                    payload={"order_id": order_id, "loan_id": loan_id, "amount_minor": amount_minor, "status": status},
+                ),
             )
             return order_payload
         except Exception:
@@ -1069,18 +1629,22 @@ class BnplFeatureService:
     ) -> Dict[str, Any]:
         """Recover only the needed collateral amount on default (Features 7, 15)."""
         try:
-            loan = self._load_loan(loan_id)
-            payload = self._get_document("installments", installment_id)
+            # The loan, its collaterals and the installment are read once and reused for the
+            # late fee, the seizure loop, the post-recovery meter and the log.
+            loan, collaterals = self._load_loan_with_collaterals(loan_id)
+            payload = self._get_document_readonly("installments", installment_id)
             if payload is None:
                 raise ValueError("Installment not found: {0}".format(installment_id))
             installment = InstallmentModel.from_firestore(payload, doc_id=installment_id)
 
-            preview = self.preview_late_fee(loan_id=loan_id, installment_id=installment_id)
+            now = _now_utc()
+            preview = self._late_fee_preview(loan, installment, now)
             penalty_minor = _as_int(preview.get("late_fee_minor"), 0)
             needed_minor = int(installment.amount_minor + penalty_minor)
             remaining_needed = needed_minor
-            collaterals = self._get_collaterals_for_loan(loan_id)
             seized_total = 0
+            # Seized collaterals, the loan and the installment commit together in one batch.
+            writes: List[Tuple[str, str, Any]] = []
 
             for collateral in collaterals:
                 available = max(0, collateral.collateral_value_minor - collateral.recovered_minor)
@@ -1091,8 +1655,8 @@ class BnplFeatureService:
                 remaining_needed -= seize
                 seized_total += seize
                 collateral.status = CollateralStatus.PARTIALLY_RECOVERED
-                collateral.updated_at = _now_utc()
-                self._save_collateral(collateral, merge=False)
+                collateral.updated_at = now
+                writes.append(("collaterals", collateral.collateral_id, collateral))
 
             if seized_total > needed_minor:
                 raise ValueError("Partial recovery cannot seize more than needed amount.")
@@ -1100,43 +1664,55 @@ class BnplFeatureService:
             loan.penalty_accrued_minor += penalty_minor
             loan.outstanding_minor = max(0, loan.outstanding_minor - min(installment.amount_minor, seized_total))
             loan.status = LoanStatus.OVERDUE if remaining_needed > 0 else LoanStatus.ACTIVE
-            loan.updated_at = _now_utc()
-            updated_loan = self._save_loan(loan, merge=False)
+            loan.updated_at = now
+            writes.append(("loans", loan.loan_id, loan))
 
             installment.status = InstallmentStatus.MISSED if remaining_needed > 0 else InstallmentStatus.WAIVED
             installment.late_fee_minor = penalty_minor
-            installment.updated_at = _now_utc()
-            updated_installment = self._save_installment(installment, merge=False)
+            installment.updated_at = now
+            writes.append(("installments", installment.installment_id, installment))
+
+            # The post-recovery meter is computed from the mutated models; its collateral
+            # updates join the same batch, deduplicated against the seized rows.
+            meter, meter_writes = self._apply_safety_meter(loan, collaterals)
+            stored = self._batch_save(writes + meter_writes)
+            updated_loan = LoanModel.from_firestore(stored[("loans", loan.loan_id)], doc_id=loan.loan_id)
+            updated_installment = InstallmentModel.from_firestore(
+                stored[("installments", installment.installment_id)],
+                doc_id=installment.installment_id,
+            )
 
             log = LiquidationLogModel(
                 log_id=self._new_id("liq"),
                 loan_id=loan.loan_id,
                 user_id=loan.user_id,
                 collateral_id=collaterals[0].collateral_id if collaterals else "NA",
-                triggered_at=_now_utc(),
+                triggered_at=now,
                 trigger_reason="MISSED_INSTALLMENT",
-                health_factor_at_trigger=_as_float(self.get_safety_meter(loan.loan_id).get("health_factor"), 0.0),
+                health_factor_at_trigger=_as_float(meter.get("health_factor"), 0.0),
                 missed_amount_minor=installment.amount_minor,
                 penalty_minor=penalty_minor,
                 needed_minor=needed_minor,
                 seized_minor=seized_total,
                 returned_minor=max(0, seized_total - needed_minor),
                 merchant_transfer_ref=merchant_transfer_ref,
-                tx_hash="0x{0}".format(uuid4().hex),
+                tx_hash="0x{0}".format(secrets.token_hex(16)),
                 action_type=LiquidationActionType.PARTIAL_RECOVERY,
                 initiated_by_role=initiated_by_role,
                 policy_version="v1",
                 notes=notes,
             )
-            persisted_log = self._save_liquidation_log(log, merge=False)
-
-            settlement = self.simulate_merchant_settlement(
-                merchant_id=updated_loan.merchant_id,
-                user_id=updated_loan.user_id,
-                loan_id=updated_loan.loan_id,
-                amount_minor=seized_total,
-                status="RECOVERED_FROM_COLLATERAL",
-                external_ref=merchant_transfer_ref,
+            # Settlement fans out on the pool itself, so it runs on this thread.
+            settlement, persisted_log = self._run_concurrently(
+                lambda: self.simulate_merchant_settlement(
+                    merchant_id=updated_loan.merchant_id,
+                    user_id=updated_loan.user_id,
+                    loan_id=updated_loan.loan_id,
+                    amount_minor=seized_total,
+                    status="RECOVERED_FROM_COLLATERAL",
+                    external_ref=merchant_transfer_ref,
+                ),
+                lambda: self._save_liquidation_log(log, merge=False),
             )
 
             self._record_event(
@@ -1191,36 +1767,64 @@ class BnplFeatureService:
             logger.exception("Failed getting merchant risk view loan_id=%s", loan_id)
             raise
 
-    def merchant_dashboard(self, merchant_id: str) -> Dict[str, Any]:
-        """Return merchant order and plan status dashboard (Feature 13)."""
+    def merchant_dashboard(self, merchant_id: str, include_details: bool = False, limit: int = 100) -> Dict[str, Any]:
+        """Return merchant order and plan status dashboard (Feature 13).
+
+        Args:
+            merchant_id: Merchant to summarize.
+            include_details: Also return up to ``limit`` full loan and order rows.
+            limit: Maximum loan and order rows returned when details are included.
+        """
         try:
-            loans = self._query_documents("loans", filters=[("merchant_id", "==", merchant_id)])
-            orders = self._query_documents("orders", filters=[("merchant_id", "==", merchant_id)])
-            status_counts: Dict[str, int] = {}
-            for loan in loans:
-                status_name = str(loan.get("status", "UNKNOWN"))
-                status_counts[status_name] = status_counts.get(status_name, 0) + 1
-            return {
+            merchant_filter = [("merchant_id", "==", merchant_id)]
+            # Totals only need the status projection; detail rows are capped by the backend query.
+            calls = [
+                lambda: self._query_documents("loans", filters=merchant_filter, select_fields=["status"]),
+                lambda: self._query_documents("orders", filters=merchant_filter, select_fields=["status"]),
+            ]
+            row_limit = max(0, int(limit))
+            if include_details and row_limit:
+                calls.extend(
+                    [
+                        lambda: self._query_documents("loans", filters=merchant_filter, limit=row_limit),
+                        lambda: self._query_documents("orders", filters=merchant_filter, limit=row_limit),
+                    ]
+                )
+            results = self._run_concurrently(*calls)
+            loans, orders = results[0], results[1]
+            status_counts: Dict[str, int] = dict(Counter(str(loan.get("status", "UNKNOWN")) for loan in loans))
+            dashboard: Dict[str, Any] = {
                 "merchant_id": merchant_id,
                 "loans_total": len(loans),
                 "orders_total": len(orders),
                 "loan_status_breakdown": status_counts,
-                "loans": loans,
-                "orders": orders,
             }
+            if include_details:
+                dashboard["loans"] = results[2] if row_limit else []
+                dashboard["orders"] = results[3] if row_limit else []
+            return dashboard
         except Exception:
             logger.exception("Failed building merchant dashboard merchant_id=%s", merchant_id)
             raise
 
-    def compute_risk_score(self, loan_id: str) -> Dict[str, Any]:
-        """Compute and persist risk score with explainability (Features 21, 24)."""
+    def compute_risk_score(self, loan_id: str, meter: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Compute and persist risk score with explainability (Features 21, 24).
+
+        Args:
+            loan_id: Loan to score.
+            meter: Safety meter the caller already refreshed for this loan; read fresh when omitted.
+        """
         try:
             loan = self._load_loan(loan_id)
-            meter = self.get_safety_meter(loan_id)
-            installments = self._get_installments_for_loan(loan_id)
-            missed_count = len([item for item in installments if item.status == InstallmentStatus.MISSED])
+            if meter is None:
+                meter = self.get_safety_meter(loan_id)
+            installments = self._get_installments_for_loan(loan_id, loan=loan)
+            # One pass gathers both aggregates; schedules are a few dozen rows at most.
+            missed_count = 0
             delay_hours = 0.0
             for item in installments:
+                if item.status == InstallmentStatus.MISSED:
+                    missed_count += 1
                 if item.paid_at is not None:
                     delay = (item.paid_at - item.due_at).total_seconds() / 3600.0
                     delay_hours += max(0.0, delay)
@@ -1229,12 +1833,7 @@ class BnplFeatureService:
             tier = self._risk_tier_from_metrics(safety_ratio, missed_count, avg_delay_hours)
 
             score = int(max(0, min(1000, (safety_ratio * 500) + (100 - (missed_count * 20)) - (avg_delay_hours * 3))))
-            default_probability_bps = {
-                RiskTier.LOW: 700,
-                RiskTier.MEDIUM: 2400,
-                RiskTier.HIGH: 5600,
-                RiskTier.CRITICAL: 8300,
-            }[tier]
+            default_probability_bps = _DEFAULT_PROBABILITY_BPS_BY_TIER[tier]
             top_factors = []
             if safety_ratio < 1.2:
                 top_factors.append("Low safety ratio from collateral vs debt")
@@ -1246,6 +1845,7 @@ class BnplFeatureService:
                 top_factors.append("Strong repayment and collateral behavior")
             recommendation_minor = max(0, int((loan.outstanding_minor * 0.2)))
 
+            now = _now_utc()
             risk = RiskScoreModel(
                 risk_score_id=self._new_id("risk"),
                 user_id=loan.user_id,
@@ -1262,8 +1862,8 @@ class BnplFeatureService:
                     "missed_count": missed_count,
                     "avg_delay_hours": round(avg_delay_hours, 4),
                 },
-                last_evaluated_at=_now_utc(),
-                next_review_at=_now_utc() + timedelta(days=1),
+                last_evaluated_at=now,
+                next_review_at=now + timedelta(days=1),
             )
             persisted = self._save_risk_score(risk, merge=False)
             self._record_event(
@@ -1279,14 +1879,14 @@ class BnplFeatureService:
     def recommend_dynamic_deposit(self, loan_id: str, use_ml: bool = False) -> Dict[str, Any]:
         """Return dynamic deposit recommendation (Feature 22)."""
         try:
-            loan = self._load_loan(loan_id)
-            meter = self.get_safety_meter(loan_id)
-            risk_snapshot = self.compute_risk_score(loan_id)
+            loan, collaterals = self._load_loan_with_collaterals(loan_id)
+            meter, writes = self._apply_safety_meter(loan, collaterals)
+            if writes:
+                self._batch_save(writes)
+            risk_snapshot = self.compute_risk_score(loan_id, meter=meter)
             risk_tier = str(risk_snapshot.get("tier", "MEDIUM"))
-            collaterals = self._get_collaterals_for_loan(loan_id)
             primary_symbol = collaterals[0].asset_symbol if collaterals else "BNB"
-            stable_assets = {"USDT", "USDC", "DAI", "BUSD", "USDP", "TUSD", "FDUSD"}
-            collateral_type = "stable" if primary_symbol.upper() in stable_assets else "volatile"
+            collateral_type = "stable" if primary_symbol.upper() in _STABLE_ASSETS else "volatile"
             stress_drop_pct = self._emi_plan_catalog.get_stress_drop_pct(
                 plan_id=loan.emi_plan_id,
                 collateral_type=collateral_type,
@@ -1329,25 +1929,26 @@ class BnplFeatureService:
         """Predict default and generate preventive nudges (Feature 23)."""
         try:
             loan = self._load_loan(loan_id)
-            payload = self._get_document("installments", installment_id)
+            payload = self._get_document_readonly("installments", installment_id)
             if payload is None:
                 raise ValueError("Installment not found: {0}".format(installment_id))
             installment = InstallmentModel.from_firestore(payload, doc_id=installment_id)
             meter = self.get_safety_meter(loan_id)
 
-            installments = self._get_installments_for_loan(loan_id)
+            installments = self._get_installments_for_loan(loan_id, loan=loan)
             missed_count = len([item for item in installments if item.status == InstallmentStatus.MISSED])
             on_time_count = len([item for item in installments if item.status == InstallmentStatus.PAID])
             total_count = max(len(installments), 1)
             on_time_ratio = float(on_time_count) / float(total_count)
             avg_days_late = 0.0
-            due_diff_days = max(0.0, (installment.due_at - _now_utc()).total_seconds() / 86400.0)
+            now = _now_utc()
+            due_diff_days = max(0.0, (installment.due_at - now).total_seconds() / 86400.0)
 
             model_payload = DefaultPredictionInput(
                 user_id=loan.user_id,
                 plan_id=loan.loan_id,
                 installment_id=installment.installment_id,
-                cutoff_at=_now_utc(),
+                cutoff_at=now,
                 on_time_ratio=max(0.0, min(1.0, on_time_ratio)),
                 missed_count_90d=missed_count,
                 max_days_late_180d=avg_days_late,
@@ -1387,8 +1988,8 @@ class BnplFeatureService:
                 "tier": tier,
                 "actions": prediction.get("actions", []),
                 "message": "Payment risk detected. Recommended actions were generated.",
-                "created_at": _now_utc(),
-                "updated_at": _now_utc(),
+                "created_at": now,
+                "updated_at": now,
             }
             self._set_document("alerts", alert_id, alert_payload, merge=False)
             self._record_event(
@@ -1406,7 +2007,7 @@ class BnplFeatureService:
         try:
             loan = self._load_loan(loan_id)
             meter = self.get_safety_meter(loan_id)
-            risk = self.compute_risk_score(loan_id)
+            risk = self.compute_risk_score(loan_id, meter=meter)
             recommendation = self._ml_orchestrator.recommend_deposit_policy(
                 DepositRecommendationRequest(
                     plan_amount_inr=float(loan.principal_minor),
@@ -0,0 +1,37 @@
+"""Unit tests for ML artifact persistence helpers."""
+
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from ml.artifact_io import dump_artifact, load_artifact
+
+
+class ArtifactIoTests(unittest.TestCase):
+    """Validate artifact writes against artifacts that are already loaded."""
+
+    def test_overwrite_keeps_loaded_artifact_readable(self) -> None:
+        """Rewriting a loaded artifact should not disturb arrays read from the old file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = Path(tmp_dir) / "model.joblib"
+            dump_artifact({"coef": np.arange(4096, dtype=np.float64)}, model_path)
+            loaded = load_artifact(model_path)
+
+            dump_artifact({"coef": np.zeros(8, dtype=np.float64)}, model_path)
+
+            self.assertEqual(float(loaded["coef"][-1]), 4095.0)
+            self.assertEqual(load_artifact(model_path)["coef"].shape, (8,))
+            self.assertEqual([path.name for path in Path(tmp_dir).iterdir()], ["model.joblib"])
+
+
+if __name__ == "__main__":
+    unittest.main()
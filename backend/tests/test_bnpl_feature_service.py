@@ -1,5 +1,6 @@
 """Unit tests for BNPL feature orchestration service."""
 
+from dataclasses import replace
 from pathlib import Path
 import sys
 import unittest
@@ -16,6 +17,22 @@ from services.bnpl_feature_service import BnplFeatureService
 from services.protocol_api_service import ProtocolApiService
 
 
+class _FirestoreManagerStub:
+    """Firebase manager stand-in serving fixed query rows and aggregation totals."""
+
+    def __init__(self, rows: list, totals: dict) -> None:
+        self.rows = rows
+        self.totals = totals
+        self.sum_calls: list = []
+
+    def query_documents(self, collection_name, filters=None, order_by=None, limit=None, select_fields=None):
+        return [dict(row) for row in self.rows]
+
+    def sum_fields(self, collection_name, field_names, filters=None):
+        self.sum_calls.append((collection_name, list(field_names), list(filters or [])))
+        return dict(self.totals)
+
+
 class BnplFeatureServiceTests(unittest.TestCase):
     """Validate high-value BNPL feature flows."""
 
@@ -38,6 +55,22 @@ class BnplFeatureServiceTests(unittest.TestCase):
             ml_orchestrator=orchestrator,
         )
 
+    def _firestore_service(self, manager: _FirestoreManagerStub, server_aggregation: bool) -> BnplFeatureService:
+        """Build a service on a stub Firestore manager with the aggregation flag set."""
+        settings = replace(load_settings(), firebase_server_aggregation=server_aggregation)
+        return BnplFeatureService(
+            settings=settings,
+            protocol_service=ProtocolApiService(),
+            user_repository=None,
+            firebase_manager=manager,
+            ml_orchestrator=MlPayloadOrchestrator(
+                ml_enabled=False,
+                risk_inference=None,
+                default_inference=None,
+                deposit_inference=None,
+            ),
+        )
+
     def _create_plan(self) -> dict:
         """Create a helper loan plan."""
         return self.service.create_bnpl_plan(
@@ -128,6 +161,139 @@ class BnplFeatureServiceTests(unittest.TestCase):
         )
         self.assertEqual(resolved["loan"]["status"], "ACTIVE")
 
+    def test_create_plan_batches_loan_and_installments(self) -> None:
+        """Plan creation should store the loan and every installment in one batch write."""
+        batches = []
+        set_documents = self.service._set_documents
+
+        def _recording_set_documents(writes):
+            batches.append([(alias, document_id) for alias, document_id, _ in writes])
+            return set_documents(writes)
+
+        self.service._set_documents = _recording_set_documents
+        result = self._create_plan()
+        expected = [("loans", result["loan"]["loan_id"])] + [
+            ("installments", item["installment_id"]) for item in result["installments"]
+        ]
+        self.assertEqual(batches, [expected])
+
+    def test_soft_deleted_collateral_is_excluded(self) -> None:
+        """Soft-deleted collateral should drop out of loan queries and eligibility."""
+        plan = self._create_plan()
+        loan_id = plan["loan"]["loan_id"]
+        lock = self.service.lock_security_deposit(
+            loan_id=loan_id,
+            user_id="usr_101",
+            asset_symbol="BNB",
+            deposited_units=1000000000000000000,
+            collateral_value_minor=18000,
+            oracle_price_minor=2500000,
+            vault_address="0xabc1230000000000000000000000000000000000",
+            chain_id=97,
+            deposit_tx_hash="0xcafebabe00112233445566778899aabb",
+        )
+        collateral_id = lock["collateral"]["collateral_id"]
+        self.assertEqual(len(self.service._query_by_loan("collaterals", loan_id)), 1)
+        self.assertEqual(self.service.compute_eligibility("usr_101")["total_collateral_minor"], 18000)
+
+        self.service._set_document("collaterals", collateral_id, {"is_deleted": True}, merge=True)
+        self.assertEqual(self.service._query_by_loan("collaterals", loan_id), [])
+        self.assertEqual(self.service.compute_eligibility("usr_101")["total_collateral_minor"], 0)
+
+    def test_merge_write_moves_index_buckets(self) -> None:
+        """Changing an indexed field with a merge write should move the row between index buckets."""
+        loan_id = self._create_plan()["loan"]["loan_id"]
+        self.service._set_document("loans", loan_id, {"user_id": "usr_999"}, merge=True)
+        self.assertEqual(self.service._query_documents("loans", filters=[("user_id", "==", "usr_101")]), [])
+        moved = self.service._query_documents("loans", filters=[("user_id", "==", "usr_999")])
+        self.assertEqual([row["loan_id"] for row in moved], [loan_id])
+
+    def test_pause_state_is_visible_immediately(self) -> None:
+        """A pause update should be returned at once despite the cached earlier state."""
+        self.assertFalse(self.service.get_pause_state()["paused"])
+        self.service.set_pause_state(paused=True, reason="maintenance", role="ADMIN", actor="tester")
+        state = self.service.get_pause_state()
+        self.assertTrue(state["paused"])
+        self.assertEqual(state["reason"], "maintenance")
+
+    def test_sum_fields_parses_stored_rows_by_default(self) -> None:
+        """Without server aggregation, string and float amounts are parsed row by row."""
+        self.assertFalse(load_settings().firebase_server_aggregation)
+        manager = _FirestoreManagerStub(rows=[{"outstanding_minor": "12000"}, {"outstanding_minor": 6000.9}], totals={})
+        service = self._firestore_service(manager, server_aggregation=False)
+        totals = service._sum_fields("loans", ["outstanding_minor"], filters=[("user_id", "==", "usr_101")])
+        self.assertEqual(totals, {"outstanding_minor": 18000})
+        self.assertEqual(manager.sum_calls, [])
+
+    def test_firestore_sum_fields_returns_int_totals(self) -> None:
+        """Server aggregation totals should be coerced to ints, with missing totals as zero."""
+        manager = _FirestoreManagerStub(rows=[], totals={"collateral_value_minor": 18000.75, "recovered_minor": None})
+        service = self._firestore_service(manager, server_aggregation=True)
+        filters = [("user_id", "==", "usr_101"), ("is_deleted", "==", False)]
+        totals = service._sum_fields("collaterals", ["collateral_value_minor", "recovered_minor"], filters=filters)
+        self.assertEqual(totals, {"collateral_value_minor": 18000, "recovered_minor": 0})
+        self.assertIs(type(totals["collateral_value_minor"]), int)
+        self.assertEqual(
+            manager.sum_calls,
+            [("bnpl_collaterals", ["collateral_value_minor", "recovered_minor"], filters)],
+        )
+
+    def test_early_warning_scan_reads_only_active_loan_collateral(self) -> None:
+        """The scan should query collateral by active loan ids, in chunks of at most 30."""
+        loan_ids = []
+        for tx_suffix in ("01", "02"):
+            loan_id = self._create_plan()["loan"]["loan_id"]
+            self.service.lock_security_deposit(
+                loan_id=loan_id,
+                user_id="usr_101",
+                asset_symbol="BNB",
+                deposited_units=1000000000000000000,
+                collateral_value_minor=18000,
+                oracle_price_minor=2500000,
+                vault_address="0xabc1230000000000000000000000000000000000",
+                chain_id=97,
+                deposit_tx_hash="0xcafebabe001122334455667788990" + tx_suffix,
+            )
+            loan_ids.append(loan_id)
+        self.service._set_document("loans", loan_ids[1], {"status": "CLOSED"}, merge=True)
+
+        collateral_reads = []
+        query_documents = self.service._query_documents
+
+        def _recording_query_documents(collection_alias, filters=None, **kwargs):
+            rows = query_documents(collection_alias, filters=filters, **kwargs)
+            if collection_alias == "collaterals":
+                collateral_reads.append((filters, [row["loan_id"] for row in rows]))
+            return rows
+
+        self.service._query_documents = _recording_query_documents
+        self.service.run_early_warning_scan(threshold_ratio=2.0)
+        self.assertEqual(len(collateral_reads), 1)
+        filters, read_loan_ids = collateral_reads[0]
+        self.assertIn(("loan_id", "in", [loan_ids[0]]), filters)
+        self.assertEqual(read_loan_ids, [loan_ids[0]])
+
+        collateral_reads.clear()
+        self.service._live_collaterals_by_loan(["loan_{0}".format(index) for index in range(31)])
+        self.assertEqual([len(filters[0][2]) for filters, _ in collateral_reads], [30, 1])
+
+    def test_merchant_dashboard_totals_and_limited_details(self) -> None:
+        """Totals should cover every loan while detail rows honour the limit."""
+        self._create_plan()
+        self._create_plan()
+        summary = self.service.merchant_dashboard("mer_201")
+        self.assertEqual(summary["loans_total"], 2)
+        self.assertEqual(list(summary["loan_status_breakdown"].values()), [2])
+        self.assertNotIn("loans", summary)
+        self.assertNotIn("orders", summary)
+
+        detailed = self.service.merchant_dashboard("mer_201", include_details=True, limit=1)
+        self.assertEqual(detailed["loans_total"], 2)
+        self.assertEqual(detailed["loan_status_breakdown"], summary["loan_status_breakdown"])
+        self.assertEqual(len(detailed["loans"]), 1)
+        self.assertEqual(detailed["loans"][0]["user_id"], "usr_101")
+        self.assertLessEqual(len(detailed["orders"]), 1)
+
     def test_create_plan_with_emi_plan_id_applies_defaults(self) -> None:
         """EMI plan id should stamp plan metadata and defaults into loan."""
         result = self.service.create_bnpl_plan(
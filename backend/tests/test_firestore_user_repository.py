@@ -0,0 +1,187 @@
+"""Unit tests for the Firestore user repository against a stub manager."""
+
+from pathlib import Path
+import sys
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from models.exceptions import ModelNotFoundError, ModelValidationError, VersionConflictError
+from models.users import UserModel
+from repositories.firestore_user_repository import FirestoreUserRepository, request_user_cache
+
+
+def _user_payload(**changes) -> dict:
+    """Return a stored user document, overriding selected fields."""
+    payload = {
+        "user_id": "usr_1",
+        "email": "test@example.com",
+        "phone": "9999999999",
+        "full_name": "Test User",
+        "wallet_address": [{"name": "Primary", "wallet_id": "0x1234567890"}],
+        "version": 1,
+        "is_deleted": False,
+    }
+    payload.update(changes)
+    return payload
+
+
+class _SnapshotStub:
+    """Document snapshot returned inside a transaction."""
+
+    def __init__(self, payload) -> None:
+        self._payload = payload
+
+    @property
+    def exists(self) -> bool:
+        return self._payload is not None
+
+    def to_dict(self) -> dict:
+        return dict(self._payload)
+
+
+class _DocumentRefStub:
+    """Document reference reading from the stub manager's documents."""
+
+    def __init__(self, manager: "_FirebaseManagerStub", document_id: str) -> None:
+        self._manager = manager
+        self.document_id = document_id
+
+    def get(self, transaction=None) -> _SnapshotStub:
+        return _SnapshotStub(self._manager.documents.get(self.document_id))
+
+
+class _TransactionStub:
+    """Transaction that buffers merge writes until the callback returns."""
+
+    def __init__(self) -> None:
+        self.writes = []
+
+    def set(self, ref: _DocumentRefStub, payload: dict, merge: bool = False) -> None:
+        self.writes.append((ref.document_id, dict(payload)))
+
+
+class _FirebaseManagerStub:
+    """In-memory stand-in for the Firebase client manager calls the repository makes."""
+
+    def __init__(self, documents: dict) -> None:
+        self.documents = documents
+        self.reads = 0
+        self.committed_writes = []
+
+    def get_document(self, collection_name: str, document_id: str):
+        self.reads += 1
+        payload = self.documents.get(document_id)
+        return dict(payload) if payload is not None else None
+
+    def document_ref(self, collection_name: str, document_id: str) -> _DocumentRefStub:
+        return _DocumentRefStub(self, document_id)
+
+    def run_transaction(self, callback):
+        transaction = _TransactionStub()
+        result = callback(transaction)
+        for document_id, payload in transaction.writes:
+            self.documents.setdefault(document_id, {}).update(payload)
+            self.committed_writes.append(document_id)
+        return result
+
+    def soft_delete_document(self, collection_name: str, document_id: str) -> None:
+        self.documents[document_id]["is_deleted"] = True
+
+
+class FirestoreUserRepositoryUpdateTests(unittest.TestCase):
+    """Validate each outcome of the transactional update."""
+
+    def setUp(self) -> None:
+        """Store one user behind a stub manager."""
+        self.manager = _FirebaseManagerStub({"usr_1": _user_payload()})
+        self.repository = FirestoreUserRepository(self.manager)
+
+    def test_update_missing_user_raises_not_found(self) -> None:
+        """Updating an absent user should raise and write nothing."""
+        user = UserModel(**_user_payload(user_id="usr_404", version=2))
+        with self.assertRaises(ModelNotFoundError):
+            self.repository.update(user)
+        self.assertEqual(self.manager.committed_writes, [])
+
+    def test_update_stale_version_raises_conflict(self) -> None:
+        """A version not newer than the stored one should raise and write nothing."""
+        user = UserModel(**_user_payload(version=1, full_name="Stale Name"))
+        with self.assertRaises(VersionConflictError):
+            self.repository.update(user)
+        self.assertEqual(self.manager.committed_writes, [])
+        self.assertEqual(self.manager.documents["usr_1"]["full_name"], "Test User")
+
+    def test_update_invalid_merge_raises_without_writing(self) -> None:
+        """A merged document that fails validation should never be written."""
+        user = UserModel.from_firestore_trusted(_user_payload(email="bad", version=2))
+        with self.assertRaises(ModelValidationError):
+            self.repository.update(user)
+        self.assertEqual(self.manager.committed_writes, [])
+        self.assertEqual(self.manager.documents["usr_1"]["email"], "test@example.com")
+
+    def test_update_writes_and_returns_merged_user(self) -> None:
+        """A valid newer version should be written and returned as a validated model."""
+        user = UserModel(**_user_payload(version=2, autopay_enabled=True))
+        updated = self.repository.update(user)
+        self.assertTrue(updated.autopay_enabled)
+        self.assertEqual(updated.version, 2)
+        self.assertEqual(self.manager.committed_writes, ["usr_1"])
+        self.assertTrue(self.manager.documents["usr_1"]["autopay_enabled"])
+
+
+class RequestUserCacheTests(unittest.TestCase):
+    """Validate request-scoped caching of user reads."""
+
+    def setUp(self) -> None:
+        """Store one user behind a stub manager."""
+        self.manager = _FirebaseManagerStub({"usr_1": _user_payload()})
+        self.repository = FirestoreUserRepository(self.manager)
+
+    def test_cache_hits_return_independent_copies(self) -> None:
+        """Repeated reads should hit the cache, and caller mutations must not leak into it."""
+        with request_user_cache():
+            first = self.repository.get_by_id("usr_1")
+            first.full_name = "Changed Name"
+            first.wallet_address.clear()
+            second = self.repository.get_by_id("usr_1")
+        self.assertEqual(self.manager.reads, 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.full_name, "Test User")
+        self.assertEqual(len(second.wallet_address), 1)
+
+    def test_update_refreshes_cache_entry(self) -> None:
+        """A read after an update should return the updated user without another fetch."""
+        with request_user_cache():
+            user = self.repository.get_by_id("usr_1")
+            user.autopay_enabled = True
+            user.version += 1
+            self.repository.update(user)
+            cached = self.repository.get_by_id("usr_1")
+        self.assertEqual(self.manager.reads, 1)
+        self.assertTrue(cached.autopay_enabled)
+        self.assertEqual(cached.version, 2)
+
+    def test_soft_delete_drops_cache_entry(self) -> None:
+        """A read after a soft delete should fetch the stored document again."""
+        with request_user_cache():
+            self.repository.get_by_id("usr_1")
+            self.repository.soft_delete("usr_1")
+            reads_before = self.manager.reads
+            user = self.repository.get_by_id("usr_1")
+        self.assertEqual(self.manager.reads, reads_before + 1)
+        self.assertTrue(user.is_deleted)
+
+    def test_reads_outside_scope_are_not_cached(self) -> None:
+        """Without a request scope every read should go to the manager."""
+        self.repository.get_by_id("usr_1")
+        self.repository.get_by_id("usr_1")
+        self.assertEqual(self.manager.reads, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Unit tests for the liquidation-risk predictor adapter."""
+
+import asyncio
+from pathlib import Path
+import sys
+from typing import List, Optional
+import unittest
+
+import numpy as np
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from ml.predictor import LiquidationBatchPredictor, LiquidationPredictionResult, LiquidationPredictor
+
+
+class LiquidationPredictorTests(unittest.TestCase):
+    """Validate scalar and vectorized prediction paths."""
+
+    def setUp(self) -> None:
+        """Load predictor from the repository risk artifact."""
+        self.predictor = LiquidationPredictor()
+
+    def test_predict_batch_matches_scalar_predict(self) -> None:
+        """Batch results should equal per-position scalar predictions."""
+        collateral = np.array([0.0, 0.5, 1.0, 3.0])
+        debt = np.array([0.0, 500.0, 300.0, 100.0])
+        price = np.array([300.0, 300.0, 250.0, 600.0])
+        volatility = np.array([0.3, 0.8, 2.0, 0.1])
+
+        batch = self.predictor.predict_batch(collateral, debt, price, volatility)
+
+        self.assertEqual(len(batch), 4)
+        for idx, result in enumerate(batch):
+            scalar = self.predictor.predict(
+                collateral_bnb=float(collateral[idx]),
+                debt_fiat=float(debt[idx]),
+                current_price=float(price[idx]),
+                volatility=float(volatility[idx]),
+            )
+            self.assertEqual(result, scalar)
+
+    def test_liquidation_probability_weights_tier_probabilities(self) -> None:
+        """Class probabilities should blend tier base probabilities."""
+        value = LiquidationPredictor._to_liquidation_probability(
+            risk_tier="LOW",
+            probabilities={"LOW": 0.2, "MEDIUM": 0.3, "HIGH": 0.5},
+        )
+        self.assertAlmostEqual(value, 0.496, places=6)
+
+    def test_invalidate_cache_reaches_existing_predictor(self) -> None:
+        """An existing predictor should pick up a fresh inference service after invalidation."""
+        before = self.predictor._current_inference()
+        LiquidationPredictor.invalidate_cache()
+        after = self.predictor._current_inference()
+        self.assertIsNot(before, after)
+        self.assertTrue(after.is_loaded)
+
+
+class _RecordingPredictor:
+    """Predictor stand-in that records each batch it scores."""
+
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.batches: List[list] = []
+        self._error = error
+
+    def _build_features(self, collateral_bnb, debt_fiat, current_price, volatility):
+        return collateral_bnb
+
+    def predict_features(self, features):
+        self.batches.append(list(features))
+        if self._error is not None:
+            raise self._error
+        return [
+            LiquidationPredictionResult(liquidation_probability=value, risk_tier="LOW", model_version="test")
+            for value in features
+        ]
+
+
+class LiquidationBatchPredictorTests(unittest.TestCase):
+    """Validate micro-batching, error propagation, and event-loop changes."""
+
+    @staticmethod
+    async def _submit_all(batcher: LiquidationBatchPredictor, values: List[float]) -> list:
+        """Submit values concurrently and stop the worker afterwards."""
+        try:
+            return await asyncio.gather(
+                *(batcher.submit(value, 1.0, 1.0, 0.1) for value in values),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.close()
+
+    def test_concurrent_submits_share_one_batch(self) -> None:
+        """Concurrent submissions should be scored with one model call."""
+        predictor = _RecordingPredictor()
+        batcher = LiquidationBatchPredictor(predictor, max_batch_size=8, max_wait_ms=50)
+        results = asyncio.run(self._submit_all(batcher, [0.1, 0.2, 0.3]))
+        self.assertEqual(predictor.batches, [[0.1, 0.2, 0.3]])
+        self.assertEqual([result.liquidation_probability for result in results], [0.1, 0.2, 0.3])
+
+    def test_batch_failure_reaches_every_caller(self) -> None:
+        """A failed model call should fail every submission in the batch."""
+        error = RuntimeError("model failed")
+        batcher = LiquidationBatchPredictor(_RecordingPredictor(error=error), max_batch_size=8, max_wait_ms=50)
+        results = asyncio.run(self._submit_all(batcher, [0.1, 0.2]))
+        self.assertEqual(results, [error, error])
+
+    def test_new_event_loop_gets_a_fresh_worker(self) -> None:
+        """Submissions on a later event loop should not reuse the closed loop's worker."""
+        predictor = _RecordingPredictor()
+        batcher = LiquidationBatchPredictor(predictor, max_batch_size=8, max_wait_ms=1)
+
+        async def _submit_one(value: float) -> LiquidationPredictionResult:
+            return await batcher.submit(value, 1.0, 1.0, 0.1)
+
+        # Close the first loop without cancelling its tasks, as a torn-down test client or server does.
+        first_loop = asyncio.new_event_loop()
+        try:
+            first = first_loop.run_until_complete(_submit_one(0.4))
+        finally:
+            first_loop.close()
+        second_loop = asyncio.new_event_loop()
+        try:
+            second = second_loop.run_until_complete(_submit_one(0.6))
+            second_loop.run_until_complete(batcher.close())
+        finally:
+            second_loop.close()
+        self.assertEqual([first.liquidation_probability, second.liquidation_probability], [0.4, 0.6])
+        self.assertEqual(predictor.batches, [[0.4], [0.6]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,17 @@ class ModelValidationTests(unittest.TestCase):
         self.assertEqual(user.notification_channels, ["email", "whatsapp"])
         self.assertEqual(user.wallet_address[0].name, "Primary")
 
+    def test_user_currency_must_be_alphabetic(self) -> None:
+        """Reject currency codes that are not three ASCII letters."""
+        with self.assertRaises(ValidationError):
+            UserModel(
+                user_id="usr_1",
+                email="test@example.com",
+                phone="9999999999",
+                full_name="Test User",
+                currency_code="IN1",
+            )
+
     def test_loan_threshold_validation(self) -> None:
         """Reject invalid threshold relationships."""
         with self.assertRaises(ValidationError):
@@ -0,0 +1,77 @@
+"""Unit tests for the risk tier training pipeline."""
+
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = PROJECT_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from ml.inference import RiskModelInferenceService
+from ml.schema import RiskFeatureInput
+from ml.trainer import FEATURE_COLUMNS, train_and_save_model
+
+
+def _binary_dataset(rows: int = 200) -> pd.DataFrame:
+    """Build a two-tier dataset separable on ``safety_ratio``."""
+    rng = np.random.default_rng(7)
+    safety_ratio = rng.uniform(0.5, 3.0, rows)
+    dataframe = pd.DataFrame(
+        {
+            "safety_ratio": safety_ratio,
+            "missed_payment_count": rng.integers(0, 3, rows),
+            "on_time_ratio": rng.uniform(0.5, 1.0, rows),
+            "avg_delay_hours": rng.uniform(0.0, 24.0, rows),
+            "topup_count_last_30d": rng.integers(0, 3, rows),
+            "plan_amount": rng.uniform(1000.0, 5000.0, rows),
+            "tenure_days": rng.integers(30, 180, rows),
+            "installment_amount": rng.uniform(250.0, 1250.0, rows),
+        }
+    )
+    dataframe["risk_tier"] = np.where(safety_ratio < 1.5, "HIGH", "LOW")
+    return dataframe[FEATURE_COLUMNS + ["risk_tier"]]
+
+
+class RiskTrainerTests(unittest.TestCase):
+    """Validate artifacts produced by the risk trainer."""
+
+    def test_binary_dataset_scores_like_a_sigmoid(self) -> None:
+        """Two-tier training should yield calibrated probabilities for both classes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = Path(tmp_dir) / "risk_model.joblib"
+            train_and_save_model(_binary_dataset(), str(model_path))
+            inference = RiskModelInferenceService(model_path=str(model_path))
+            base = {
+                "missed_payment_count": 1,
+                "on_time_ratio": 0.8,
+                "avg_delay_hours": 6.0,
+                "topup_count_last_30d": 1,
+                "plan_amount": 3000.0,
+                "tenure_days": 90,
+                "installment_amount": 750.0,
+            }
+            results = inference.predict_batch(
+                [
+                    RiskFeatureInput(safety_ratio=0.6, **base),
+                    RiskFeatureInput(safety_ratio=2.9, **base),
+                ]
+            )
+
+        self.assertEqual([result["risk_tier"] for result in results], ["HIGH", "LOW"])
+        for result in results:
+            probabilities = result["probabilities"]
+            self.assertEqual(set(probabilities), {"HIGH", "LOW"})
+            self.assertAlmostEqual(sum(probabilities.values()), 1.0, places=5)
+            self.assertLess(max(probabilities.values()), 1.0)
+            self.assertEqual(len(result["top_reasons"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()